@@ -1,28 +1,132 @@
 # :coding: utf-8
 
+import atexit
 import collections
+import functools
+import os
+import platform
 
+import nuke
 from PySide2 import QtWidgets, QtCore
 
+import arcade_nuke.base
 import arcade_nuke.dialog
 import arcade_nuke.breakout
+import arcade_nuke.invaders
+import arcade_nuke.scheduler
+import arcade_nuke.scores
+import arcade_nuke.telemetry
+
+#: Environment variable pointing to the JSON Lines file recording telemetry.
+TELEMETRY_ENV = "ARCADE_NUKE_TELEMETRY"
+
+#: Sink shared by all games when telemetry is enabled.
+_telemetry = None
+
+#: Store shared by all games recording the result of each session.
+_store = None
+
+
+def telemetry_sink():
+    """Return telemetry sink if enabled via the environment.
+
+    Telemetry is opt-in and only recorded when the
+    :data:`TELEMETRY_ENV` environment variable is set.
+
+    :return: Instance of :class:`arcade_nuke.telemetry.TelemetrySink` or
+        None.
+
+    """
+    global _telemetry
+
+    path = os.environ.get(TELEMETRY_ENV)
+    if not path:
+        return None
+
+    if _telemetry is None or _telemetry.path != path:
+        if _telemetry is not None:
+            _telemetry.close()
+
+        _telemetry = arcade_nuke.telemetry.TelemetrySink(
+            path, context={
+                "nuke_version": getattr(nuke, "NUKE_VERSION_STRING", None),
+                "machine": platform.node(),
+                "platform": platform.platform(),
+            }
+        )
+
+        # Write remaining records when Nuke exits.
+        atexit.register(_telemetry.close)
+
+    return _telemetry
+
+
+def score_store():
+    """Return store recording the result of each session.
+
+    :return: Instance of :class:`arcade_nuke.scores.ScoreStore`.
+
+    """
+    global _store
+
+    if _store is None:
+        _store = arcade_nuke.scores.ScoreStore(
+            context={
+                "nuke_version": getattr(nuke, "NUKE_VERSION_STRING", None),
+                "machine": platform.node(),
+            }
+        )
+
+        # Insert remaining records when Nuke exits.
+        atexit.register(_store.close)
+
+    return _store
 
 
 def open_dialog():
     """Open dialog to start playing."""
     parent = QtWidgets.QApplication.activeWindow()
+    sink = telemetry_sink()
+    store = score_store()
+
+    # Games and the dialog share a single timer.
+    scheduler = arcade_nuke.scheduler.TickScheduler()
 
+    services = arcade_nuke.base.GameServices(
+        telemetry=sink, store=store, scheduler=scheduler
+    )
+
+    # Games share the nodes of the field, which only the dialog deletes.
+    arena = arcade_nuke.breakout.FieldArena()
+
+    # Games are only created when selected in the dialog.
     mapping = collections.OrderedDict([
-        ("Breakout 1", arcade_nuke.breakout.BreakoutGame(
-            generator=arcade_nuke.breakout.brick_generator1
+        ("Breakout 1", functools.partial(
+            arcade_nuke.breakout.BreakoutGame,
+            generator=arcade_nuke.breakout.brick_generator1,
+            services=services,
+            arena=arena
+        )),
+        ("Breakout 2", functools.partial(
+            arcade_nuke.breakout.BreakoutGame,
+            generator=arcade_nuke.breakout.brick_generator2,
+            services=services,
+            arena=arena
         )),
-        ("Breakout 2", arcade_nuke.breakout.BreakoutGame(
-            generator=arcade_nuke.breakout.brick_generator2
+        ("Breakout 3", functools.partial(
+            arcade_nuke.breakout.BreakoutGame,
+            generator=arcade_nuke.breakout.brick_generator3,
+            services=services,
+            arena=arena
         )),
-        ("Breakout 3", arcade_nuke.breakout.BreakoutGame(
-            generator=arcade_nuke.breakout.brick_generator3
+        ("Invaders", functools.partial(
+            arcade_nuke.invaders.InvadersGame,
+            services=services,
+            arena=arena
         ))
     ])
 
-    _dialog = arcade_nuke.dialog.Player(games=mapping, parent=parent)
+    _dialog = arcade_nuke.dialog.Player(
+        games=mapping, parent=parent, scheduler=scheduler, arena=arena
+    )
     _dialog.show()
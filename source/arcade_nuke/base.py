@@ -1,9 +1,21 @@
 # :coding: utf-8
 
 import abc
+import collections
+import functools
+import time
+import timeit
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 from PySide2 import QtCore
 
+import arcade_nuke.utility
+from arcade_nuke.logic import Vector
+
 
 class GameOver(Exception):
     """Exception to raise when the game is over."""
@@ -18,6 +30,65 @@ class GameSignal(QtCore.QObject):
 
     stopped = QtCore.Signal()
 
+    #: Emitted with a reason when the game pauses itself.
+    interrupted = QtCore.Signal(str)
+
+
+class GameServices(object):
+    """Optional services shared by games.
+
+    Each service is None when disabled.
+
+    """
+
+    def __init__(
+        self, telemetry=None, store=None, scheduler=None, coalescer=None
+    ):
+        """Initialize the services.
+
+        :param telemetry: Instance of
+            :class:`arcade_nuke.telemetry.TelemetrySink` recording per-tick
+            records and one summary per session. Default is None.
+
+        :param store: Instance of :class:`arcade_nuke.scores.ScoreStore`
+            recording the result of each session. Default is None.
+
+        :param scheduler: Instance of
+            :class:`arcade_nuke.scheduler.TickScheduler` driving games with
+            other consumers from a single timer. Default is None, which
+            drives each game with its own timer.
+
+        :param coalescer: Instance of
+            :class:`arcade_nuke.utility.RepaintCoalescer` holding updates of
+            the Node Graph during each tick, so that it is repainted once
+            per tick instead of after each node operation. Default is None.
+
+        """
+        self._telemetry = telemetry
+        self._store = store
+        self._scheduler = scheduler
+        self._coalescer = coalescer
+
+    @property
+    def telemetry(self):
+        """Return telemetry sink or None."""
+        return self._telemetry
+
+    @property
+    def store(self):
+        """Return score store or None."""
+        return self._store
+
+    @property
+    def scheduler(self):
+        """Return tick scheduler or None."""
+        return self._scheduler
+
+    @property
+    def coalescer(self):
+        """Return repaint coalescer or None."""
+        return self._coalescer
+
 
 class BaseGame(object):
     """Base class for all games.
@@ -25,11 +96,114 @@ class BaseGame(object):
 
     __metaclass__ = abc.ABCMeta
 
-    def __init__(self):
-        """Initialize the game."""
-        self._timer = QtCore.QTimer()
-        self._timer.setInterval(0)
-        self._timer.timeout.connect(self._process)
+    #: Offset of nodes created ahead of time to park them out of view.
+    parking_offset = (0, 20000)
+
+    def __init__(
+        self, simulation_rate=120, render_rate=60, threaded=False,
+        frames_ahead=4, frame_budget=None, tolerance=5.0, name=None,
+        priority=0, services=None
+    ):
+        """Initialize the game.
+
+        :param simulation_rate: Number of simulation steps per second.
+            Default is 120.
+
+        :param render_rate: Number of times per second the nodes are updated
+            in Nuke. Default is 60.
+
+        :param threaded: Indicate whether the simulation should run in a
+            worker thread, leaving only Nuke API calls to the main thread.
+            Default is False.
+
+        :param frames_ahead: Maximum number of simulated frames the worker
+            thread can get ahead of the main thread. Default is 4.
+
+        :param frame_budget: Maximum duration of a tick in seconds. The
+            simulation step and the render interval are scaled up when ticks
+            exceed this budget. Default is None, which uses the render
+            interval.
+
+        :param tolerance: Number of seconds the budget can be exceeded once
+            the game cannot be scaled further before it pauses itself.
+            Default is 5.0.
+
+        :param name: Name of the game in the statistics of the scheduler.
+            Default is None, which uses the name of the class.
+
+        :param priority: Priority of the game within the scheduler. Default
+            is 0.
+
+        :param services: Instance of :class:`GameServices` such as the
+            telemetry sink or the tick scheduler. Default is None, which
+            disables all services.
+
+        """
+        self._services = services or GameServices()
+
+        self._simulation_step = 1.0 / simulation_rate
+        self._render_step = 1.0 / render_rate
+
+        # Limit the number of simulation steps per tick to prevent the game
+        # from falling behind indefinitely when ticks are too long.
+        self._maximum_steps = max(
+            1, int(4 * self._render_step / self._simulation_step)
+        )
+
+        # The timer is triggered at the render rate and simulation steps
+        # are accumulated in between.
+        if self._services.scheduler is not None:
+            self._timer = self._services.scheduler.create_timer(
+                name or type(self).__name__, priority=priority
+            )
+        else:
+            self._timer = QtCore.QTimer()
+
+        self._timer.setInterval(int(1000 * self._render_step))
+
+        # Record callback connected to the timer, which is swapped when the
+        # ticks are profiled.
+        self._callback = self._process
+        self._timer.timeout.connect(self._callback)
+
+        # Record time not yet consumed by the simulation.
+        self._accumulator = 0.0
+        self._last_time = None
+
+        # Record latest input snapshot captured from the main thread.
+        self._input = None
+
+        # Record worker running the simulation when threaded.
+        self._threaded = threaded
+        self._frames_ahead = frames_ahead
+        self._frames = queue.Queue()
+        self._frame_slots = queue.Queue(maxsize=frames_ahead)
+        self._worker = None
+
+        # Record counters of the current tick, such as the number of Nuke
+        # API calls, and statistics of the current session accumulated
+        # across pauses.
+        self._telemetry = self._services.telemetry
+        self._store = self._services.store
+        self._counters = collections.Counter()
+        self._run_start = None
+        self._run_duration = 0.0
+        self._run_ticks = 0
+        self._run_time = 0.0
+        self._run_maximum = 0.0
+
+        # Record whether the current session was "won" or "lost" once over.
+        self._outcome = None
+
+        # Record start, duration and number of writes of the latest ticks,
+        # sampled at a low rate by monitors.
+        self._recent_ticks = collections.deque(maxlen=120)
+
+        # Adapt the game loop to the cost of each tick.
+        self._controller = TickController(
+            budget=frame_budget or self._render_step, tolerance=tolerance
+        )
+        self._last_tick = None
 
         # Collection of signals.
         self._signal = GameSignal()
@@ -51,27 +225,646 @@ class BaseGame(object):
         """Indicate whether the game is running."""
         return self._running
 
+    def settings(self):
+        """Return mapping of settings describing the game."""
+        settings = {
+            "game": type(self).__name__,
+            "simulation_rate": int(round(1.0 / self._simulation_step)),
+            "render_rate": int(round(1.0 / self._render_step)),
+            "threaded": self._threaded,
+            "frame_budget": self._controller.budget,
+        }
+        settings.update(self._session_telemetry())
+        return settings
+
+    @property
+    def services(self):
+        """Return optional services used by the game."""
+        return self._services
+
+    def performance(self):
+        """Return performance of the latest ticks.
+
+        Ticks only record their duration and number of node writes, so that
+        sampling this method at a low rate costs almost nothing to the game.
+
+        :return: Mapping with the number of ticks per second, the median and
+            maximum durations in seconds, the mean number of Nuke API writes
+            per tick, the frame budget, the list of durations of the latest
+            ticks and the values recorded by the game for each tick.
+
+        """
+        ticks = list(self._recent_ticks)
+        durations = [duration for _, duration, _ in ticks]
+
+        result = {
+            "ticks_per_second": 0.0,
+            "median": 0.0,
+            "maximum": 0.0,
+            "writes": 0.0,
+            "budget": self._controller.budget,
+            "durations": durations,
+            "game": self._frame_telemetry() if self._initialized else {},
+        }
+
+        if len(ticks) > 0:
+            result["median"] = sorted(durations)[len(durations) // 2]
+            result["maximum"] = max(durations)
+            result["writes"] = (
+                sum(writes for _, _, writes in ticks) / float(len(ticks))
+            )
+
+        if len(ticks) > 1 and ticks[-1][0] > ticks[0][0]:
+            result["ticks_per_second"] = (
+                (len(ticks) - 1) / (ticks[-1][0] - ticks[0][0])
+            )
+
+        return result
+
+    def profile(self, profiler=None):
+        """Run each tick of the game within *profiler*.
+
+        The callback connected to the timer is swapped, so that ticks run
+        without any overhead when no profiler is set. Only the main thread
+        is profiled when the simulation runs in a worker thread.
+
+        :param profiler: Instance of :class:`cProfile.Profile`. Default is
+            None, which stops profiling the ticks.
+
+        """
+        self._timer.timeout.disconnect(self._callback)
+
+        if profiler is None:
+            self._callback = self._process
+        else:
+            self._callback = functools.partial(
+                profiler.runcall, self._process
+            )
+
+        self._timer.timeout.connect(self._callback)
+
     def start(self):
-        """Start the game."""
-        if not self._initialized:
+        """Start the game.
+
+        Undo is disabled in Nuke until the game is stopped.
+
+        """
+        if not self._initialized or self._running:
             return
 
+        arcade_nuke.utility.undo_suppressor.acquire()
+
+        self._run_start = timeit.default_timer()
+        self._recent_ticks.clear()
+
+        self._accumulator = 0.0
+        self._last_time = timeit.default_timer()
+        self._last_tick = self._last_time
+        self._input = self._capture_input()
+
+        self._controller.reset()
+        self._timer.setInterval(int(1000 * self._render_step))
+
+        if self._threaded:
+            self._frames = queue.Queue()
+            self._frame_slots = queue.Queue(maxsize=self._frames_ahead)
+
+            self._worker = SimulationWorker(self)
+            self._worker.start()
+
         self._timer.start()
         self._running = True
 
     def stop(self):
-        """Stop the game."""
-        if not self._initialized:
+        """Stop the game and restore the undo state of the user."""
+        if not self._initialized or not self._running:
             return
 
         self._timer.stop()
         self._running = False
 
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+            # Apply frames simulated before the worker stopped. The game
+            # over will be raised again by the worker when resuming.
+            try:
+                self._process_frames()
+            except GameOver:
+                pass
+
+        arcade_nuke.utility.undo_suppressor.release()
+
+        self._run_duration += timeit.default_timer() - self._run_start
+
+        # Pauses only accumulate statistics of the session, which is
+        # recorded once the game is over.
+        if self._outcome is not None:
+            self._record_session()
+
     @abc.abstractmethod
     def initialize(self):
-        """Initialize the game."""
+        """Initialize the game.
+
+        The session interrupted by initializing the game again is recorded.
+
+        """
+        self._record_session()
         self._initialized = True
 
-    @abc.abstractmethod
+    def release(self):
+        """Stop the game and release its timer.
+
+        The game cannot be started again once released.
+
+        """
+        self.stop()
+        self._record_session()
+        self._initialized = False
+
+        self._timer.stop()
+        self._timer.timeout.disconnect(self._callback)
+        self._timer.deleteLater()
+
+    def nodes(self):
+        """Return all nodes managed by the game."""
+        return []
+
+    def prepare(self):
+        """Create nodes of the game ahead of its initialization.
+
+        Nodes are created one by one, disabled and parked out of view, so
+        that the creation can be spread over idle time. The next call to
+        :meth:`initialize` reveals them.
+
+        :return: Iterator creating one node at each step and yielding whether
+            it was created.
+
+        """
+        offset = Vector(*self.parking_offset)
+
+        for node in self.nodes():
+            if self._initialized:
+                return
+
+            yield node.prepare(offset)
+
+    def step(self, value=None, render=True):
+        """Run one simulation step of the game outside of its timer.
+
+        This lets benchmarks and soak runs drive the game deterministically.
+        The last step is rendered before :exc:`GameOver` is raised.
+
+        :param value: Snapshot of the user input for the simulation. Default
+            is None, which captures the current input.
+
+        :param render: Indicate whether the nodes should be updated after
+            the step. Default is True.
+
+        :raise: :exc:`GameOver` when the game is over.
+
+        """
+        self._input = value if value is not None else self._capture_input()
+
+        try:
+            self._simulate(self._simulation_step)
+
+        except GameOver:
+            if render:
+                self._render(1.0)
+            raise
+
+        if render:
+            self._render(1.0)
+
     def _process(self):
-        """Method called for each move of the game."""
+        """Method called for each tick of the timer.
+
+        The game is stopped if an unexpected error is raised.
+
+        """
+        start = timeit.default_timer()
+        self._counters.clear()
+
+        try:
+            if self._services.coalescer is not None:
+                with self._services.coalescer:
+                    self._tick()
+            else:
+                self._tick()
+
+        except GameOver as error:
+            self._outcome = "won" if error.success else "lost"
+            raise
+
+        except Exception:
+            # Stop the game to restore the undo state of the user.
+            self.stop()
+            raise
+
+        finally:
+            self._record_tick(start, timeit.default_timer() - start)
+
+        self._adapt(timeit.default_timer() - start, start - self._last_tick)
+        self._last_tick = start
+
+    def _adapt(self, duration, elapsed):
+        """Adapt the game loop to the cost of the last tick.
+
+        The game is stopped if the frame budget was exceeded for too long.
+
+        :param duration: Duration of the tick in seconds.
+
+        :param elapsed: Duration since the previous tick in seconds.
+
+        """
+        render_scale = self._controller.render_scale
+
+        if self._controller.update(duration, elapsed):
+            self.stop()
+            self.signal.interrupted.emit(
+                "Game paused: ticks took {:.0f} ms for more than {:.0f} s, "
+                "over the budget of {:.0f} ms".format(
+                    self._controller.average * 1000,
+                    self._controller.tolerance,
+                    self._controller.budget * 1000
+                )
+            )
+            return
+
+        if self._controller.render_scale != render_scale:
+            self._timer.setInterval(
+                int(1000 * self._render_step * self._controller.render_scale)
+            )
+
+    def _record_tick(self, start, duration):
+        """Record statistics of a tick.
+
+        :param start: Time when the tick started in seconds.
+
+        :param duration: Duration of the tick in seconds.
+
+        """
+        self._recent_ticks.append((start, duration, self._counters["writes"]))
+
+        self._run_ticks += 1
+        self._run_time += duration
+        self._run_maximum = max(self._run_maximum, duration)
+
+        if self._telemetry is not None:
+            record = {"type": "frame", "tick": duration}
+            record.update(self._counters)
+            record.update(self._frame_telemetry())
+            self._telemetry.record(record)
+
+    def _record_session(self):
+        """Record summary of the current session and reset its statistics.
+
+        Nothing is recorded if no ticks were processed since the previous
+        summary.
+
+        """
+        if self._run_ticks > 0 and (
+            self._telemetry is not None or self._store is not None
+        ):
+            duration = self._run_duration
+            if self._running:
+                duration += timeit.default_timer() - self._run_start
+
+            record = {
+                "type": "session",
+                "game": type(self).__name__,
+                "outcome": self._outcome,
+                "duration": duration,
+                "ticks": self._run_ticks,
+                "tick_mean": self._run_time / self._run_ticks,
+                "tick_max": self._run_maximum,
+            }
+            record.update(self._session_telemetry())
+
+            if self._telemetry is not None:
+                self._telemetry.record_summary(record)
+
+            if self._store is not None:
+                self._store.record(record)
+
+        self._run_start = timeit.default_timer()
+        self._run_duration = 0.0
+        self._run_ticks = 0
+        self._run_time = 0.0
+        self._run_maximum = 0.0
+        self._outcome = None
+
+    def _tick(self):
+        """Run simulation steps and render for one tick of the timer.
+
+        Run as many simulation steps as necessary to catch up with the
+        elapsed time, then render the state interpolated between the last two
+        simulation steps.
+
+        """
+        self._input = self._capture_input()
+
+        if self._threaded:
+            self._process_frames()
+            return
+
+        now = timeit.default_timer()
+        self._accumulator += now - self._last_time
+        self._last_time = now
+
+        # Simulation step is scaled up when ticks exceed the budget.
+        step = self._simulation_step * self._controller.step_scale
+        maximum_steps = self._maximum_steps * self._controller.render_scale
+        steps = 0
+
+        while self._accumulator >= step:
+            if steps >= maximum_steps:
+                self._accumulator = 0.0
+                break
+
+            self._simulate(step)
+            self._accumulator -= step
+            steps += 1
+
+        self._counters["steps"] += steps
+
+        self._render(self._accumulator / step)
+
+    def _process_frames(self):
+        """Apply all frames posted by the worker thread."""
+        frames = []
+        error = None
+
+        while True:
+            try:
+                frame, error = self._frames.get_nowait()
+            except queue.Empty:
+                break
+
+            # Release slot to let the worker post another frame.
+            try:
+                self._frame_slots.get_nowait()
+            except queue.Empty:
+                pass
+
+            frames.append(frame)
+            if error is not None:
+                break
+
+        if len(frames) > 0:
+            self._apply_frames(frames)
+
+        if error is not None:
+            raise error
+
+    def _frame_telemetry(self):
+        """Return mapping of game values to record for each tick."""
+        return {}
+
+    def _session_telemetry(self):
+        """Return mapping of game values to record for each session."""
+        return {}
+
+    def _capture_input(self):
+        """Return snapshot of the user input for the simulation.
+
+        This method is always called from the main thread.
+
+        """
+
+    def _capture_frame(self):
+        """Return delta of the latest simulation step.
+
+        This method is called from the worker thread after each simulation
+        step and must not use the Nuke API.
+
+        """
+
+    def _apply_frames(self, frames):
+        """Apply frame deltas posted by the worker thread to Nuke.
+
+        This method is always called from the main thread.
+
+        :param frames: List of frames as returned by :meth:`_capture_frame`,
+            from the oldest to the latest.
+
+        """
+
+    @abc.abstractmethod
+    def _simulate(self, delta):
+        """Method called for each simulation step of the game.
+
+        :param delta: Duration of the simulation step in seconds.
+
+        """
+
+    @abc.abstractmethod
+    def _render(self, alpha):
+        """Method called to update the nodes in Nuke.
+
+        :param alpha: Interpolation factor between the previous and the
+            current simulation steps.
+
+        """
+
+
+class TickController(object):
+    """Adapt the game loop to keep ticks within a frame budget.
+
+    When the average duration of ticks exceeds the budget, the render
+    interval is scaled up first to reduce Nuke writes, then the simulation
+    step to reduce the number of steps per tick. Scales are reduced again
+    when ticks get well under the budget.
+
+    """
+
+    def __init__(
+        self, budget, tolerance=5.0, maximum_scale=4, smoothing=0.1,
+        cooldown=10
+    ):
+        """Initialize the controller.
+
+        :param budget: Maximum duration of a tick in seconds.
+
+        :param tolerance: Number of seconds the budget can be exceeded once
+            scales are at their maximum before the game should pause.
+            Default is 5.0.
+
+        :param maximum_scale: Maximum factor applied to the render interval
+            and the simulation step. Default is 4.
+
+        :param smoothing: Weight of the latest tick in the average duration.
+            Default is 0.1.
+
+        :param cooldown: Minimum number of ticks between two scale changes.
+            Default is 10.
+
+        """
+        self._budget = budget
+        self._tolerance = tolerance
+        self._maximum_scale = maximum_scale
+        self._smoothing = smoothing
+        self._cooldown = cooldown
+        self.reset()
+
+    @property
+    def budget(self):
+        """Return maximum duration of a tick in seconds."""
+        return self._budget
+
+    @property
+    def tolerance(self):
+        """Return number of seconds the budget can be exceeded."""
+        return self._tolerance
+
+    @property
+    def average(self):
+        """Return average duration of ticks in seconds or None."""
+        return self._average
+
+    @property
+    def render_scale(self):
+        """Return factor applied to the render interval."""
+        return self._render_scale
+
+    @property
+    def step_scale(self):
+        """Return factor applied to the simulation step."""
+        return self._step_scale
+
+    def reset(self):
+        """Reset scales and statistics."""
+        self._average = None
+        self._render_scale = 1
+        self._step_scale = 1
+        self._overrun = 0.0
+        self._ticks = 0
+
+    def update(self, duration, elapsed):
+        """Record duration of a tick and adapt scales.
+
+        :param duration: Duration of the tick in seconds.
+
+        :param elapsed: Duration since the previous tick in seconds.
+
+        :return: Boolean value indicating whether the budget was exceeded
+            for longer than the tolerance.
+
+        """
+        if self._average is None:
+            self._average = duration
+        else:
+            self._average += (duration - self._average) * self._smoothing
+
+        self._ticks += 1
+
+        if self._average > self._budget:
+            if self._ticks >= self._cooldown:
+                if self._render_scale < self._maximum_scale:
+                    self._render_scale += 1
+                    self._ticks = 0
+                    return False
+
+                elif self._step_scale < self._maximum_scale:
+                    self._step_scale += 1
+                    self._ticks = 0
+                    return False
+
+            if (
+                self._render_scale == self._maximum_scale and
+                self._step_scale == self._maximum_scale
+            ):
+                self._overrun += elapsed
+
+            return self._overrun > self._tolerance
+
+        self._overrun = 0.0
+
+        if self._average < self._budget / 2 and self._ticks >= self._cooldown:
+            if self._step_scale > 1:
+                self._step_scale -= 1
+                self._ticks = 0
+
+            elif self._render_scale > 1:
+                self._render_scale -= 1
+                self._ticks = 0
+
+        return False
+
+
+class SimulationWorker(QtCore.QThread):
+    """Thread running the simulation of a game.
+
+    Each simulation step posts a frame delta to the main thread. The worker
+    blocks when the main thread has not yet applied the maximum number of
+    frames it can get ahead.
+
+    """
+
+    def __init__(self, game):
+        """Initialize the worker.
+
+        :param game: Instance of :class:`BaseGame`.
+
+        """
+        super(SimulationWorker, self).__init__()
+        self._game = game
+        self._stopped = False
+
+    def stop(self):
+        """Stop the worker and wait for it to finish."""
+        self._stopped = True
+        self.wait()
+
+    def run(self):
+        """Run the simulation until stopped or until the game is over."""
+        step = self._game._simulation_step
+        maximum_delay = step * self._game._maximum_steps
+        next_time = timeit.default_timer()
+
+        while not self._stopped:
+            error = None
+
+            # Errors are raised again from the main thread when the frame
+            # is applied.
+            try:
+                self._game._simulate(step)
+            except Exception as _error:
+                error = _error
+
+            self._post(self._game._capture_frame(), error)
+            if error is not None:
+                return
+
+            next_time += step
+            now = timeit.default_timer()
+
+            # Drop accumulated delay when the main thread held the worker.
+            if now - next_time > maximum_delay:
+                next_time = now
+
+            time.sleep(max(0.0, next_time - now))
+
+    def _post(self, frame, error):
+        """Post *frame* to the main thread.
+
+        Block until a slot is available unless the worker is stopped, in
+        which case the frame is posted anyway so that it can be applied.
+
+        :param frame: Frame delta as returned by
+            :meth:`BaseGame._capture_frame`.
+
+        :param error: Instance of :exc:`GameOver`, error raised by the
+            simulation or None.
+
+        """
+        while not self._stopped:
+            try:
+                self._game._frame_slots.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+        self._game._frames.put((frame, error))
@@ -0,0 +1,316 @@
+# :coding: utf-8
+
+import collections
+import gc
+import timeit
+
+import nuke
+from PySide2 import QtWidgets
+
+import arcade_nuke.base
+import arcade_nuke.breakout
+import arcade_nuke.utility
+
+
+#: Brick generators of the built-in levels.
+LEVELS = collections.OrderedDict([
+    ("Breakout 1", arcade_nuke.breakout.brick_generator1),
+    ("Breakout 2", arcade_nuke.breakout.brick_generator2),
+    ("Breakout 3", arcade_nuke.breakout.brick_generator3),
+])
+
+
+def play(game, steps, x=None):
+    """Run *steps* simulation steps of *game* and render them in Nuke.
+
+    The game must be initialized. Simulation stops early when the game is
+    over.
+
+    :param game: Instance of :class:`arcade_nuke.breakout.BreakoutGame`.
+
+    :param steps: Number of simulation steps to run.
+
+    :param x: Position of the cursor on the X axis. Default is None, which
+        lets the autopilot of the game drive the paddle if enabled, or keeps
+        the paddle in the middle of the field otherwise.
+
+    :return: Number of simulation steps played.
+
+    """
+    if x is None and game.autopilot is None:
+        x = game.field.center_x
+
+    # Nodes are updated without undo history, as in the game loop.
+    with arcade_nuke.utility.undo_suppressor:
+        for index in range(steps):
+            try:
+                game.step(x)
+
+            except arcade_nuke.base.GameOver:
+                return index + 1
+
+    return steps
+
+
+def compare_reset(levels=None, steps=1200, repeat=5):
+    """Compare durations of initialization paths after a partial game.
+
+    Each level is initialized with the per-node path updating all nodes,
+    the per-node path only updating nodes which changed and the snapshot
+    path restoring all nodes in one operation.
+
+    This function must be run within Nuke.
+
+    :param levels: Mapping of level names with brick generators. Default is
+        :data:`LEVELS`.
+
+    :param steps: Number of simulation steps played before each
+        initialization. Default is 1200.
+
+    :param repeat: Number of initializations timed for each path. Default
+        is 5.
+
+    :return: Mapping of level names with mappings of path names with the
+        best duration in seconds.
+
+    """
+    results = collections.OrderedDict()
+
+    for name, generator in (levels or LEVELS).items():
+        results[name] = collections.OrderedDict()
+
+        for path, options in [
+            ("full", {"force": True}),
+            ("diff", {}),
+            ("snapshot", {}),
+        ]:
+            game = arcade_nuke.breakout.BreakoutGame(
+                generator=generator, snapshot=path == "snapshot"
+            )
+            game.initialize()
+
+            durations = []
+
+            for _ in range(repeat):
+                play(game, steps)
+
+                start = timeit.default_timer()
+                game.initialize(**options)
+                durations.append(timeit.default_timer() - start)
+
+            game.release()
+            results[name][path] = min(durations)
+
+    return results
+
+
+def compare_scaling(
+    counts=(100, 1000, 10000), steps=1200, density=0.5, seed=0
+):
+    """Measure costs of procedural levels with increasing brick counts.
+
+    Each level is created, played with the autopilot and initialized again.
+
+    This function must be run within Nuke.
+
+    :param counts: Numbers of bricks of each level. Default is (100, 1000,
+        10000).
+
+    :param steps: Number of simulation steps played before the level is
+        initialized again. Default is 1200.
+
+    :param density: Ratio of grid cells filled with bricks. Default is 0.5.
+
+    :param seed: Value used to seed the patterns. Default is 0.
+
+    :return: Mapping of brick counts with mappings of costs in seconds for
+        creating all nodes, simulating and rendering one frame, and
+        initializing the level again.
+
+    """
+    results = collections.OrderedDict()
+
+    for count in counts:
+        game = arcade_nuke.breakout.BreakoutGame(
+            generator=arcade_nuke.breakout.procedural_generator(
+                count, density=density, seed=seed
+            ),
+            autopilot=arcade_nuke.breakout.Autopilot()
+        )
+
+        # Garbage left by previous levels would be collected at random
+        # during the measurements, as with timeit.
+        gc.collect()
+        enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            start = timeit.default_timer()
+            game.initialize()
+            create = timeit.default_timer() - start
+
+            start = timeit.default_timer()
+            played = play(game, steps)
+            frame = (timeit.default_timer() - start) / played
+
+            start = timeit.default_timer()
+            game.initialize()
+            reset = timeit.default_timer() - start
+
+        finally:
+            if enabled:
+                gc.enable()
+
+        game.release()
+
+        results[count] = collections.OrderedDict([
+            ("create", create), ("frame", frame), ("reset", reset)
+        ])
+
+    return results
+
+
+def compare_repaints(
+    generator=None, script_nodes=(0, 1000, 5000), frames=300
+):
+    """Compare tick durations with and without coalesced repaints.
+
+    For each script size, extra nodes are created next to the field, then
+    the level is played with the autopilot with the Node Graph repainted
+    after each node operation, and with repaints held until the end of each
+    tick. Pending events are processed after each tick so that the cost of
+    repainting the Node Graph is included.
+
+    This function must be run within Nuke with the Node Graph visible.
+
+    :param generator: Brick generator of the level. Default is None, which
+        uses :func:`arcade_nuke.breakout.brick_generator1`.
+
+    :param script_nodes: Numbers of extra nodes in the script. Default is
+        (0, 1000, 5000).
+
+    :param frames: Number of ticks played for each measurement. Default is
+        300.
+
+    :return: Mapping of script sizes with mappings of paths with the mean
+        tick duration in seconds.
+
+    """
+    generator = generator or arcade_nuke.breakout.brick_generator1
+    results = collections.OrderedDict()
+
+    for count in script_nodes:
+        name = "{} nodes".format(count)
+        results[name] = collections.OrderedDict()
+
+        with arcade_nuke.utility.undo_suppressor:
+            extra_nodes = [
+                nuke.nodes.NoOp(
+                    xpos=(index % 100) * 100, ypos=-100 - (index // 100) * 50
+                )
+                for index in range(count)
+            ]
+
+        for path, coalesce in [("direct", False), ("coalesced", True)]:
+            game = arcade_nuke.breakout.BreakoutGame(
+                generator=generator,
+                autopilot=arcade_nuke.breakout.Autopilot(),
+                services=arcade_nuke.base.GameServices(
+                    coalescer=(
+                        arcade_nuke.utility.repaint_coalescer
+                        if coalesce else None
+                    )
+                )
+            )
+            game.initialize()
+
+            results[name][path] = _play_ticks(game, frames)
+            game.release()
+
+        with arcade_nuke.utility.undo_suppressor:
+            for node in extra_nodes:
+                nuke.delete(node)
+
+    return results
+
+
+def _play_ticks(game, frames):
+    """Return mean duration of *frames* ticks of *game* in seconds.
+
+    Each tick runs the simulation steps of one render interval, renders
+    them and processes pending events. Nodes are updated within the repaint
+    coalescer when the game coalesces repaints.
+
+    """
+    steps = max(1, int(round(game._render_step / game._simulation_step)))
+    coalescer = game.services.coalescer
+    start = timeit.default_timer()
+
+    for _ in range(frames):
+        if coalescer is not None:
+            coalescer.acquire()
+
+        try:
+            for index in range(steps):
+                game.step(render=index == steps - 1)
+
+        except arcade_nuke.base.GameOver:
+            game.initialize()
+
+        finally:
+            if coalescer is not None:
+                coalescer.release()
+
+        QtWidgets.QApplication.processEvents()
+
+    return (timeit.default_timer() - start) / frames
+
+
+def format_scaling(results, width=40):
+    """Return *results* of :func:`compare_scaling` as text with bar charts.
+
+    :param results: Mapping as returned by :func:`compare_scaling`.
+
+    :param width: Maximum number of characters of each bar. Default is 40.
+
+    """
+    lines = format_results(results).splitlines()
+
+    for name in ["frame", "reset"]:
+        maximum = max(costs[name] for costs in results.values()) or 1.0
+
+        lines.append("")
+        lines.append("{} cost against brick count".format(name))
+
+        for count, costs in results.items():
+            lines.append("{:>14} |{}".format(
+                count, "#" * max(1, int(round(width * costs[name] / maximum)))
+            ))
+
+    return "\n".join(lines)
+
+
+def format_results(results):
+    """Return *results* of :func:`compare_reset` formatted as text.
+
+    Results of :func:`compare_scaling` and :func:`compare_repaints` can also
+    be formatted.
+
+    """
+    paths = list(next(iter(results.values())).keys()) if results else []
+
+    lines = [
+        "{:<14}".format("level") + "".join(
+            "{:>12}".format(path) for path in paths
+        )
+    ]
+
+    for name, durations in results.items():
+        lines.append(
+            "{:<14}".format(name) + "".join(
+                "{:>10.2f}ms".format(durations[path] * 1000)
+                for path in paths
+            )
+        )
+
+    return "\n".join(lines)
@@ -1,343 +1,1729 @@
 # :coding: utf-8
 
+import array
+import bisect
+import collections
+import math
+import random
+import uuid
+
 import nuke
 from PySide2 import QtGui, QtWidgets, QtCore
 
 import arcade_nuke.base
+import arcade_nuke.checkpoint
 import arcade_nuke.node
 import arcade_nuke.logic
 import arcade_nuke.utility
 
 
-class BreakoutGame(arcade_nuke.base.BaseGame):
-    """Object managing all elements of the game.
-    """
+#: Delta of a simulation step posted from the worker thread.
+Frame = collections.namedtuple("Frame", ["ball", "paddle", "destroyed"])
+
+
+class BreakoutGame(arcade_nuke.base.BaseGame):
+    """Object managing all elements of the game.
+    """
+
+    def __init__(
+        self, generator, fixed_point=False, wall_segments=None,
+        snapshot=False, autopilot=None, offset=(0, 0), arena=None,
+        **kwargs
+    ):
+        """Initialize the game.
+
+        :param generator: Callback to draw the brick pattern.
+
+        :param fixed_point: Indicate whether the ball should be simulated
+            with sub-pixel integer units so that simulations are reproducible
+            across platforms. Default is False.
+
+        :param wall_segments: Number of stretched nodes drawing each wall of
+            the field, which is cheaper to create, reset and redraw than one
+            Dot node per unit. Default is None, which draws walls with Dot
+            nodes.
+
+        :param snapshot: Indicate whether the nodes of the level should be
+            serialized once created, so that the level is initialized again
+            by restoring all nodes in one operation. Default is False.
+
+        :param autopilot: Instance of :class:`Autopilot` driving the paddle
+            instead of the cursor, so that the game can run unattended.
+            Default is None.
+
+        :param offset: Position of the top-left corner of the field, so that
+            several games can be played side by side. Default is (0, 0).
+
+        :param arena: Instance of :class:`FieldArena` sharing the field and
+            its nodes with other games, so that only the bricks, the ball and
+            the paddle are swapped between levels. Default is None, which
+            creates a field owned by the game.
+
+        :raise: :exc:`ValueError` if snapshots are enabled with an arena.
+
+        :param kwargs: Keyword arguments passed to
+            :class:`arcade_nuke.base.BaseGame`, such as the simulation and
+            render rates.
+
+        """
+        if snapshot and arena is not None:
+            raise ValueError(
+                "Snapshots cannot restore a field shared with other games."
+            )
+
+        super(BreakoutGame, self).__init__(**kwargs)
+
+        self._arena = arena
+        self._fixed_point = fixed_point
+        self._wall_segments = wall_segments
+        self._autopilot = autopilot
+        self._offset = offset
+
+        # Record serialized nodes of the level.
+        self._use_snapshot = snapshot
+        self._snapshot = None
+        self._level = getattr(generator, "__name__", str(generator))
+
+        # Setup elements of game, with a field large enough for the pattern
+        # when the generator requires it.
+        self._field_size = getattr(generator, "field_size", (47, 30))
+        self._setup_field()
+
+        # Draw brick pattern.
+        bricks = generator(
+            x=self._field.left_edge,
+            y=self._field.top_edge
+        )
+
+        if not isinstance(bricks, BrickField):
+            bricks = BrickField.from_bricks(bricks)
+
+        self._bricks = bricks
+
+        # Record job drawing the feedback when the game is over.
+        self._drawing = None
+
+        # Record indices of bricks destroyed by the simulation which are not
+        # yet deleted in Nuke.
+        self._destroyed_bricks = []
+
+        # Record simulated time since the game was initialized.
+        self._elapsed = 0.0
+
+        self._initialized = False
+
+    def initialize(self, force=False):
+        """Initialize the game.
+
+        Only nodes which differ from the initial layout of the level are
+        updated, without recording any undo history. When snapshots are
+        enabled, all nodes are deleted and restored from the snapshot of the
+        level in one operation instead.
+
+        :param force: Indicate whether all nodes should be updated one by
+            one. Default is False.
+
+        :return: Number of nodes updated.
+
+        """
+        super(BreakoutGame, self).initialize()
+
+        if self._drawing is not None:
+            self._drawing.cancel()
+            self._drawing = None
+
+        with arcade_nuke.utility.undo_suppressor:
+            if self._snapshot is not None and not force:
+                count = self._restore_snapshot()
+
+            else:
+                count = self._field.reset(force=force)
+                count += self._paddle.reset(force=force)
+                count += self._ball.reset(force=force)
+                count += self._bricks.reset(force=force)
+
+                if self._use_snapshot:
+                    self._snapshot = arcade_nuke.utility.NodeSnapshot.capture(
+                        [node.node() for node in self.nodes()]
+                    )
+
+        del self._destroyed_bricks[:]
+        self._elapsed = 0.0
+
+        if self._autopilot is not None:
+            self._autopilot.reset()
+
+        return count
+
+    @property
+    def level(self):
+        """Return name of the level."""
+        return self._level
+
+    @property
+    def elapsed(self):
+        """Return simulated time since the game was initialized."""
+        return self._elapsed
+
+    def checkpoint(self):
+        """Return compact state of the game.
+
+        :return: Instance of :class:`arcade_nuke.checkpoint.Checkpoint`.
+
+        """
+        return arcade_nuke.checkpoint.Checkpoint(
+            level=self._level,
+            paddle=self._paddle.position,
+            ball=self._ball.position,
+            motion_vector=self._ball.motion_vector,
+            elapsed=self._elapsed,
+            bricks=self._bricks.bitset(),
+            count=len(self._bricks),
+            fixed_point=self._fixed_point
+        )
+
+    def restore_checkpoint(self, checkpoint):
+        """Restore state of the game from *checkpoint*.
+
+        The game is initialized beforehand if necessary, then only nodes
+        which differ from the checkpoint are updated, without recording any
+        undo history. The game must not be running.
+
+        :param checkpoint: Instance of
+            :class:`arcade_nuke.checkpoint.Checkpoint`.
+
+        :raise: :exc:`ValueError` if the checkpoint was not taken on the
+            same level and in the same simulation mode.
+
+        :return: Number of nodes updated.
+
+        """
+        if not checkpoint.matches(
+            self._level, len(self._bricks), self._fixed_point
+        ):
+            raise ValueError(
+                "Checkpoint was taken on level '{}' with fixed point {} "
+                "instead of '{}' with fixed point {}.".format(
+                    checkpoint.level,
+                    "enabled" if checkpoint.fixed_point else "disabled",
+                    self._level,
+                    "enabled" if self._fixed_point else "disabled"
+                )
+            )
+
+        if not self._initialized:
+            self.initialize()
+
+        if self._drawing is not None:
+            self._drawing.cancel()
+            self._drawing = None
+
+        self._delete_destroyed_bricks()
+
+        with arcade_nuke.utility.undo_suppressor:
+            count = self._bricks.apply_bitset(checkpoint.bricks)
+
+            for node, position in [
+                (self._paddle, checkpoint.paddle),
+                (self._ball, checkpoint.ball),
+            ]:
+                # Node of the ball is deleted when the game is over.
+                if node.destroyed():
+                    node.reset()
+
+                node.place(position)
+                count += node.render()
+
+        self._ball.motion_vector = checkpoint.motion_vector
+        self._elapsed = checkpoint.elapsed
+
+        if self._autopilot is not None:
+            self._autopilot.reset()
+
+        return count
+
+    @property
+    def autopilot(self):
+        """Return autopilot driving the paddle or None."""
+        return self._autopilot
+
+    @property
+    def field(self):
+        """Return :class:`Field` instance of the game."""
+        return self._field
+
+    def release(self):
+        """Stop the game, release its timer and delete all its nodes."""
+        super(BreakoutGame, self).release()
+
+        if self._drawing is not None:
+            self._drawing.cancel()
+            self._drawing = None
+
+        with arcade_nuke.utility.undo_suppressor:
+            self._delete_nodes()
+
+        del self._destroyed_bricks[:]
+
+    def _delete_nodes(self):
+        """Delete nodes of all elements of the game.
+
+        Nodes of a field shared with other games are left to the arena.
+
+        """
+        if self._arena is None:
+            self._field.delete_nodes()
+
+        self._paddle.delete_node()
+        self._ball.delete_node()
+        self._bricks.delete_nodes()
+
+    def _restore_snapshot(self):
+        """Restore all nodes from the snapshot of the level.
+
+        Nothing is restored if no node differs from the initial layout.
+
+        :return: Number of nodes restored.
+
+        """
+        units = self._field.units + [self._paddle, self._ball]
+
+        dirty = self._bricks.dirty_count() > 0 or any(
+            unit.dirty() for unit in units
+        )
+
+        if dirty:
+            self._delete_nodes()
+            self._snapshot.restore()
+
+        for unit in units:
+            unit.reset_state()
+
+        self._bricks.reset_state()
+
+        if not dirty:
+            return 0
+
+        return len(units) + len(self._bricks)
+
+    def nodes(self):
+        """Return all nodes managed by the game.
+
+        Nodes of a field shared with other games are managed by the arena.
+
+        """
+        nodes = [self._paddle, self._ball]
+        if self._arena is None:
+            nodes = self._field.units + nodes
+
+        nodes.extend(self._bricks)
+
+        if self._drawing is not None:
+            nodes.extend(self._drawing.points)
+
+        return nodes
+
+    def _process(self):
+        """Method called for each tick of the timer."""
+        try:
+            super(BreakoutGame, self)._process()
+
+        except arcade_nuke.base.GameOver as error:
+            self._delete_destroyed_bricks()
+            self._ball.destroy()
+            self.stop()
+            self.signal.stopped.emit()
+
+            if not error.success:
+                points = arcade_nuke.utility.iter_game_over(
+                    x=self._field.left_edge + 200,
+                    y=self._field.top_edge + 400
+                )
+            else:
+                points = arcade_nuke.utility.iter_win(
+                    x=self._field.left_edge + 250,
+                    y=self._field.top_edge + 250
+                )
+
+            # Draw feedback over several ticks to keep the UI responsive.
+            self._drawing = arcade_nuke.utility.DrawingJob(
+                points, budget=self._render_step
+            )
+            self._drawing.start()
+
+            self._initialized = False
+
+    def _simulate(self, delta):
+        """Method called for each simulation step of the game.
+
+        :param delta: Duration of the simulation step in seconds.
+
+        """
+        # Move the paddle according to the cursor position.
+        self._paddle.move(
+            x=self._input,
+            y=self._field.bottom_edge - 20,
+            right_edge=self._field.right_edge,
+            left_edge=self._field.left_edge
+        )
+
+        # Move the ball according to its motion vector.
+        self._ball.move(delta)
+        self._elapsed += delta
+
+        self._check_collision()
+
+    def _render(self, alpha):
+        """Method called to update the nodes in Nuke.
+
+        :param alpha: Interpolation factor between the previous and the
+            current simulation steps.
+
+        """
+        self._delete_destroyed_bricks()
+
+        # Each position update writes both coordinates of the node.
+        self._counters["writes"] += 2 * self._paddle.render(alpha)
+        self._counters["writes"] += 2 * self._ball.render(alpha)
+
+    def _capture_input(self):
+        """Return position of the cursor on the X axis.
+
+        The position targeted by the autopilot is returned instead when
+        enabled. The cursor position is shifted by the offset of the field.
+
+        """
+        if self._autopilot is not None:
+            return self._autopilot.target(
+                self._ball, self._paddle, self._field, self._bricks
+            )
+
+        return QtGui.QCursor.pos().x() + self._offset[0]
+
+    def _capture_frame(self):
+        """Return delta of the latest simulation step."""
+        frame = Frame(
+            ball=self._ball.position,
+            paddle=self._paddle.position,
+            destroyed=tuple(self._destroyed_bricks)
+        )
+
+        del self._destroyed_bricks[:]
+        return frame
+
+    def _apply_frames(self, frames):
+        """Apply frame deltas posted by the worker thread to Nuke.
+
+        :param frames: List of :class:`Frame` instances, from the oldest to
+            the latest.
+
+        """
+        for frame in frames:
+            for index in frame.destroyed:
+                self._bricks.delete_node(index)
+                self._counters["writes"] += 1
+
+        self._counters["writes"] += 2 * self._paddle.update_node(
+            frames[-1].paddle
+        )
+        self._counters["writes"] += 2 * self._ball.update_node(
+            frames[-1].ball
+        )
+
+    def _frame_telemetry(self):
+        """Return mapping of game values to record for each tick."""
+        speed = abs(self._ball.motion_vector) * Ball.speed()
+        if self._fixed_point:
+            speed /= arcade_nuke.logic.FIXED_POINT_SCALE
+
+        return {"ball_speed": speed, "bricks": self._bricks.alive_count()}
+
+    def _session_telemetry(self):
+        """Return mapping of game values to record for each session."""
+        return {
+            "level": self._level,
+            "bricks": len(self._bricks),
+            "bricks_destroyed": len(self._bricks) - self._bricks.alive_count(),
+            "fixed_point": self._fixed_point,
+            "threaded": self._threaded,
+            "simulation_rate": int(round(1.0 / self._simulation_step)),
+            "render_rate": int(round(1.0 / self._render_step)),
+        }
+
+    def _delete_destroyed_bricks(self):
+        """Delete nodes of bricks destroyed by the simulation."""
+        for index in self._destroyed_bricks:
+            self._bricks.delete_node(index)
+            self._counters["writes"] += 1
+
+        del self._destroyed_bricks[:]
+
+    def _setup_field(self):
+        """Initialize game field."""
+        options = dict(
+            x=self._offset[0], y=self._offset[1],
+            width=self._field_size[0], height=self._field_size[1],
+            padding=10, segments=self._wall_segments
+        )
+
+        if self._arena is not None:
+            self._field = self._arena.field(**options)
+        else:
+            self._field = Field(**options)
+
+        self._paddle = Paddle(
+            x=self._field.center_x - Paddle.width() / 2,
+            y=self._field.bottom_edge - 25,
+            fixed_point=self._fixed_point
+        )
+
+        self._ball = Ball(
+            x=self._field.center_x,
+            y=self._field.bottom_edge - 40,
+            fixed_point=self._fixed_point
+        )
+
+    def _check_collision(self):
+        """Indicate whether the *ball* hit one of the game elements.
+        """
+        # Check collision with the wall of the field.
+        if (
+            self._ball.position.x > self._field.right_edge or
+            self._ball.position.x < self._field.left_edge
+        ):
+            self._ball.motion_vector *= arcade_nuke.node.Vector(-1, 1)
+            return
+
+        if self._ball.position.y < self._field.top_edge:
+            self._ball.motion_vector *= arcade_nuke.node.Vector(1, -1)
+            return
+
+        if self._ball.position.y > self._field.bottom_edge:
+            raise arcade_nuke.base.GameOver()
+
+        # Check collision with the bricks.
+        for index, push_vector in self._bricks.collisions(self._ball):
+            self._ball.motion_vector = arcade_nuke.logic.bounce(
+                self._ball.motion_vector, push_vector,
+                fixed_point=self._fixed_point
+            )
+
+            # Destroy brick, its node is deleted when rendering.
+            self._bricks.destroy(index)
+            self._destroyed_bricks.append(index)
+            self._counters["collisions"] += 1
+
+        # Raise if all bricks are destroyed.
+        if self._bricks.alive_count() == 0:
+            raise arcade_nuke.base.GameOver(success=True)
+
+        # Check collision with the paddle.
+        push_vector = arcade_nuke.logic.collision(self._ball, self._paddle)
+        if push_vector is not None:
+            self._counters["collisions"] += 1
+            self._ball.motion_vector = arcade_nuke.logic.bounce(
+                self._ball.motion_vector, push_vector,
+                fixed_point=self._fixed_point
+            )
+
+
+class Field(object):
+    """Object managing the field of the game."""
+
+    def __init__(self, x, y, width, height, padding, segments=None):
+        """Initialize the field.
+
+        :param x: Position of the left edge of the field on the X axis.
+
+        :param y: Position of the top edge of the field on the Y axis.
+
+        :param width: Number of dots to define the width of the field.
+
+        :param height: Number of dots to define the height of the field.
+
+        :param padding: Padding between each dot defining the limit of the
+            field.
+
+        :param segments: Number of stretched nodes drawing each wall. Default
+            is None, which draws walls with one Dot node per unit.
+
+        """
+        self._units = []
+
+        if segments is None:
+            self._add_units(x, y, width, height, padding)
+        else:
+            self._add_walls(x, y, width, height, padding, segments)
+
+        # Compute edges.
+        self._top = y + FieldUnit.height()
+        self._left = x + FieldUnit.width()
+        self._right = (
+            x + (FieldUnit.width() + padding) * (width - 1) - FieldUnit.width()
+        )
+        self._bottom = (
+            y + (FieldUnit.height() + padding) * height - FieldUnit.height()
+        )
+
+    def _add_units(self, x, y, width, height, padding):
+        """Draw walls with one Dot node per unit.
+
+        :param x: Position of the left edge of the field on the X axis.
+
+        :param y: Position of the top edge of the field on the Y axis.
+
+        :param width: Number of dots to define the width of the field.
+
+        :param height: Number of dots to define the height of the field.
+
+        :param padding: Padding between each dot.
+
+        """
+        # Units representing top wall.
+        for index in range(width):
+            unit = FieldUnit(x + (FieldUnit.width() + padding) * index, y)
+            self._units.append(unit)
+
+        # Units representing left wall.
+        for index in range(1, height):
+            unit = FieldUnit(x, y + (FieldUnit.height() + padding) * index)
+            self._units.append(unit)
+
+        # Units representing right wall.
+        for index in range(1, height):
+            unit = FieldUnit(
+                x + (FieldUnit.width() + padding) * (width - 1),
+                y + (FieldUnit.height() + padding) * index
+            )
+            self._units.append(unit)
+
+        # Units representing bottom wall.
+        for index in range(width):
+            unit = FieldUnit(
+                x + (FieldUnit.width() + padding) * index,
+                y + (FieldUnit.height() + padding) * height
+            )
+            self._units.append(unit)
+
+    def _add_walls(self, x, y, width, height, padding, segments):
+        """Draw each wall with a few stretched nodes.
+
+        Walls cover the same area as the units drawn by :meth:`_add_units`.
+
+        :param x: Position of the left edge of the field on the X axis.
+
+        :param y: Position of the top edge of the field on the Y axis.
+
+        :param width: Number of dots to define the width of the field.
+
+        :param height: Number of dots to define the height of the field.
+
+        :param padding: Padding between each dot.
+
+        :param segments: Number of nodes drawing each wall.
+
+        """
+        thickness = FieldUnit.width()
+        right = x + (FieldUnit.width() + padding) * (width - 1)
+        bottom = y + (FieldUnit.height() + padding) * height
+
+        length_x = right - x + thickness
+        length_y = bottom - y + thickness
+
+        for index in range(segments):
+            start = length_x * index // segments
+            end = length_x * (index + 1) // segments
+
+            # Segments of top and bottom walls.
+            for _y in [y, bottom]:
+                self._units.append(
+                    FieldWall(x + start, _y, end - start, thickness)
+                )
+
+            start = length_y * index // segments
+            end = length_y * (index + 1) // segments
+
+            # Segments of left and right walls.
+            for _x in [x, right]:
+                self._units.append(
+                    FieldWall(_x, y + start, thickness, end - start)
+                )
+
+    def reset(self, force=False):
+        """Reset field.
+
+        :param force: Indicate whether all units should be updated even if
+            they did not change. Default is False.
+
+        :return: Number of units updated.
+
+        """
+        count = 0
+
+        for unit in self._units:
+            count += unit.reset(force=force)
+
+        # Zoom on the field
+        nuke.zoom(0)
+
+        return count
+
+    def delete_nodes(self):
+        """Delete nodes of all units."""
+        for unit in self._units:
+            unit.delete_node()
+
+    @property
+    def units(self):
+        """Return list of units drawing the field."""
+        return list(self._units)
+
+    @property
+    def center_x(self):
+        """Return the middle of the field on the X axis."""
+        return int(self.left_edge + (self.right_edge - self.left_edge) / 2.0)
+
+    @property
+    def right_edge(self):
+        """Return the right edge of the field."""
+        return self._right
+
+    @property
+    def left_edge(self):
+        """Return the left edge of the field."""
+        return self._left
+
+    @property
+    def bottom_edge(self):
+        """Return the bottom edge of the field."""
+        return self._bottom
+
+    @property
+    def top_edge(self):
+        """Return the top edge of the field."""
+        return self._top
+
+
+class FieldArena(object):
+    """Fields shared by several games.
+
+    Games created with the same arena and the same field layout share one
+    :class:`Field` instance and its nodes. The nodes are owned by the arena
+    and only deleted when it is released.
+
+    """
+
+    def __init__(self):
+        """Initialize the arena."""
+        self._fields = collections.OrderedDict()
+
+    def field(self, x, y, width, height, padding, segments=None):
+        """Return field shared by all games with the same layout.
+
+        The field is created on the first request.
+
+        :param x: Position of the left edge of the field on the X axis.
+
+        :param y: Position of the top edge of the field on the Y axis.
+
+        :param width: Number of dots to define the width of the field.
+
+        :param height: Number of dots to define the height of the field.
+
+        :param padding: Padding between each dot defining the limit of the
+            field.
+
+        :param segments: Number of stretched nodes drawing each wall. Default
+            is None, which draws walls with one Dot node per unit.
+
+        :return: Instance of :class:`Field`.
+
+        """
+        key = (x, y, width, height, padding, segments)
+
+        if key not in self._fields:
+            self._fields[key] = Field(
+                x, y, width, height, padding, segments=segments
+            )
+
+        return self._fields[key]
+
+    @property
+    def fields(self):
+        """Return list of fields created so far."""
+        return list(self._fields.values())
+
+    def nodes(self):
+        """Return nodes of all fields."""
+        return [
+            unit for field in self._fields.values() for unit in field.units
+        ]
+
+    def release(self):
+        """Delete nodes of all fields."""
+        with arcade_nuke.utility.undo_suppressor:
+            for field in self._fields.values():
+                field.delete_nodes()
+
+        self._fields.clear()
+
+
+class FieldUnit(arcade_nuke.node.DotNode):
+    """Object managing the field unit."""
+
+    @property
+    def label(self):
+        """Return label of the node."""
+        return "field_unit"
+
+
+class FieldWall(arcade_nuke.node.RectangleNode):
+    """Object managing a wall segment of the field drawn as a Backdrop."""
+
+    def __init__(self, x, y, width, height):
+        """Initialize the wall segment.
+
+        :param x: Position of the left corner of the segment on the X axis.
+
+        :param y: Position of the top corner of the segment on the Y axis.
+
+        :param width: Width of the segment.
+
+        :param height: Height of the segment.
+
+        """
+        super(FieldWall, self).__init__(x, y)
+        self._width = width
+        self._height = height
+
+    def width(self):
+        """Return width of the node."""
+        return self._width
+
+    def height(self):
+        """Return height of the node."""
+        return self._height
+
+    @property
+    def label(self):
+        """Return label of the node."""
+        return "field_wall"
+
+    @property
+    def node_class(self):
+        """Return class of the node."""
+        return "BackdropNode"
+
+    def create_node(self):
+        """Create node."""
+        return nuke.nodes.BackdropNode(
+            name=self._name,
+            xpos=self._position.x,
+            ypos=self._position.y,
+            bdwidth=self._width,
+            bdheight=self._height,
+            label=""
+        )
+
+
+class Ball(arcade_nuke.node.DotNode):
+    """Object managing the ball."""
+
+    def __init__(self, x, y, fixed_point=False):
+        """Initialize the ball.
+
+        :param x: Initial position of left corner of the node on the X axis.
+
+        :param y: Initial position of top corner of the node on the Y axis.
+
+        :param fixed_point: Indicate whether the position and the motion
+            vector should be simulated with sub-pixel integer units. Default
+            is False.
+
+        """
+        super(Ball, self).__init__(x, y)
+        self._fixed_point = fixed_point
+        self._fixed_position = arcade_nuke.logic.to_fixed(self._position)
+        self.motion_vector = self._initial_motion_vector()
+
+    @staticmethod
+    def speed():
+        """Return number of motion vector displacements per second."""
+        return 100
+
+    @property
+    def label(self):
+        """Return label of the node."""
+        return "ball"
+
+    def move(self, delta):
+        """Move the ball following the motion vector.
+
+        :param delta: Duration of the move in seconds.
+
+        """
+        if self._fixed_point:
+            rate = int(round(1.0 / delta))
+            self._fixed_position += arcade_nuke.logic.fixed_divide(
+                self.motion_vector * self.speed(), rate
+            )
+            self.move_to(arcade_nuke.logic.from_fixed(self._fixed_position))
+            return
+
+        self.move_to(
+            self.position + self.motion_vector * (self.speed() * delta)
+        )
+
+    def place(self, position):
+        """Record simulated position without interpolation.
+
+        :param position: Instance of :class:`~arcade_nuke.logic.Vector`.
+
+        """
+        super(Ball, self).place(position)
+        self._fixed_position = arcade_nuke.logic.to_fixed(position)
+
+    def reset_state(self):
+        """Reset simulated state of the node."""
+        super(Ball, self).reset_state()
+
+        # Reset position in sub-pixel units and motion vector.
+        self._fixed_position = arcade_nuke.logic.to_fixed(self._position)
+        self.motion_vector = self._initial_motion_vector()
+
+    def _initial_motion_vector(self):
+        """Return motion vector when the game starts."""
+        motion_vector = arcade_nuke.node.Vector(1, -3)
+
+        if self._fixed_point:
+            return arcade_nuke.logic.to_fixed(motion_vector)
+
+        return motion_vector
+
+
+class Paddle(arcade_nuke.node.ViewerNode):
+    """Object managing the paddle."""
+
+    @property
+    def label(self):
+        """Return label of the node."""
+        return "paddle"
+
+    def move(self, x, y, right_edge, left_edge):
+        """Move the paddle on the X axis within the limit of the field.
+
+        :param x: Position of the cursor on the X axis.
+
+        :param y: Position of the paddle on the Y axis.
+
+        :param right_edge: Maximum position on the X axis.
+
+        :param left_edge: Minimum position on the X axis.
+
+        """
+        right_edge -= self.width()
+        self.move_to(
+            arcade_nuke.node.Vector(min(max(x, left_edge), right_edge), y)
+        )
+
+
+class Autopilot(object):
+    """Input source moving the paddle where the ball will land.
+
+    The trajectory of the ball is traced from its motion vector, reflecting
+    on the walls of the field and on the bricks not destroyed, until it
+    crosses the row of the paddle. The prediction is cached until the motion
+    vector of the ball changes, or until the ball passes the first bounce
+    predicted without bouncing.
+
+    """
+
+    def __init__(self, aim=0.0, error=0.0, seed=None, maximum_bounces=50):
+        """Initialize the autopilot.
+
+        :param aim: Position on the paddle where the ball should land, from
+            -1.0 for the left end to 1.0 for the right end. Aiming off the
+            center steers the bounces of the ball. Default is 0.0.
+
+        :param error: Standard deviation in pixels of the error added to
+            each prediction, so that the paddle can miss on purpose. Default
+            is 0.0.
+
+        :param seed: Value used to seed the errors. Default is None.
+
+        :param maximum_bounces: Maximum number of bounces traced for each
+            prediction. Default is 50.
+
+        """
+        self._aim = aim
+        self._error = error
+        self._seed = seed
+        self._random = random.Random(seed)
+        self._maximum_bounces = maximum_bounces
+
+        self._motion_vector = None
+        self._checkpoint = None
+        self._prediction = None
+
+    @property
+    def prediction(self):
+        """Return cached position on the X axis where the ball will land."""
+        return self._prediction
+
+    def reset(self):
+        """Clear cached prediction and seed errors again."""
+        self._random.seed(self._seed)
+        self._motion_vector = None
+        self._checkpoint = None
+        self._prediction = None
+
+    def target(self, ball, paddle, field, bricks):
+        """Return position of the paddle on the X axis to catch the ball.
+
+        :param ball: Instance of :class:`Ball`.
+
+        :param paddle: Instance of :class:`Paddle`.
+
+        :param field: Instance of :class:`Field`.
+
+        :param bricks: Instance of :class:`BrickField`.
+
+        """
+        if (
+            ball.motion_vector != self._motion_vector or
+            (self._checkpoint - ball.position).dot(ball.motion_vector) < 0
+        ):
+            # Bounces update the motion vector of the ball in place.
+            self._motion_vector = arcade_nuke.logic.Vector(
+                ball.motion_vector.x, ball.motion_vector.y
+            )
+            self._prediction, self._checkpoint = self._trace(
+                ball, paddle, field, bricks
+            )
+
+            if self._error:
+                self._prediction += self._random.gauss(0, self._error)
+
+        half_width = paddle.width() / 2.0
+        return int(round(
+            self._prediction - half_width * (1 + self._aim)
+        ))
+
+    def predict(self, ball, paddle, field, bricks):
+        """Return middle of the ball on the X axis when reaching the paddle.
+
+        :param ball: Instance of :class:`Ball`.
+
+        :param paddle: Instance of :class:`Paddle`.
+
+        :param field: Instance of :class:`Field`.
+
+        :param bricks: Instance of :class:`BrickField`.
+
+        """
+        return self._trace(ball, paddle, field, bricks)[0]
+
+    def _trace(self, ball, paddle, field, bricks):
+        """Trace trajectory of the ball until it reaches the paddle.
+
+        :param ball: Instance of :class:`Ball`.
+
+        :param paddle: Instance of :class:`Paddle`.
+
+        :param field: Instance of :class:`Field`.
+
+        :param bricks: Instance of :class:`BrickField`.
+
+        :return: Tuple containing the middle of the ball on the X axis when
+            reaching the paddle and the position of the first bounce as a
+            :class:`~arcade_nuke.logic.Vector` instance.
+
+        """
+        x, y = ball.position.x, ball.position.y
+        dx, dy = ball.motion_vector.x, ball.motion_vector.y
+
+        row = paddle.position.y - ball.height()
+        boxes = bricks.boxes()
+        checkpoint = None
+
+        for _ in range(self._maximum_bounces):
+            # Distance and axis of the first obstacle along the trajectory.
+            distance, axis, hit = float("inf"), None, None
+
+            if dy > 0 and row >= y:
+                distance, axis = (row - y) / float(dy), "row"
+
+            if dx > 0:
+                _distance = (field.right_edge - x) / float(dx)
+            elif dx < 0:
+                _distance = (field.left_edge - x) / float(dx)
+            else:
+                _distance = float("inf")
+
+            if 0 <= _distance < distance:
+                distance, axis = _distance, "x"
+
+            if dy < 0:
+                _distance = (field.top_edge - y) / float(dy)
+                if 0 <= _distance < distance:
+                    distance, axis = _distance, "y"
+
+            for box in boxes:
+                _distance, _axis = _intersect(
+                    x, y, dx, dy, ball.width(), ball.height(), box
+                )
+                if _distance is not None and _distance < distance:
+                    distance, axis, hit = _distance, _axis, box
+
+            if axis is None:
+                break
+
+            x += dx * distance
+            y += dy * distance
+
+            if checkpoint is None:
+                checkpoint = arcade_nuke.node.Vector(x, y)
+
+            if axis == "row":
+                break
+
+            # Bricks are destroyed by the first hit.
+            if hit is not None:
+                boxes.remove(hit)
+
+            if axis == "x":
+                dx = -dx
+            else:
+                dy = -dy
+
+        if checkpoint is None:
+            checkpoint = arcade_nuke.node.Vector(x, y)
+
+        return x + ball.width() / 2.0, checkpoint
+
+
+def _intern(value, values, identifiers):
+    """Return identifier of *value*, recorded if necessary.
+
+    :param value: Value to intern.
+
+    :param values: List of unique values indexed by identifier.
+
+    :param identifiers: Mapping of each value in *values* with its
+        identifier.
+
+    """
+    identifier = identifiers.get(value)
+    if identifier is None:
+        identifier = len(values)
+        identifiers[value] = identifier
+        values.append(value)
+
+    return identifier
+
+
+def _intersect(x, y, dx, dy, width, height, box):
+    """Return distance and axis of the first hit of a moving box on *box*.
+
+    :param x: Position of the moving box on the X axis.
+
+    :param y: Position of the moving box on the Y axis.
+
+    :param dx: Motion of the moving box on the X axis.
+
+    :param dy: Motion of the moving box on the Y axis.
+
+    :param width: Width of the moving box.
+
+    :param height: Height of the moving box.
+
+    :param box: Tuple containing the index, the position on the X and Y
+        axis, the width and the height of the box hit.
+
+    :return: Tuple containing the distance along the motion and "x" or "y"
+        depending on the side hit, or (None, None) if the box is not hit.
+
+    """
+    _, left, top, _width, _height = box
+
+    # Expand the box hit by the size of the moving box.
+    left, right = left - width, left + _width
+    top, bottom = top - height, top + _height
+
+    entries, exits = [], []
+
+    for position, motion, minimum, maximum in [
+        (x, dx, left, right), (y, dy, top, bottom)
+    ]:
+        if motion == 0:
+            if not minimum <= position <= maximum:
+                return None, None
+
+            entries.append(float("-inf"))
+            exits.append(float("inf"))
+            continue
+
+        near = (minimum - position) / float(motion)
+        far = (maximum - position) / float(motion)
+        entries.append(min(near, far))
+        exits.append(max(near, far))
+
+    entry, leave = max(entries), min(exits)
+    if entry > leave or entry <= 0:
+        return None, None
+
+    return entry, "x" if entries[0] > entries[1] else "y"
+
+
+class Brick(arcade_nuke.node.RectangleNode):
+    """Object managing a single brick."""
+
+    def __init__(self, x, y, node_class, label):
+        """Initialize the brick.
+
+        :param x: Position of the brick on the X axis.
+
+        :param y: Position of the brick on the Y axis.
+
+        :param node_class: Class of the node to create to represent the brick.
+
+        :param label: Label of the brick.
+
+        """
+        super(Brick, self).__init__(x, y)
+        self._node_class = node_class
+        self._label = label
+
+    @property
+    def label(self):
+        """Return label of the node."""
+        return "brick_{}".format(self._label)
+
+    @property
+    def node_class(self):
+        """Return class of the node."""
+        return self._node_class
+
+    def create_node(self):
+        """Create node."""
+        node = super(Brick, self).create_node()
+        node["autolabel"].setValue(self._label)
+        return node
+
+
+class BrickField(object):
+    """Collection of bricks stored as columns.
+
+    Positions, sizes, states, node classes and labels of all bricks are
+    stored in arrays indexed by brick, so that collisions, destruction and
+    reset can run as column operations without one object per brick. Node
+    classes and labels are interned, and bricks are sorted by position on
+    the Y axis so that collisions only test the rows close to a node.
+
+    """
+
+    def __init__(self):
+        """Initialize the field."""
+        self._prefix = "node_{}".format(uuid.uuid4().hex)
+
+        self._x = array.array("i")
+        self._y = array.array("i")
+        self._width = array.array("i")
+        self._height = array.array("i")
+        self._alive = array.array("b")
+        self._class_ids = array.array("H")
+        self._label_ids = array.array("i")
+        self._alive_count = 0
+
+        # Record bricks whose node differs from the initial layout.
+        self._dirty = array.array("b")
+
+        # Record bricks whose node was created ahead of time out of view.
+        self._parked = array.array("b")
+
+        # Unique node classes and labels referenced by identifier, with the
+        # mappings of each value with its identifier.
+        self._node_classes = []
+        self._labels = []
+        self._class_ids_by_name = {}
+        self._label_ids_by_name = {}
+
+        # Record positions on the Y axis in ascending order with the indices
+        # of the bricks, rebuilt when bricks are added, and the maximum
+        # height of a brick.
+        self._sorted_y = None
+        self._sorted_indices = None
+        self._maximum_height = 0
+
+    @classmethod
+    def from_bricks(cls, bricks):
+        """Create field from a list of bricks.
+
+        :param bricks: List of :class:`Brick` instances.
+
+        :return: Instance of :class:`BrickField`.
+
+        """
+        field = cls()
+
+        for brick in bricks:
+            field.add(
+                brick._position.x, brick._position.y,
+                node_class=brick.node_class, label=brick._label,
+                width=brick.width(), height=brick.height()
+            )
+
+        return field
+
+    def __len__(self):
+        """Return number of bricks."""
+        return len(self._alive)
+
+    def __getitem__(self, index):
+        """Return view on brick at *index*.
+
+        :return: Instance of :class:`BrickView`.
+
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        return BrickView(self, index)
+
+    def __iter__(self):
+        """Iterate through views on all bricks."""
+        for index in range(len(self)):
+            yield BrickView(self, index)
+
+    def add(
+        self, x, y, node_class, label, width=None, height=None
+    ):
+        """Add a brick to the field.
+
+        :param x: Position of the brick on the X axis.
+
+        :param y: Position of the brick on the Y axis.
+
+        :param node_class: Class of the node to create to represent the brick.
+
+        :param label: Label of the brick.
+
+        :param width: Width of the brick. Default is the width of
+            :class:`Brick`.
+
+        :param height: Height of the brick. Default is the height of
+            :class:`Brick`.
+
+        :return: Index of the brick.
+
+        """
+        height = height if height is not None else Brick.height()
+
+        self._x.append(int(x))
+        self._y.append(int(y))
+        self._width.append(width if width is not None else Brick.width())
+        self._height.append(height)
+        self._alive.append(1)
+        self._class_ids.append(
+            _intern(node_class, self._node_classes, self._class_ids_by_name)
+        )
+        self._label_ids.append(
+            _intern(label, self._labels, self._label_ids_by_name)
+        )
+        self._alive_count += 1
+        self._dirty.append(1)
+        self._parked.append(0)
+
+        self._maximum_height = max(self._maximum_height, height)
+        self._sorted_y = None
+        self._sorted_indices = None
+
+        return len(self._alive) - 1
+
+    def name(self, index):
+        """Return name of the node for brick at *index*."""
+        return "{}_{}".format(self._prefix, index)
+
+    def label(self, index):
+        """Return label of brick at *index*."""
+        return self._labels[self._label_ids[index]]
+
+    def node_class(self, index):
+        """Return class of the node for brick at *index*."""
+        return self._node_classes[self._class_ids[index]]
+
+    def alive(self, index):
+        """Indicate whether brick at *index* is not destroyed."""
+        return self._alive[index] == 1
+
+    def alive_count(self):
+        """Return number of bricks not destroyed."""
+        return self._alive_count
+
+    def boxes(self):
+        """Return bounding boxes of bricks not destroyed.
+
+        :return: List of tuples containing the brick index, the position on
+            the X and Y axis, the width and the height of the brick.
+
+        """
+        return [
+            (
+                index, self._x[index], self._y[index],
+                self._width[index], self._height[index]
+            )
+            for index in range(len(self._alive)) if self._alive[index]
+        ]
+
+    def collisions(self, node, threshold=80):
+        """Return bricks colliding with *node*.
+
+        Bricks are first selected by bisecting the positions sorted on the
+        Y axis, then filtered with their bounding boxes, so that the
+        separating axis test only runs against close bricks.
+
+        :param node: Instance of :class:`arcade_nuke.node.BaseNode`.
+
+        :param threshold: Maximum distance between the node and a brick which
+            will trigger the collision algorithm. Default is 80.
+
+        :return: List of tuples containing the brick index and the collision
+            axis as returned by :func:`arcade_nuke.logic.collision`.
+
+        """
+        position = node.position
+        left, top = position.x, position.y
+        right, bottom = left + node.width(), top + node.height()
+
+        if self._sorted_y is None:
+            self._sorted_indices = sorted(
+                range(len(self._y)), key=self._y.__getitem__
+            )
+            self._sorted_y = [self._y[index] for index in self._sorted_indices]
+
+        # Only bricks starting between the maximum height of a brick above
+        # the node and the bottom of the node can overlap it.
+        start = bisect.bisect_left(
+            self._sorted_y, top - self._maximum_height
+        )
+        end = bisect.bisect_right(self._sorted_y, bottom)
+
+        xs, ys = self._x, self._y
+        widths, heights = self._width, self._height
+        alive = self._alive
+
+        result = []
+
+        for index in sorted(self._sorted_indices[start:end]):
+            if (
+                not alive[index] or
+                right < xs[index] or left > xs[index] + widths[index] or
+                top > ys[index] + heights[index]
+            ):
+                continue
+
+            push_vector = arcade_nuke.logic.collision(
+                node, BrickView(self, index), threshold=threshold
+            )
+            if push_vector is not None:
+                result.append((index, push_vector))
+
+        return result
 
-    def __init__(self, generator):
-        """Initialize the game.
+    def destroy(self, index):
+        """Mark brick at *index* as destroyed without deleting its node.
 
-        :param generator: Callback to draw the brick pattern.
+        The node is deleted by :meth:`delete_node`.
 
         """
-        super(BreakoutGame, self).__init__()
+        if self._alive[index]:
+            self._alive[index] = 0
+            self._alive_count -= 1
+            self._dirty[index] = 1
 
-        # Setup elements of game.
-        self._setup_field()
+    def restore(self, index):
+        """Mark brick at *index* as not destroyed."""
+        if not self._alive[index]:
+            self._alive[index] = 1
+            self._alive_count += 1
 
-        # Draw brick pattern.
-        self._bricks = generator(
-            x=self._field.left_edge,
-            y=self._field.top_edge
-        )
+    def bitset(self):
+        """Return bricks not destroyed as bytes with one bit per brick."""
+        data = bytearray((len(self._alive) + 7) // 8)
 
-        # Record drawing of feedback
-        self._letter_points = []
+        for index, alive in enumerate(self._alive):
+            if alive:
+                data[index >> 3] |= 1 << (index & 7)
 
-        self._initialized = False
+        return bytes(data)
 
-    def initialize(self):
-        """Initialize the game."""
-        super(BreakoutGame, self).initialize()
+    def apply_bitset(self, data):
+        """Destroy or restore bricks to match *data*.
 
-        self._field.reset()
-        self._paddle.reset()
-        self._ball.reset()
+        Nodes of bricks destroyed are deleted and nodes of bricks restored
+        are created again.
 
-        for brick in self._bricks:
-            brick.reset()
+        :param data: Bytes as returned by :meth:`bitset`.
 
-        for point in self._letter_points:
-            point.destroy()
+        :return: Number of nodes updated.
 
-    def _process(self):
-        """Method called for each move of the game."""
-        # Move the paddle according to the cursor position.
-        self._paddle.move(
-            y=self._field.bottom_edge - 20,
-            right_edge=self._field.right_edge,
-            left_edge=self._field.left_edge
-        )
+        """
+        data = bytearray(data)
+        count = 0
 
-        # Move the ball according to its motion vector.
-        self._ball.move()
+        for index in range(len(self._alive)):
+            alive = (data[index >> 3] >> (index & 7)) & 1
+            if alive == self._alive[index]:
+                continue
 
-        try:
-            self._check_collision()
+            if alive:
+                self.restore(index)
+                self.reset_node(index)
+            else:
+                self.destroy(index)
+                self.delete_node(index)
 
-        except arcade_nuke.base.GameOver as error:
-            self._ball.destroy()
-            self.stop()
-            self.signal.stopped.emit()
+            count += 1
 
-            if not error.success:
-                self._letter_points = arcade_nuke.utility.draw_game_over(
-                    x=self._field.left_edge + 200,
-                    y=self._field.left_edge + 400
-                )
-            else:
-                self._letter_points = arcade_nuke.utility.draw_win(
-                    x=self._field.left_edge + 250,
-                    y=self._field.left_edge + 250
-                )
+        return count
 
-            self._initialized = False
+    def node(self, index):
+        """Retrieve the node of the brick at *index*."""
+        if not self._alive[index]:
+            raise RuntimeError(
+                "Node 'brick_{}' already destroyed...".format(
+                    self.label(index)
+                )
+            )
 
-    def _setup_field(self):
-        """Initialize game field."""
-        self._field = Field(x=0, y=0, width=47, height=30, padding=10)
+        node = nuke.toNode(self.name(index))
+        if not node:
+            node = self.create_node(index)
 
-        self._paddle = Paddle(
-            x=self._field.center_x - Paddle.width() / 2,
-            y=self._field.bottom_edge - 25,
-        )
+        return node
 
-        self._ball = Ball(
-            x=self._field.center_x,
-            y=self._field.bottom_edge - 40
+    def create_node(self, index):
+        """Create node of the brick at *index*."""
+        node = getattr(nuke.nodes, self.node_class(index))(
+            name=self.name(index),
+            xpos=self._x[index],
+            ypos=self._y[index],
+            hide_input=True
         )
+        node["autolabel"].setValue(self.label(index))
+        return node
 
-    def _check_collision(self):
-        """Indicate whether the *ball* hit one of the game elements.
-        """
-        # Check collision with the wall of the field.
-        if (
-            self._ball.position.x > self._field.right_edge or
-            self._ball.position.x < self._field.left_edge
-        ):
-            self._ball.motion_vector *= arcade_nuke.node.Vector(-1, 1)
-            return
+    def prepare_node(self, index, offset):
+        """Create node of the brick at *index* disabled and out of view.
 
-        if self._ball.position.y < self._field.top_edge:
-            self._ball.motion_vector *= arcade_nuke.node.Vector(1, -1)
-            return
+        The node is revealed by the next :meth:`reset`.
 
-        if self._ball.position.y > self._field.bottom_edge:
-            raise arcade_nuke.base.GameOver()
+        :param index: Index of the brick.
 
-        # Check collision with the bricks.
-        bricks_destroyed = 0
+        :param offset: Instance of :class:`~arcade_nuke.logic.Vector` added
+            to the position of the brick to park the node.
 
-        for brick in self._bricks:
-            if brick.destroyed():
-                bricks_destroyed += 1
-                continue
+        :return: Boolean value indicating whether the node was created.
 
-            push_vector = arcade_nuke.logic.collision(self._ball, brick)
-            if push_vector is not None:
-                self._ball.motion_vector = arcade_nuke.logic.bounce(
-                    self._ball.motion_vector, push_vector
-                )
+        """
+        if self.exists(index):
+            return False
 
-                # Destroy brick
-                brick.destroy()
+        node = self.create_node(index)
+        node.setXYpos(
+            int(self._x[index] + offset.x), int(self._y[index] + offset.y)
+        )
+        arcade_nuke.node.set_disabled(node, True)
 
-        # Raise if all bricks are destroyed.
-        if len(self._bricks) == bricks_destroyed:
-            raise arcade_nuke.base.GameOver(success=True)
+        self._dirty[index] = 1
+        self._parked[index] = 1
+        return True
 
-        # Check collision with the paddle.
-        push_vector = arcade_nuke.logic.collision(self._ball, self._paddle)
-        if push_vector is not None:
-            self._ball.motion_vector = arcade_nuke.logic.bounce(
-                self._ball.motion_vector, push_vector
-            )
+    def delete_node(self, index):
+        """Delete the node of the brick at *index* if it exists."""
+        node = nuke.toNode(self.name(index))
+        if node:
+            nuke.delete(node)
 
+        self._dirty[index] = 1
+        self._parked[index] = 0
 
-class Field(object):
-    """Object managing the field of the game."""
+    def delete_nodes(self):
+        """Delete nodes of all bricks."""
+        for index in range(len(self._alive)):
+            self.delete_node(index)
 
-    def __init__(self, x, y, width, height, padding):
-        """Initialize the field.
+    def exists(self, index):
+        """Indicate whether the node of the brick at *index* exists."""
+        return nuke.toNode(self.name(index)) is not None
 
-        :param x: Position of the left edge of the field on the X axis.
+    def dirty(self, index):
+        """Indicate whether brick at *index* differs from its initial state."""
+        return self._dirty[index] == 1
 
-        :param y: Position of the top edge of the field on the Y axis.
+    def reset(self, force=False):
+        """Reset all bricks.
 
-        :param width: Number of dots to define the width of the field.
+        Only nodes of bricks destroyed since the last reset are updated.
 
-        :param height: Number of dots to define the height of the field.
+        :param force: Indicate whether all nodes should be updated. Default
+            is False.
 
-        :param padding: Padding between each dot defining the limit of the
-            field.
+        :return: Number of nodes updated.
 
         """
-        self._units = []
-
-        # Units representing top wall.
-        for index in range(width):
-            unit = FieldUnit(x + (FieldUnit.width() + padding) * index, y)
-            self._units.append(unit)
+        if force:
+            self._dirty = array.array("b", [1]) * len(self._x)
 
-        # Units representing left wall.
-        for index in range(1, height):
-            unit = FieldUnit(x, y + (FieldUnit.height() + padding) * index)
-            self._units.append(unit)
+        self._alive = array.array("b", [1]) * len(self._x)
+        self._alive_count = len(self._alive)
 
-        # Units representing right wall.
-        for index in range(1, height):
-            unit = FieldUnit(
-                x + (FieldUnit.width() + padding) * (width - 1),
-                y + (FieldUnit.height() + padding) * index
-            )
-            self._units.append(unit)
+        count = 0
 
-        # Units representing bottom wall.
-        for index in range(width):
-            unit = FieldUnit(
-                x + (FieldUnit.width() + padding) * index,
-                y + (FieldUnit.height() + padding) * height
-            )
-            self._units.append(unit)
+        for index in [i for i, dirty in enumerate(self._dirty) if dirty]:
+            self.reset_node(index)
+            count += 1
 
-        # Compute edges.
-        self._top = y + FieldUnit.height()
-        self._left = x + FieldUnit.width()
-        self._right = (
-            x + (FieldUnit.width() + padding) * (width - 1) - FieldUnit.width()
-        )
-        self._bottom = (
-            y + (FieldUnit.height() + padding) * height - FieldUnit.height()
-        )
+        return count
 
-    def reset(self):
-        """Reset field."""
-        for unit in self._units:
-            unit.reset()
+    def dirty_count(self):
+        """Return number of bricks which differ from their initial state."""
+        return sum(self._dirty)
 
-        # Zoom on the field
-        nuke.zoom(0)
+    def reset_state(self):
+        """Reset state of all bricks.
 
-    @property
-    def center_x(self):
-        """Return the middle of the field on the X axis."""
-        return int(self.left_edge + (self.right_edge - self.left_edge) / 2.0)
+        Nodes of all bricks are assumed to exist in Nuke at their initial
+        position.
 
-    @property
-    def right_edge(self):
-        """Return the right edge of the field."""
-        return self._right
+        """
+        self._alive = array.array("b", [1]) * len(self._x)
+        self._alive_count = len(self._alive)
+        self._dirty = array.array("b", [0]) * len(self._x)
+        self._parked = array.array("b", [0]) * len(self._x)
 
-    @property
-    def left_edge(self):
-        """Return the left edge of the field."""
-        return self._left
+    def reset_node(self, index):
+        """Restore the node of the brick at *index* to its initial state."""
+        node = self.node(index)
+        node.setXpos(self._x[index])
+        node.setYpos(self._y[index])
 
-    @property
-    def bottom_edge(self):
-        """Return the bottom edge of the field."""
-        return self._bottom
+        if self._parked[index]:
+            arcade_nuke.node.set_disabled(node, False)
+            self._parked[index] = 0
 
-    @property
-    def top_edge(self):
-        """Return the top edge of the field."""
-        return self._top
+        self._dirty[index] = 0
 
 
-class FieldUnit(arcade_nuke.node.DotNode):
-    """Object managing the field unit."""
+class BrickView(arcade_nuke.node.RectangleNode):
+    """Lightweight view on a brick stored in a :class:`BrickField`."""
 
-    @property
-    def label(self):
-        """Return label of the node."""
-        return "field_unit"
+    def __init__(self, field, index):
+        """Initialize the view.
 
+        :param field: Instance of :class:`BrickField`.
 
-class Ball(arcade_nuke.node.DotNode):
-    """Object managing the ball."""
+        :param index: Index of the brick within the field.
 
-    def __init__(self, x, y):
-        """Initialize the ball.
+        """
+        self._field = field
+        self._index = index
 
-        :param x: Initial position of left corner of the node on the X axis.
+    def width(self):
+        """Return width of the node."""
+        return self._field._width[self._index]
 
-        :param y: Initial position of top corner of the node on the Y axis.
+    def height(self):
+        """Return height of the node."""
+        return self._field._height[self._index]
 
-        """
-        super(Ball, self).__init__(x, y)
-        self.motion_vector = arcade_nuke.node.Vector(1, -3)
+    @property
+    def index(self):
+        """Return index of the brick within the field."""
+        return self._index
 
     @property
     def label(self):
         """Return label of the node."""
-        return "ball"
+        return "brick_{}".format(self._field.label(self._index))
 
-    def move(self):
-        """Move the ball following the motion vector."""
-        node = self.node()
-        node.setXpos(int(round(self.position.x + self.motion_vector.x)))
-        node.setYpos(int(round(self.position.y + self.motion_vector.y)))
+    @property
+    def node_class(self):
+        """Return class of the node."""
+        return self._field.node_class(self._index)
 
-    def reset(self):
-        """Reset node."""
-        super(Ball, self).reset()
+    @property
+    def position(self):
+        """Return current position the node."""
+        return arcade_nuke.node.Vector(
+            self._field._x[self._index], self._field._y[self._index]
+        )
 
-        # Reset motion vector.
-        self.motion_vector = arcade_nuke.node.Vector(1, -3)
+    def destroyed(self):
+        """Indicate whether the node is destroyed."""
+        return not self._field.alive(self._index)
 
+    def destroy(self, deferred=False):
+        """Delete node.
 
-class Paddle(arcade_nuke.node.ViewerNode):
-    """Object managing the paddle."""
+        :param deferred: Indicate whether only the state should be updated,
+            leaving the deletion of the node to :meth:`delete_node`. Default
+            is False.
 
-    @property
-    def label(self):
-        """Return label of the node."""
-        return "paddle"
+        """
+        if not deferred:
+            nuke.delete(self.node())
 
-    def move(self, y, right_edge, left_edge):
-        """Move the paddle on the X axis within the limit of the field.
+        self._field.destroy(self._index)
 
-        Use the position of the cursor to determine the position.
+    def dirty(self):
+        """Indicate whether the node differs from its initial state."""
+        return self._field.dirty(self._index)
 
-        :param y: Position of the paddle on the Y axis.
+    def reset(self, force=False):
+        """Reset node.
 
-        :param right_edge: Maximum position on the X axis.
+        :param force: Indicate whether the node should be updated even if it
+            is not dirty. Default is False.
 
-        :param left_edge: Minimum position on the X axis.
+        :return: Boolean value indicating whether the node was updated.
 
         """
-        cursor = QtGui.QCursor.pos()
+        dirty = force or self.dirty()
+        self._field.restore(self._index)
 
-        node = self.node()
+        if not dirty:
+            return False
 
-        right_edge -= self.width()
-        node.setXpos(min(max(cursor.x(), left_edge), right_edge))
-        node.setYpos(y)
-
-
-class Brick(arcade_nuke.node.RectangleNode):
-    """Object managing a single brick."""
+        self._field.reset_node(self._index)
+        return True
 
-    def __init__(self, x, y, node_class, label):
-        """Initialize the brick.
+    def node(self):
+        """Retrieve the the node."""
+        return self._field.node(self._index)
 
-        :param x: Position of the brick on the X axis.
+    def create_node(self):
+        """Create node."""
+        return self._field.create_node(self._index)
 
-        :param y: Position of the brick on the Y axis.
+    def prepare(self, offset):
+        """Create the node disabled and parked out of view.
 
-        :param node_class: Class of the node to create to represent the brick.
+        :param offset: Instance of :class:`~arcade_nuke.logic.Vector` added
+            to the position of the brick to park the node.
 
-        :param label: Label of the brick.
+        :return: Boolean value indicating whether the node was created.
 
         """
-        super(Brick, self).__init__(x, y)
-        self._node_class = node_class
-        self._label = label
+        return self._field.prepare_node(self._index, offset)
 
-    @property
-    def label(self):
-        """Return label of the node."""
-        return "brick_{}".format(self._label)
-
-    @property
-    def node_class(self):
-        """Return class of the node."""
-        return self._node_class
+    def delete_node(self):
+        """Delete the node if it exists."""
+        self._field.delete_node(self._index)
 
-    def create_node(self):
-        """Create node."""
-        node = super(Brick, self).create_node()
-        node["autolabel"].setValue(self._label)
-        return node
+    def exists(self):
+        """Indicate whether the node exists in Nuke."""
+        return self._field.exists(self._index)
 
 
 def brick_generator1(x, y):
@@ -555,3 +1941,141 @@ def brick_generator3(x, y):
         index += 1
 
     return bricks
+
+
+def procedural_generator(
+    count, density=0.5, clustering=0.0, node_classes=None, seed=0
+):
+    """Return generator drawing a random pattern of *count* bricks.
+
+    Bricks are placed on a grid whose number of cells is deduced from the
+    density. The returned generator has the same signature as
+    :func:`brick_generator1` and records the size of the field fitting the
+    pattern in its *field_size* attribute.
+
+    :param count: Number of bricks to draw.
+
+    :param density: Ratio of grid cells filled with bricks, between 0 and 1.
+        Default is 0.5.
+
+    :param clustering: Probability for each brick to be placed next to a
+        brick already placed instead of in a random cell, between 0 and 1.
+        Default is 0.0.
+
+    :param node_classes: Mapping of node classes with relative weights used
+        to pick the class of each brick. Default is None, which uses the
+        node classes of :func:`brick_generator1` with equal weights.
+
+    :param seed: Value used to seed the pattern. Default is 0.
+
+    """
+    if not 0 < density <= 1:
+        raise ValueError("Density must be between 0 and 1: {}".format(density))
+
+    if node_classes is None:
+        node_classes = collections.OrderedDict(
+            (node_class, 1) for node_class in [
+                "Grade", "Roto", "Glow", "AddMix", "Write", "Shuffle", "Noise"
+            ]
+        )
+
+    # Padding between each brick on both axis.
+    padding_h = 10
+    padding_v = 8
+
+    cell_width = Brick.width() + padding_h
+    cell_height = Brick.height() + padding_v
+
+    # Grid is about 1.6 times wider than high.
+    cells = int(math.ceil(count / float(density)))
+    columns = max(1, int(round(
+        math.sqrt(cells * 1.6 * cell_height / float(cell_width))
+    )))
+    rows = int(math.ceil(cells / float(columns)))
+
+    # Field fits the grid with margins and keeps room below to play. The
+    # distance between two field units is 22 pixels.
+    field_size = (
+        max(47, int(math.ceil((columns * cell_width + 84) / 22.0)) + 1),
+        max(30, int(math.ceil((rows * cell_height + 444) / 22.0)))
+    )
+
+    def generator(x, y):
+        """Draw procedural brick pattern.
+
+        :param x: Position of the left corner of the pattern.
+
+        :param y: Position of the top corner of the pattern.
+
+        :return: Instance of :class:`BrickField`.
+
+        """
+        _random = random.Random(seed)
+
+        names = list(node_classes.keys())
+        cumulative_weights = []
+        total = 0
+
+        for name in names:
+            total += node_classes[name]
+            cumulative_weights.append(total)
+
+        cells = _select_cells(_random, count, columns, rows, clustering)
+
+        bricks = BrickField()
+
+        for index, (row, column) in enumerate(sorted(cells)):
+            weight = _random.random() * total
+            node_class = names[bisect.bisect(cumulative_weights, weight)]
+
+            bricks.add(
+                x + 30 + cell_width * column, y + 20 + cell_height * row,
+                node_class=node_class, label=str(index)
+            )
+
+        return bricks
+
+    generator.__name__ = "procedural_generator_{}_{}".format(count, seed)
+    generator.field_size = field_size
+    return generator
+
+
+def _select_cells(_random, count, columns, rows, clustering):
+    """Return *count* distinct cells of the grid as (row, column) tuples.
+
+    :param _random: Instance of :class:`random.Random`.
+
+    :param count: Number of cells to select.
+
+    :param columns: Number of columns of the grid.
+
+    :param rows: Number of rows of the grid.
+
+    :param clustering: Probability to select a neighbour of a cell already
+        selected instead of a random cell.
+
+    """
+    neighbours = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+    selected = set()
+    cells = []
+
+    while len(cells) < count:
+        if cells and _random.random() < clustering:
+            row, column = cells[_random.randrange(len(cells))]
+            offset_row, offset_column = _random.choice(neighbours)
+            row, column = row + offset_row, column + offset_column
+
+            if not (0 <= row < rows and 0 <= column < columns):
+                continue
+
+        else:
+            row, column = _random.randrange(rows), _random.randrange(columns)
+
+        if (row, column) in selected:
+            continue
+
+        selected.add((row, column))
+        cells.append((row, column))
+
+    return cells
@@ -0,0 +1,245 @@
+# :coding: utf-8
+
+import os
+import struct
+import zlib
+
+import nuke
+
+from arcade_nuke.logic import Vector
+
+
+class Checkpoint(object):
+    """Compact state of a running game.
+
+    The checkpoint records the positions of the paddle and the ball, the
+    motion vector of the ball, the simulated time and the bricks not
+    destroyed as a bitset, so that it only takes a few dozen bytes once
+    serialized. The position of the paddle is rounded to whole pixels.
+
+    """
+
+    #: Identifier of the binary format.
+    MAGIC = b"ANCP"
+
+    #: Version of the binary format.
+    VERSION = 2
+
+    #: Layout of the header and the state preceding the bitset.
+    _format = struct.Struct("<4sBBIiiddddfI")
+
+    def __init__(
+        self, level, paddle, ball, motion_vector, elapsed, bricks, count,
+        fixed_point=False
+    ):
+        """Initialize the checkpoint.
+
+        :param level: Name of the level.
+
+        :param paddle: Position of the paddle as a
+            :class:`~arcade_nuke.logic.Vector` instance.
+
+        :param ball: Position of the ball as a
+            :class:`~arcade_nuke.logic.Vector` instance.
+
+        :param motion_vector: Motion vector of the ball as a
+            :class:`~arcade_nuke.logic.Vector` instance.
+
+        :param elapsed: Simulated time in seconds.
+
+        :param bricks: Bitset of bricks not destroyed, with one bit per
+            brick.
+
+        :param count: Number of bricks in the level.
+
+        :param fixed_point: Indicate whether the ball was simulated with
+            sub-pixel integer units, in which case the motion vector is
+            expressed in these units. Default is False.
+
+        """
+        self._level = level
+        self._paddle = paddle
+        self._ball = ball
+        self._motion_vector = motion_vector
+        self._elapsed = elapsed
+        self._bricks = bytes(bricks)
+        self._count = count
+        self._fixed_point = fixed_point
+
+    @property
+    def level(self):
+        """Return name of the level."""
+        return self._level
+
+    @property
+    def paddle(self):
+        """Return position of the paddle."""
+        return self._paddle
+
+    @property
+    def ball(self):
+        """Return position of the ball."""
+        return self._ball
+
+    @property
+    def motion_vector(self):
+        """Return motion vector of the ball."""
+        return self._motion_vector
+
+    @property
+    def elapsed(self):
+        """Return simulated time in seconds."""
+        return self._elapsed
+
+    @property
+    def bricks(self):
+        """Return bitset of bricks not destroyed."""
+        return self._bricks
+
+    @property
+    def count(self):
+        """Return number of bricks in the level."""
+        return self._count
+
+    @property
+    def fixed_point(self):
+        """Indicate whether the ball was simulated in fixed point."""
+        return self._fixed_point
+
+    def matches(self, level, count, fixed_point=False):
+        """Indicate whether the checkpoint was taken on *level*.
+
+        :param level: Name of the level.
+
+        :param count: Number of bricks in the level.
+
+        :param fixed_point: Indicate whether the ball of the game is
+            simulated with sub-pixel integer units. Default is False.
+
+        """
+        return (
+            level == self._level and count == self._count and
+            fixed_point == self._fixed_point
+        )
+
+    def to_bytes(self):
+        """Return checkpoint serialized as bytes."""
+        return self._format.pack(
+            self.MAGIC, self.VERSION, int(self._fixed_point),
+            _checksum(self._level),
+            int(round(self._paddle.x)), int(round(self._paddle.y)),
+            self._ball.x, self._ball.y,
+            self._motion_vector.x, self._motion_vector.y,
+            self._elapsed, self._count
+        ) + self._bricks
+
+    @classmethod
+    def from_bytes(cls, data, level, fixed_point=False):
+        """Return checkpoint deserialized from *data*.
+
+        :param data: Bytes as returned by :meth:`to_bytes`.
+
+        :param level: Name of the level the checkpoint is expected to be
+            taken on.
+
+        :param fixed_point: Indicate whether the ball of the game is
+            expected to be simulated with sub-pixel integer units. Default
+            is False.
+
+        :raise: :exc:`ValueError` if the data is not a checkpoint of *level*
+            taken in the same simulation mode.
+
+        """
+        size = cls._format.size
+        if len(data) < size:
+            raise ValueError("Data is too short to be a checkpoint.")
+
+        (
+            magic, version, fixed, checksum, paddle_x, paddle_y, ball_x,
+            ball_y, motion_x, motion_y, elapsed, count
+        ) = cls._format.unpack(data[:size])
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Data is not a checkpoint.")
+
+        if checksum != _checksum(level):
+            raise ValueError(
+                "Checkpoint was not taken on level '{}'.".format(level)
+            )
+
+        if bool(fixed) != fixed_point:
+            raise ValueError(
+                "Checkpoint was taken with fixed point {}.".format(
+                    "enabled" if fixed else "disabled"
+                )
+            )
+
+        # Motion vector is expressed in sub-pixel integer units.
+        if fixed_point:
+            motion_x, motion_y = int(motion_x), int(motion_y)
+
+        return cls(
+            level=level,
+            paddle=Vector(paddle_x, paddle_y),
+            ball=Vector(ball_x, ball_y),
+            motion_vector=Vector(motion_x, motion_y),
+            elapsed=elapsed,
+            bricks=data[size:],
+            count=count,
+            fixed_point=fixed_point
+        )
+
+    def save(self, path=None):
+        """Write checkpoint to *path*.
+
+        :param path: Path to the file to write. Default is None, which uses
+            the path returned by :func:`default_path`.
+
+        :return: Path to the file written.
+
+        """
+        path = path or default_path(self._level)
+
+        with open(path, "wb") as stream:
+            stream.write(self.to_bytes())
+
+        return path
+
+    @classmethod
+    def load(cls, level, path=None, fixed_point=False):
+        """Read checkpoint of *level* from *path*.
+
+        :param level: Name of the level.
+
+        :param path: Path to the file to read. Default is None, which uses
+            the path returned by :func:`default_path`.
+
+        :param fixed_point: Indicate whether the ball of the game is
+            expected to be simulated with sub-pixel integer units. Default
+            is False.
+
+        :raise: :exc:`ValueError` if the file is not a checkpoint of *level*
+            taken in the same simulation mode.
+
+        :return: Instance of :class:`Checkpoint`.
+
+        """
+        with open(path or default_path(level), "rb") as stream:
+            return cls.from_bytes(stream.read(), level, fixed_point)
+
+
+def default_path(level):
+    """Return path to the checkpoint of *level* next to the current script.
+
+    :param level: Name of the level.
+
+    :raise: :exc:`RuntimeError` if the script is not saved.
+
+    """
+    root = os.path.splitext(nuke.scriptName())[0]
+    return "{}.{}.checkpoint".format(root, level)
+
+
+def _checksum(level):
+    """Return checksum identifying *level*."""
+    return zlib.crc32(level.encode("utf-8")) & 0xffffffff
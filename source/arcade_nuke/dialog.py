@@ -2,16 +2,45 @@
 
 from PySide2 import QtGui, QtWidgets, QtCore
 
+import arcade_nuke.hud
+import arcade_nuke.profiler
+import arcade_nuke.session
+import arcade_nuke.utility
+
 
 class Player(QtWidgets.QDialog):
 
-    def __init__(self, games, parent=None):
+    def __init__(self, games, parent=None, scheduler=None, arena=None):
         super(Player, self).__init__(parent)
+
+        # Mapping of game names with callbacks creating each game.
         self._games = games
 
+        # Record scheduler driving the games and the dialog if any.
+        self._scheduler = scheduler
+
+        # Record arena owning the field shared by the games if any.
+        self._arena = arena
+
+        # Record session owning the game currently selected.
+        self._session = None
+
+        # Record latest checkpoint of each game supporting them.
+        self._checkpoints = {}
+
+        # Record profiling capture of the current game if any.
+        self._capture = None
+
+        # Record name, game and preparation job of the next game in the list,
+        # whose nodes are created while the current game is not running.
+        self._prepared = None
+
         # Initiate UI and timer.
         self._setup_ui()
         self._game_cbbox.addItems(games.keys())
+        self._game_cbbox.currentIndexChanged.connect(
+            lambda _: self._select_game()
+        )
         self._initiate_btn.clicked.connect(self.initiate_game)
         self._play_btn.clicked.connect(self.start_playing)
         self._stop_btn.clicked.connect(self.stop_playing)
@@ -23,14 +52,31 @@ class Player(QtWidgets.QDialog):
         self.setWindowFlag(QtCore.Qt.WindowStaysOnTopHint)
 
         # Create timer and elapsed timer to display duration.
-        self._duration_timer = QtCore.QTimer()
+        if scheduler is not None:
+            self._duration_timer = scheduler.create_timer(
+                "duration", priority=-1
+            )
+        else:
+            self._duration_timer = QtCore.QTimer()
+
         self._duration_timer.setInterval(1000)
         self._duration_timer.timeout.connect(self._update_time)
 
         self._elapsed_timer = QtCore.QElapsedTimer()
         self._elapsed_timer.start()
 
+        # Create timer sampling the performance of the game at a low rate
+        # while the HUD is visible.
+        if scheduler is not None:
+            self._hud_timer = scheduler.create_timer("hud", priority=-2)
+        else:
+            self._hud_timer = QtCore.QTimer()
+
+        self._hud_timer.setInterval(250)
+        self._hud_timer.timeout.connect(self._update_hud)
+
         # Initiate state.
+        self._open_session()
         self.reset()
 
         # Grab keyboard as long as window is opened.
@@ -38,21 +84,31 @@ class Player(QtWidgets.QDialog):
 
     @property
     def game(self):
-        return self._games[self._game_cbbox.currentText()]
+        return self._session.game
+
+    @property
+    def session(self):
+        return self._session
 
     def reset(self):
         self._duration_timer.stop()
         self._duration_lbl.setText("{0:02}:{0:02}:{0:02}".format(0))
-        self._message_lbl.setText("Press `1` to initialize the game")
+        if self._session.name in self._checkpoints:
+            self._message_lbl.setText(
+                "Press `1` to initialize or `3` to resume the game"
+            )
+        else:
+            self._message_lbl.setText("Press `1` to initialize the game")
 
         self._initiate_btn.setEnabled(True)
         self._play_btn.setEnabled(True)
         self._stop_btn.setEnabled(False)
         self._game_cbbox.setEnabled(True)
 
+        self._prepare_next()
+
     def initiate_game(self):
         self.game.initialize()
-        self.game.signal.stopped.connect(self.reset)
 
         self._message_lbl.setText("Press `2` to start or pause the game")
 
@@ -62,6 +118,10 @@ class Player(QtWidgets.QDialog):
 
         self.game.start()
 
+        # Preparation only runs while the game is not running.
+        if self._prepared is not None:
+            self._prepared[2].stop()
+
         self._duration_timer.start()
         self._elapsed_timer.restart()
 
@@ -75,8 +135,92 @@ class Player(QtWidgets.QDialog):
             return
 
         self.game.stop()
+        self._save_checkpoint()
         self.reset()
 
+    def resume_game(self):
+        checkpoint = self._checkpoints.get(self._session.name)
+        if checkpoint is None or self.game.running():
+            return
+
+        self.game.restore_checkpoint(checkpoint)
+
+        self._message_lbl.setText("Press `2` to start or pause the game")
+
+    def toggle_profiling(self):
+        if self._capture is None:
+            self._capture = arcade_nuke.profiler.Capture(self.game)
+            self._capture.start()
+
+            self._message_lbl.setText("Profiling, press `4` to stop")
+            return
+
+        paths = self._stop_profiling()
+        self._message_lbl.setText(
+            "Profile written to {}".format(paths["pstats"])
+        )
+
+    def _stop_profiling(self):
+        if self._capture is None:
+            return
+
+        paths = self._capture.stop()
+        self._capture = None
+        return paths
+
+    def toggle_hud(self):
+        if self._hud_timer.isActive():
+            self._hud_timer.stop()
+            self._hud_lbl.hide()
+            return
+
+        self._update_hud()
+        self._hud_lbl.show()
+        self._hud_timer.start()
+
+    def _update_hud(self):
+        self._hud_lbl.setText(
+            arcade_nuke.hud.format_performance(self.game.performance())
+        )
+
+    def _prepare_next(self):
+        if self.game.running() or self._game_cbbox.count() < 2:
+            return
+
+        index = (self._game_cbbox.currentIndex() + 1) % (
+            self._game_cbbox.count()
+        )
+        name = self._game_cbbox.itemText(index)
+
+        if self._prepared is not None and self._prepared[0] != name:
+            self._discard_prepared()
+
+        if self._prepared is None:
+            game = self._games[name]()
+            job = arcade_nuke.utility.PreparationJob(game.prepare())
+            self._prepared = (name, game, job)
+
+        self._prepared[2].start()
+
+    def _discard_prepared(self):
+        if self._prepared is None:
+            return
+
+        _, game, job = self._prepared
+        job.stop()
+        game.release()
+
+        self._prepared = None
+
+    def _save_checkpoint(self):
+        if not hasattr(self.game, "checkpoint"):
+            return
+
+        if not self.game.initialized():
+            return
+
+        self._checkpoints[self._session.name] = self.game.checkpoint()
+
     def _update_time(self):
         seconds = self._elapsed_timer.elapsed() / 1000
         minutes = (seconds / 60) % 60
@@ -86,6 +230,10 @@ class Player(QtWidgets.QDialog):
             "{:02}:{:02}:{:02}".format(hours, minutes, seconds % 60)
         )
 
+        # Checkpoints are cheap enough to be taken every few seconds.
+        if int(seconds) % 5 == 0:
+            self._save_checkpoint()
+
     def event(self, event):
         if isinstance(event, QtGui.QKeyEvent):
             if event.key() == QtCore.Qt.Key_Escape:
@@ -103,12 +251,67 @@ class Player(QtWidgets.QDialog):
                 else:
                     self.stop_playing()
 
-        # Release keyboard when exiting window.
+            elif event.key() == QtCore.Qt.Key_3:
+                self.resume_game()
+
+            elif event.key() == QtCore.Qt.Key_4:
+                self.toggle_profiling()
+
+            elif event.key() == QtCore.Qt.Key_5:
+                self.toggle_hud()
+
+        # Release keyboard and all game resources when exiting window.
         if isinstance(event, QtGui.QCloseEvent):
             self.releaseKeyboard()
+            self._close_session()
+            self._discard_prepared()
+            self._duration_timer.stop()
+            self._hud_timer.stop()
+
+            if self._scheduler is not None:
+                self._scheduler.release()
+
+            if self._arena is not None:
+                self._arena.release()
 
         return super(Player, self).event(event)
 
+    def _select_game(self):
+        self._open_session()
+        self.reset()
+
+    def _open_session(self):
+        self._close_session()
+
+        name = self._game_cbbox.currentText()
+
+        # Reuse the game prepared ahead of time if it was selected.
+        if self._prepared is not None and self._prepared[0] == name:
+            _, game, job = self._prepared
+            job.stop()
+            self._prepared = None
+        else:
+            game = self._games[name]()
+
+        self._session = arcade_nuke.session.GameSession(name, game)
+        self._session.connect(self._session.game.signal.stopped, self.reset)
+        self._session.connect(
+            self._session.game.signal.interrupted, self._interrupt
+        )
+
+    def _interrupt(self, reason):
+        self.reset()
+        self._message_lbl.setText(reason)
+
+    def _close_session(self):
+        if self._session is None:
+            return
+
+        self._stop_profiling()
+        self._save_checkpoint()
+        self._session.close()
+        self._session = None
+
     def _setup_ui(self):
         self.setWindowTitle("Arcade Games")
 
@@ -142,3 +345,8 @@ class Player(QtWidgets.QDialog):
         self._duration_lbl = QtWidgets.QLabel(self)
         self._duration_lbl.setMinimumWidth(60)
         layout.addWidget(self._duration_lbl)
+
+        self._hud_lbl = QtWidgets.QLabel(self)
+        self._hud_lbl.setFont(QtGui.QFont("Monospace", 8))
+        self._hud_lbl.hide()
+        layout.addWidget(self._hud_lbl)
@@ -0,0 +1,55 @@
+# :coding: utf-8
+
+#: Characters drawing bars of increasing height in a sparkline.
+BARS = u" ▁▂▃▄▅▆▇█"
+
+
+def sparkline(values, maximum, width=40):
+    """Return latest *values* drawn as a line of bars.
+
+    :param values: List of numbers.
+
+    :param maximum: Value drawn as a full bar. Larger values are clamped.
+
+    :param width: Maximum number of bars. Default is 40.
+
+    """
+    values = values[-width:]
+    if maximum <= 0:
+        return BARS[0] * len(values)
+
+    top = len(BARS) - 1
+    return u"".join(
+        BARS[min(top, int(round(top * value / maximum)))] for value in values
+    )
+
+
+def format_performance(performance, width=40):
+    """Return *performance* of a game as text.
+
+    :param performance: Mapping as returned by
+        :meth:`arcade_nuke.base.BaseGame.performance`.
+
+    :param width: Maximum number of bars in the sparkline. Default is 40.
+
+    :return: Text with the statistics on the first line and the sparkline
+        of tick durations, relative to the frame budget, on the second line.
+
+    """
+    items = [
+        u"{:.0f} tps".format(performance["ticks_per_second"]),
+        u"median {:.1f} ms".format(performance["median"] * 1000),
+        u"worst {:.1f} ms".format(performance["maximum"] * 1000),
+        u"{:.1f} writes/tick".format(performance["writes"]),
+    ]
+
+    for name, value in sorted(performance["game"].items()):
+        if isinstance(value, float):
+            value = u"{:.1f}".format(value)
+
+        items.append(u"{} {}".format(name.replace("_", " "), value))
+
+    return u"{}\n{}".format(
+        u" | ".join(items),
+        sparkline(performance["durations"], performance["budget"], width)
+    )
@@ -0,0 +1,801 @@
+# :coding: utf-8
+
+import array
+import random
+
+from PySide2 import QtGui
+
+import arcade_nuke.base
+import arcade_nuke.breakout
+import arcade_nuke.node
+import arcade_nuke.logic
+import arcade_nuke.utility
+from arcade_nuke.logic import Vector
+
+
+class InvadersGame(arcade_nuke.base.BaseGame):
+    """Object managing all elements of the space invaders game.
+
+    The ship follows the cursor and fires automatically at the formation of
+    invaders, which moves as a whole and fires back from its lowest rows.
+
+    """
+
+    #: Number of seconds between each bullet fired by the ship.
+    ship_fire_interval = 0.4
+
+    #: Number of seconds between each bullet fired by the invaders.
+    invader_fire_interval = 0.8
+
+    #: Speed of bullets fired by the ship in pixels per second.
+    ship_bullet_speed = 400
+
+    #: Speed of bullets fired by the invaders in pixels per second.
+    invader_bullet_speed = 200
+
+    def __init__(
+        self, rows=5, columns=11, seed=None, wall_segments=None, arena=None,
+        **kwargs
+    ):
+        """Initialize the game.
+
+        :param rows: Number of rows in the formation of invaders. Default is
+            5.
+
+        :param columns: Number of columns in the formation of invaders.
+            Default is 11.
+
+        :param seed: Value used to seed the choice of invaders firing, so
+            that games can be replayed. Default is None.
+
+        :param wall_segments: Number of stretched nodes drawing each wall of
+            the field. Default is None, which draws walls with Dot nodes.
+
+        :param arena: Instance of :class:`arcade_nuke.breakout.FieldArena`
+            sharing the field and its nodes with other games. Default is
+            None, which creates a field owned by the game.
+
+        :param kwargs: Keyword arguments passed to
+            :class:`arcade_nuke.base.BaseGame`, such as the simulation and
+            render rates.
+
+        """
+        if kwargs.get("threaded"):
+            raise ValueError(
+                "Invaders cannot be simulated in a worker thread."
+            )
+
+        super(InvadersGame, self).__init__(**kwargs)
+
+        self._seed = seed
+        self._random = random.Random(seed)
+        self._arena = arena
+
+        # Setup elements of game.
+        options = dict(
+            x=0, y=0, width=47, height=30, padding=10, segments=wall_segments
+        )
+
+        if arena is not None:
+            self._field = arena.field(**options)
+        else:
+            self._field = arcade_nuke.breakout.Field(**options)
+
+        self._ship = Ship(
+            x=self._field.center_x - Ship.width() / 2,
+            y=self._field.bottom_edge - 20
+        )
+
+        self._formation = Formation(
+            x=self._field.left_edge + 40,
+            y=self._field.top_edge + 40,
+            rows=rows, columns=columns
+        )
+
+        # Bullets are parked in racks on the right of the field when unused.
+        self._ship_bullets = BulletPool(
+            size=3, x=self._field.right_edge + 40, y=self._field.top_edge
+        )
+        self._invader_bullets = BulletPool(
+            size=6, x=self._field.right_edge + 70, y=self._field.top_edge
+        )
+
+        # Record time remaining before each side can fire again.
+        self._ship_cooldown = 0.0
+        self._invader_cooldown = self.invader_fire_interval
+
+        # Record job drawing the feedback when the game is over.
+        self._drawing = None
+
+        self._initialized = False
+
+    def initialize(self, force=False):
+        """Initialize the game.
+
+        Only nodes which differ from the initial layout are updated, without
+        recording any undo history.
+
+        :param force: Indicate whether all nodes should be updated. Default
+            is False.
+
+        :return: Number of nodes updated.
+
+        """
+        super(InvadersGame, self).initialize()
+
+        if self._drawing is not None:
+            self._drawing.cancel()
+            self._drawing = None
+
+        with arcade_nuke.utility.undo_suppressor:
+            count = self._field.reset(force=force)
+            count += self._ship.reset(force=force)
+            count += self._formation.reset(force=force)
+            count += self._ship_bullets.reset(force=force)
+            count += self._invader_bullets.reset(force=force)
+
+        self._random.seed(self._seed)
+        self._ship_cooldown = 0.0
+        self._invader_cooldown = self.invader_fire_interval
+
+        return count
+
+    def release(self):
+        """Stop the game, release its timer and delete all its nodes."""
+        super(InvadersGame, self).release()
+
+        if self._drawing is not None:
+            self._drawing.cancel()
+            self._drawing = None
+
+        with arcade_nuke.utility.undo_suppressor:
+            # Nodes of a field shared with other games are left to the arena.
+            if self._arena is None:
+                self._field.delete_nodes()
+
+            self._ship.delete_node()
+            self._formation.delete_nodes()
+            self._ship_bullets.delete_nodes()
+            self._invader_bullets.delete_nodes()
+
+    def nodes(self):
+        """Return all nodes managed by the game."""
+        nodes = [self._ship]
+        if self._arena is None:
+            nodes = self._field.units + nodes
+
+        nodes.extend(self._formation.invaders)
+        nodes.extend(self._ship_bullets)
+        nodes.extend(self._invader_bullets)
+
+        if self._drawing is not None:
+            nodes.extend(self._drawing.points)
+
+        return nodes
+
+    def _process(self):
+        """Method called for each tick of the timer."""
+        try:
+            super(InvadersGame, self)._process()
+
+        except arcade_nuke.base.GameOver as error:
+            self._counters["writes"] += self._formation.delete_destroyed()
+            self.stop()
+            self.signal.stopped.emit()
+
+            if not error.success:
+                points = arcade_nuke.utility.iter_game_over(
+                    x=self._field.left_edge + 200,
+                    y=self._field.top_edge + 400
+                )
+            else:
+                points = arcade_nuke.utility.iter_win(
+                    x=self._field.left_edge + 250,
+                    y=self._field.top_edge + 250
+                )
+
+            # Draw feedback over several ticks to keep the UI responsive.
+            self._drawing = arcade_nuke.utility.DrawingJob(
+                points, budget=self._render_step
+            )
+            self._drawing.start()
+
+            self._initialized = False
+
+    def _simulate(self, delta):
+        """Method called for each simulation step of the game.
+
+        :param delta: Duration of the simulation step in seconds.
+
+        """
+        # Move the ship according to the cursor position.
+        self._ship.move(
+            x=self._input,
+            y=self._field.bottom_edge - 20,
+            right_edge=self._field.right_edge,
+            left_edge=self._field.left_edge
+        )
+
+        self._formation.advance(
+            delta,
+            left_edge=self._field.left_edge,
+            right_edge=self._field.right_edge
+        )
+
+        self._fire(delta)
+
+        self._ship_bullets.move(delta)
+        self._invader_bullets.move(delta)
+
+        self._check_collision()
+
+    def _render(self, alpha):
+        """Method called to update the nodes in Nuke.
+
+        :param alpha: Interpolation factor between the previous and the
+            current simulation steps.
+
+        """
+        self._counters["writes"] += self._formation.delete_destroyed()
+
+        # Each position update writes both coordinates of the node.
+        self._counters["writes"] += 2 * self._formation.render(alpha)
+        self._counters["writes"] += 2 * self._ship.render(alpha)
+        self._counters["writes"] += 2 * self._ship_bullets.render(alpha)
+        self._counters["writes"] += 2 * self._invader_bullets.render(alpha)
+
+    def _capture_input(self):
+        """Return position of the cursor on the X axis."""
+        return QtGui.QCursor.pos().x()
+
+    def _frame_telemetry(self):
+        """Return mapping of game values to record for each tick."""
+        return {
+            "invaders": self._formation.alive_count(),
+            "bullets": (
+                len(self._ship_bullets.active()) +
+                len(self._invader_bullets.active())
+            )
+        }
+
+    def _session_telemetry(self):
+        """Return mapping of game values to record for each session."""
+        count = len(self._formation.invaders)
+
+        return {
+            "level": "invaders",
+            "invaders": count,
+            "invaders_destroyed": count - self._formation.alive_count(),
+            "simulation_rate": int(round(1.0 / self._simulation_step)),
+            "render_rate": int(round(1.0 / self._render_step)),
+        }
+
+    def _fire(self, delta):
+        """Fire bullets from the ship and the invaders when ready.
+
+        :param delta: Duration of the simulation step in seconds.
+
+        """
+        self._ship_cooldown -= delta
+        if self._ship_cooldown <= 0:
+            position = self._ship.position + Vector(
+                (Ship.width() - Bullet.width()) / 2, -Bullet.height()
+            )
+            index = self._ship_bullets.fire(
+                position, Vector(0, -self.ship_bullet_speed)
+            )
+            if index is not None:
+                self._ship_cooldown = self.ship_fire_interval
+
+        self._invader_cooldown -= delta
+        if self._invader_cooldown <= 0:
+            columns = self._formation.alive_columns()
+            if len(columns) == 0:
+                return
+
+            index = self._formation.shooter(self._random.choice(columns))
+            position = self._formation.invader_position(index) + Vector(
+                0, Invader.height()
+            )
+            index = self._invader_bullets.fire(
+                position, Vector(0, self.invader_bullet_speed)
+            )
+            if index is not None:
+                self._invader_cooldown = self.invader_fire_interval
+
+    def _check_collision(self):
+        """Resolve collisions of bullets and check whether the game is over.
+        """
+        # Bullets fired by the ship are tested against the formation grid.
+        for index in self._ship_bullets.active():
+            bullet = self._ship_bullets[index]
+
+            if bullet.position.y < self._field.top_edge:
+                self._ship_bullets.release(index)
+                continue
+
+            hit = self._formation.hit(bullet.middle_position, Bullet.radius())
+            if hit is not None:
+                self._formation.destroy(hit)
+                self._ship_bullets.release(index)
+                self._counters["collisions"] += 1
+
+        # Raise if all invaders are destroyed.
+        if self._formation.alive_count() == 0:
+            raise arcade_nuke.base.GameOver(success=True)
+
+        # Raise if the formation reached the ship.
+        if self._formation.bottom_edge >= self._ship.position.y:
+            raise arcade_nuke.base.GameOver()
+
+        # Bullets fired by the invaders are tested against the ship.
+        for index in self._invader_bullets.active():
+            bullet = self._invader_bullets[index]
+
+            if bullet.position.y > self._field.bottom_edge:
+                self._invader_bullets.release(index)
+                continue
+
+            if arcade_nuke.logic.collision(bullet, self._ship) is not None:
+                self._counters["collisions"] += 1
+                raise arcade_nuke.base.GameOver()
+
+
+class Formation(object):
+    """Grid of invaders moving together.
+
+    Invaders are never moved one by one: the formation records a single
+    offset from its initial position, which is written to all nodes alive in
+    one pass when it changes. Collisions are resolved with the grid
+    arithmetic instead of testing each invader.
+
+    """
+
+    def __init__(
+        self, x, y, rows, columns, spacing_x=40, spacing_y=30, speed=30,
+        drop=15
+    ):
+        """Initialize the formation.
+
+        :param x: Initial position of the left corner of the formation on the
+            X axis.
+
+        :param y: Initial position of the top corner of the formation on the
+            Y axis.
+
+        :param rows: Number of rows of invaders.
+
+        :param columns: Number of columns of invaders.
+
+        :param spacing_x: Distance between two columns. Default is 40.
+
+        :param spacing_y: Distance between two rows. Default is 30.
+
+        :param speed: Initial speed of the formation in pixels per second.
+            Default is 30.
+
+        :param drop: Distance travelled on the Y axis each time the formation
+            reaches a wall. Default is 15.
+
+        """
+        self._x = x
+        self._y = y
+        self._rows = rows
+        self._columns = columns
+        self._spacing_x = spacing_x
+        self._spacing_y = spacing_y
+        self._speed = speed
+        self._drop = drop
+
+        self._invaders = [
+            Invader(x + spacing_x * column, y + spacing_y * row, row)
+            for row in range(rows) for column in range(columns)
+        ]
+
+        self._alive = array.array("b", [1]) * len(self._invaders)
+        self._alive_count = len(self._invaders)
+
+        # Record nodes retrieved once per reset to write all positions
+        # without looking them up by name.
+        self._handles = []
+
+        # Record indices of invaders destroyed but not yet deleted in Nuke.
+        self._destroyed = []
+
+        self._reset_motion()
+
+    def _reset_motion(self):
+        """Reset offset, direction and bounds of the formation."""
+        self._current_offset = Vector(0, 0)
+        self._previous_offset = Vector(0, 0)
+        self._rendered_offset = (0, 0)
+        self._direction = 1
+        self._update_bounds()
+
+    def _update_bounds(self):
+        """Record first and last columns and last row with invaders alive."""
+        columns = self.alive_columns()
+        rows = [
+            index // self._columns for index, alive in enumerate(self._alive)
+            if alive
+        ]
+
+        self._first_column = columns[0] if columns else 0
+        self._last_column = columns[-1] if columns else 0
+        self._last_row = rows[-1] if rows else 0
+
+    @property
+    def invaders(self):
+        """Return list of all invaders."""
+        return list(self._invaders)
+
+    @property
+    def offset(self):
+        """Return current offset from the initial position."""
+        return self._current_offset
+
+    @property
+    def bottom_edge(self):
+        """Return bottom edge of the lowest invader alive."""
+        return (
+            self._y + self._current_offset.y +
+            self._spacing_y * self._last_row + Invader.height()
+        )
+
+    def alive(self, index):
+        """Indicate whether invader *index* is alive."""
+        return bool(self._alive[index])
+
+    def alive_count(self):
+        """Return number of invaders alive."""
+        return self._alive_count
+
+    def alive_columns(self):
+        """Return sorted list of columns with at least one invader alive."""
+        return [
+            column for column in range(self._columns)
+            if any(
+                self._alive[row * self._columns + column]
+                for row in range(self._rows)
+            )
+        ]
+
+    def shooter(self, column):
+        """Return index of the lowest invader alive in *column*.
+
+        :return: Index of the invader or None if the column is empty.
+
+        """
+        for row in range(self._rows - 1, -1, -1):
+            index = row * self._columns + column
+            if self._alive[index]:
+                return index
+
+    def invader_position(self, index):
+        """Return current simulated position of invader *index*."""
+        row, column = divmod(index, self._columns)
+
+        return self._current_offset + Vector(
+            self._x + self._spacing_x * column,
+            self._y + self._spacing_y * row
+        )
+
+    def hit(self, point, radius=0):
+        """Return index of invader alive containing *point*.
+
+        The cell is deduced from the position of the point relative to the
+        formation, so that only one invader is tested.
+
+        :param point: Instance of :class:`~arcade_nuke.logic.Vector`.
+
+        :param radius: Radius added around the point. Default is 0.
+
+        :return: Index of the invader or None.
+
+        """
+        x = point.x - self._x - self._current_offset.x + radius
+        y = point.y - self._y - self._current_offset.y + radius
+
+        column = int(x // self._spacing_x)
+        row = int(y // self._spacing_y)
+
+        if not (0 <= column < self._columns and 0 <= row < self._rows):
+            return None
+
+        # Ignore points in the gaps between invaders.
+        if (
+            x - column * self._spacing_x > Invader.width() + 2 * radius or
+            y - row * self._spacing_y > Invader.height() + 2 * radius
+        ):
+            return None
+
+        index = row * self._columns + column
+        if not self._alive[index]:
+            return None
+
+        return index
+
+    def advance(self, delta, left_edge, right_edge):
+        """Move the formation and drop it when reaching a wall.
+
+        The formation accelerates as invaders are destroyed.
+
+        :param delta: Duration of the move in seconds.
+
+        :param left_edge: Minimum position on the X axis.
+
+        :param right_edge: Maximum position on the X axis.
+
+        """
+        ratio = self._alive_count / float(len(self._invaders))
+        step = self._direction * self._speed * (3 - 2 * ratio) * delta
+
+        left = (
+            self._x + self._current_offset.x + step +
+            self._spacing_x * self._first_column
+        )
+        right = (
+            self._x + self._current_offset.x + step +
+            self._spacing_x * self._last_column + Invader.width()
+        )
+
+        self._previous_offset = self._current_offset
+
+        if left < left_edge or right > right_edge:
+            self._direction *= -1
+            self._current_offset += Vector(0, self._drop)
+        else:
+            self._current_offset += Vector(step, 0)
+
+    def destroy(self, index):
+        """Destroy invader *index*, its node is deleted on the next render.
+        """
+        self._alive[index] = 0
+        self._alive_count -= 1
+        self._invaders[index].destroy(deferred=True)
+        self._destroyed.append(index)
+        self._update_bounds()
+
+    def delete_destroyed(self):
+        """Delete nodes of invaders destroyed since the last render.
+
+        :return: Number of nodes deleted.
+
+        """
+        count = len(self._destroyed)
+
+        for index in self._destroyed:
+            self._invaders[index].delete_node()
+
+        del self._destroyed[:]
+        return count
+
+    def render(self, alpha=1.0):
+        """Write interpolated offset to all invaders alive.
+
+        :param alpha: Interpolation factor between the previous and the
+            current offsets. Default is 1.0.
+
+        :return: Number of nodes updated.
+
+        """
+        offset = self._previous_offset + (
+            (self._current_offset - self._previous_offset) * alpha
+        )
+
+        x, y = int(round(offset.x)), int(round(offset.y))
+        if (x, y) == self._rendered_offset:
+            return 0
+
+        count = 0
+
+        for index, node in enumerate(self._handles):
+            if not self._alive[index]:
+                continue
+
+            row, column = divmod(index, self._columns)
+            node.setXpos(self._x + self._spacing_x * column + x)
+            node.setYpos(self._y + self._spacing_y * row + y)
+            count += 1
+
+        self._rendered_offset = (x, y)
+        return count
+
+    def reset(self, force=False):
+        """Reset formation.
+
+        :param force: Indicate whether all invaders should be updated even if
+            they did not change. Default is False.
+
+        :return: Number of invaders updated.
+
+        """
+        # Invaders are all displaced if the formation moved.
+        force = force or self._rendered_offset != (0, 0)
+        count = 0
+
+        for invader in self._invaders:
+            count += invader.reset(force=force)
+
+        self._handles = [invader.node() for invader in self._invaders]
+
+        for index in range(len(self._alive)):
+            self._alive[index] = 1
+
+        self._alive_count = len(self._invaders)
+        del self._destroyed[:]
+
+        self._reset_motion()
+        return count
+
+    def delete_nodes(self):
+        """Delete nodes of all invaders."""
+        for invader in self._invaders:
+            invader.delete_node()
+
+        del self._handles[:]
+        del self._destroyed[:]
+        self._rendered_offset = None
+
+
+class Invader(arcade_nuke.node.DotNode):
+    """Object managing a single invader."""
+
+    #: Colors of each row of invaders, from the top row.
+    colors = [0xff6060ff, 0xffa040ff, 0xffe040ff, 0x60e060ff, 0x60a0ffff]
+
+    def __init__(self, x, y, row):
+        """Initialize the invader.
+
+        :param x: Initial position of the invader on the X axis.
+
+        :param y: Initial position of the invader on the Y axis.
+
+        :param row: Row of the invader in the formation.
+
+        """
+        super(Invader, self).__init__(x, y)
+        self._row = row
+
+    @property
+    def label(self):
+        """Return label of the node."""
+        return "invader"
+
+    def create_node(self):
+        """Create node."""
+        node = super(Invader, self).create_node()
+        node["tile_color"].setValue(self.colors[self._row % len(self.colors)])
+        return node
+
+
+class Ship(arcade_nuke.breakout.Paddle):
+    """Object managing the ship."""
+
+    @property
+    def label(self):
+        """Return label of the node."""
+        return "ship"
+
+
+class Bullet(arcade_nuke.node.DotNode):
+    """Object managing a single bullet."""
+
+    @property
+    def label(self):
+        """Return label of the node."""
+        return "bullet"
+
+    def park(self):
+        """Move the bullet back to its initial position."""
+        self.place(self._position)
+
+
+class BulletPool(object):
+    """Bullets created once and recycled for each shot.
+
+    Unused bullets are parked in a rack outside of the field, so that firing
+    never creates or deletes nodes.
+
+    """
+
+    def __init__(self, size, x, y, padding=8):
+        """Initialize the pool.
+
+        :param size: Number of bullets in the pool.
+
+        :param x: Position of the rack on the X axis.
+
+        :param y: Position of the top of the rack on the Y axis.
+
+        :param padding: Distance between bullets in the rack. Default is 8.
+
+        """
+        self._bullets = [
+            Bullet(x, y + (Bullet.height() + padding) * index)
+            for index in range(size)
+        ]
+        self._velocities = [Vector(0, 0)] * size
+        self._active = array.array("b", [0]) * size
+
+    def __len__(self):
+        """Return number of bullets in the pool."""
+        return len(self._bullets)
+
+    def __getitem__(self, index):
+        """Return bullet *index*."""
+        return self._bullets[index]
+
+    def __iter__(self):
+        """Iterate over all bullets."""
+        return iter(self._bullets)
+
+    def active(self):
+        """Return indices of bullets currently fired."""
+        return [index for index, active in enumerate(self._active) if active]
+
+    def fire(self, position, velocity):
+        """Fire first bullet available from *position*.
+
+        :param position: Instance of :class:`~arcade_nuke.logic.Vector`.
+
+        :param velocity: Velocity of the bullet in pixels per second as a
+            :class:`~arcade_nuke.logic.Vector` instance.
+
+        :return: Index of the bullet fired or None if all bullets are
+            already fired.
+
+        """
+        for index, active in enumerate(self._active):
+            if active:
+                continue
+
+            self._active[index] = 1
+            self._velocities[index] = velocity
+            self._bullets[index].place(position)
+            return index
+
+    def release(self, index):
+        """Park bullet *index* back in the rack."""
+        self._active[index] = 0
+        self._bullets[index].park()
+
+    def move(self, delta):
+        """Move all bullets fired following their velocities.
+
+        :param delta: Duration of the move in seconds.
+
+        """
+        for index in self.active():
+            bullet = self._bullets[index]
+            bullet.move_to(bullet.position + self._velocities[index] * delta)
+
+    def render(self, alpha=1.0):
+        """Write simulated positions to all bullets.
+
+        :param alpha: Interpolation factor between the previous and the
+            current simulated positions. Default is 1.0.
+
+        :return: Number of nodes updated.
+
+        """
+        return sum(bullet.render(alpha) for bullet in self._bullets)
+
+    def reset(self, force=False):
+        """Park all bullets.
+
+        :param force: Indicate whether all bullets should be updated even if
+            they did not change. Default is False.
+
+        :return: Number of bullets updated.
+
+        """
+        for index in range(len(self._active)):
+            self._active[index] = 0
+
+        return sum(bullet.reset(force=force) for bullet in self._bullets)
+
+    def delete_nodes(self):
+        """Delete nodes of all bullets."""
+        for bullet in self._bullets:
+            bullet.delete_node()
@@ -2,6 +2,10 @@
 
 import math
 
+#: Number of sub-pixel units per pixel in fixed-point mode. A power of two
+#: ensures that converted values are represented exactly as floats.
+FIXED_POINT_SCALE = 256
+
 
 def collision(node1, node2, threshold=80):
     """Check collision between two nodes and return collision axis.
@@ -43,12 +47,12 @@ def collision(node1, node2, threshold=80):
 
     # Invert direction if necessary.
     if delta.dot(push_vector) > 0:
-        push_vector *= -1
+        push_vector = push_vector * -1
 
     return push_vector
 
 
-def bounce(motion_vector, push_vector):
+def bounce(motion_vector, push_vector, fixed_point=False):
     """Compute reflected vector after a collision.
 
     :param motion_vector: Instance of incoming :class:`Vector`.
@@ -56,12 +60,87 @@ def bounce(motion_vector, push_vector):
     :param push_vector: Instance of normal push :class:`Vector` as returned by
         :func:`collision`.
 
+    :param fixed_point: Indicate whether *motion_vector* is expressed in
+        sub-pixel integer units, in which case the reflection is computed
+        with integer arithmetic only. Default is False.
+
     :return: Reflected instance of :class:`Vector`.
 
     """
+    if fixed_point:
+        push_vector = to_fixed(push_vector)
+        return motion_vector - fixed_divide(
+            push_vector * (motion_vector.dot(push_vector) * 2),
+            FIXED_POINT_SCALE * FIXED_POINT_SCALE
+        )
+
     return push_vector * motion_vector.dot(push_vector) * -2 + motion_vector
 
 
+def to_fixed(vector):
+    """Convert vector to sub-pixel integer units.
+
+    :param vector: Instance of :class:`Vector`.
+
+    :return: Instance of :class:`Vector` with integer values.
+
+    """
+    return Vector(
+        int(round(vector.x * FIXED_POINT_SCALE)),
+        int(round(vector.y * FIXED_POINT_SCALE))
+    )
+
+
+def from_fixed(vector):
+    """Convert vector from sub-pixel integer units.
+
+    :param vector: Instance of :class:`Vector` with integer values.
+
+    :return: Instance of :class:`Vector`.
+
+    """
+    return Vector(
+        vector.x / float(FIXED_POINT_SCALE),
+        vector.y / float(FIXED_POINT_SCALE)
+    )
+
+
+def quantize(vector):
+    """Round vector to the nearest sub-pixel values.
+
+    :param vector: Instance of :class:`Vector`.
+
+    :return: Instance of :class:`Vector`.
+
+    """
+    return from_fixed(to_fixed(vector))
+
+
+def fixed_divide(vector, divisor):
+    """Divide integer vector rounding to the nearest integer values.
+
+    Halves are rounded away from zero so that the result is symmetric for
+    positive and negative values.
+
+    :param vector: Instance of :class:`Vector` with integer values.
+
+    :param divisor: Positive integer divisor.
+
+    :return: Instance of :class:`Vector` with integer values.
+
+    """
+    values = []
+
+    for value in vector:
+        quotient, remainder = divmod(abs(value), divisor)
+        if remainder * 2 >= divisor:
+            quotient += 1
+
+        values.append(quotient if value >= 0 else -quotient)
+
+    return Vector(*values)
+
+
 class Vector(object):
     """Representation of a Vector."""
 
@@ -184,6 +263,9 @@ class Vector(object):
         self._value = (self / other)._value
         return self
 
+    __truediv__ = __div__
+    __itruediv__ = __idiv__
+
     def __iter__(self):
         """Iterate though vector values.
 
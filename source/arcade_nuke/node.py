@@ -5,6 +5,7 @@ import uuid
 
 import nuke
 
+import arcade_nuke.logic
 from arcade_nuke.logic import Vector
 
 
@@ -25,8 +26,18 @@ class BaseNode(object):
         self._position = Vector(x, y)
         self._motion_vector = Vector(0, 0)
 
+        # Record simulated positions for the current and the previous steps.
+        self._current_position = self._position
+        self._previous_position = self._position
+
+        # Record last position written to the node.
+        self._rendered_position = None
+
         self._destroyed = False
 
+        # Indicate whether the node was created ahead of time out of view.
+        self._parked = False
+
     @staticmethod
     def width():
         """Return width of the node."""
@@ -47,9 +58,8 @@ class BaseNode(object):
 
     @property
     def position(self):
-        """Return current position the node."""
-        node = self.node()
-        return Vector(node.xpos(), node.ypos())
+        """Return current simulated position the node."""
+        return self._current_position
 
     @property
     def motion_vector(self):
@@ -83,13 +93,112 @@ class BaseNode(object):
         """Indicate whether the node is destroyed."""
         return self._destroyed
 
-    def reset(self):
-        """Reset node."""
-        self._destroyed = False
+    def move_to(self, position):
+        """Record new simulated position for the node.
+
+        The node itself is only updated when :meth:`render` is called.
+
+        :param position: Instance of :class:`~arcade_nuke.logic.Vector`.
+
+        """
+        self._previous_position = self._current_position
+        self._current_position = position
+
+    def place(self, position):
+        """Record simulated position without interpolation.
+
+        The node itself is only updated when :meth:`render` is called.
+
+        :param position: Instance of :class:`~arcade_nuke.logic.Vector`.
+
+        """
+        self._previous_position = position
+        self._current_position = position
+
+    def render(self, alpha=1.0):
+        """Write simulated position to the node.
+
+        :param alpha: Interpolation factor between the previous and the
+            current simulated positions. Default is 1.0.
+
+        :return: Boolean value indicating whether the node was updated.
+
+        """
+        return self.update_node(
+            self._previous_position + (
+                (self._current_position - self._previous_position) * alpha
+            )
+        )
+
+    def update_node(self, position):
+        """Write *position* to the node if it differs from the last one.
+
+        :param position: Instance of :class:`~arcade_nuke.logic.Vector`.
+
+        :return: Boolean value indicating whether the node was updated.
+
+        """
+        x, y = int(round(position.x)), int(round(position.y))
+        if (x, y) == self._rendered_position:
+            return False
 
         node = self.node()
-        node.setXpos(self._position.x)
-        node.setYpos(self._position.y)
+        node.setXpos(x)
+        node.setYpos(y)
+
+        self._rendered_position = (x, y)
+        return True
+
+    def dirty(self):
+        """Indicate whether the node differs from its initial state.
+
+        A node is dirty when it has been destroyed or moved since the last
+        reset, or when it has never been reset.
+
+        """
+        return self._destroyed or (
+            self._rendered_position != (self._position.x, self._position.y)
+        )
+
+    def reset(self, force=False):
+        """Reset node.
+
+        Only the simulated state is reset when the node does not differ from
+        its initial state.
+
+        :param force: Indicate whether the node should be updated even if it
+            is not dirty. Default is False.
+
+        :return: Boolean value indicating whether the node was updated.
+
+        """
+        dirty = force or self.dirty()
+
+        self._destroyed = False
+
+        if dirty:
+            node = self.node()
+            node.setXpos(self._position.x)
+            node.setYpos(self._position.y)
+
+            if self._parked:
+                set_disabled(node, False)
+
+        self.reset_state()
+        return dirty
+
+    def reset_state(self):
+        """Reset simulated state of the node.
+
+        The node is assumed to exist in Nuke at its initial position.
+
+        """
+        self._destroyed = False
+        self._parked = False
+
+        self._current_position = self._position
+        self._previous_position = self._position
+        self._rendered_position = (self._position.x, self._position.y)
 
     def node(self):
         """Retrieve the the node."""
@@ -115,12 +224,60 @@ class BaseNode(object):
         node["autolabel"].setValue("' '")
         return node
 
-    def destroy(self):
-        """Delete node."""
-        node = self.node()
-        nuke.delete(node)
+    def prepare(self, offset):
+        """Create the node ahead of time, disabled and parked out of view.
+
+        The node is revealed by the next :meth:`reset`, which moves it to its
+        initial position and enables it.
+
+        :param offset: Instance of :class:`~arcade_nuke.logic.Vector` added
+            to the initial position to park the node.
+
+        :return: Boolean value indicating whether the node was created.
+
+        """
+        if self.exists():
+            return False
+
+        x = int(self._position.x + offset.x)
+        y = int(self._position.y + offset.y)
+
+        node = self.create_node()
+        node.setXYpos(x, y)
+        set_disabled(node, True)
+
+        self._rendered_position = (x, y)
+        self._parked = True
+        return True
+
+    def destroy(self, deferred=False):
+        """Delete node.
+
+        :param deferred: Indicate whether only the simulation state should be
+            updated, leaving the deletion of the node to
+            :meth:`delete_node`. Default is False.
+
+        """
+        if not deferred:
+            node = self.node()
+            nuke.delete(node)
+
         self._destroyed = True
 
+    def delete_node(self):
+        """Delete the node if it exists."""
+        node = nuke.toNode(self._name)
+        if node:
+            nuke.delete(node)
+
+        # The node will have to be created again on the next reset.
+        self._rendered_position = None
+        self._parked = False
+
+    def exists(self):
+        """Indicate whether the node exists in Nuke."""
+        return nuke.toNode(self._name) is not None
+
 
 class DotNode(BaseNode):
     """Representation of a Dot node."""
@@ -235,6 +392,29 @@ class RectangleNode(PolygonNode):
 class ViewerNode(PolygonNode):
     """Representation of a Viewer node."""
 
+    #: Normals computed once from the bevelled edges of the node.
+    _normals = [Vector(0, 1)] + [
+        diagonal.unit_vector()
+        for diagonal in [Vector(8.5, 20), Vector(-8.5, 20)]
+    ]
+
+    #: Normals rounded to sub-pixel values for fixed-point physics.
+    _fixed_normals = [arcade_nuke.logic.quantize(_n) for _n in _normals]
+
+    def __init__(self, x, y, fixed_point=False):
+        """Initialise node.
+
+        :param x: Initial position of left corner of the node on the X axis.
+
+        :param y: Initial position of top corner of the node on the Y axis.
+
+        :param fixed_point: Indicate whether normals should be rounded to
+            sub-pixel values for fixed-point physics. Default is False.
+
+        """
+        super(ViewerNode, self).__init__(x, y)
+        self._fixed_point = fixed_point
+
     @staticmethod
     def width():
         """Return width of the node."""
@@ -258,11 +438,10 @@ class ViewerNode(PolygonNode):
     @property
     def normals(self):
         """Return normals."""
-        normals = [Vector(0, 1)]
-        for diagonal in [Vector(8.5, 20), Vector(-8.5, 20)]:
-            normals.append(diagonal / abs(diagonal))
+        if self._fixed_point:
+            return list(self._fixed_normals)
 
-        return normals
+        return list(self._normals)
 
     @property
     def vertices(self):
@@ -281,3 +460,16 @@ class ViewerNode(PolygonNode):
             _position + Vector(self.width(), self.height() / 2.0),
             _position + Vector(self.width() - bevel, 0),
         ]
+
+
+def set_disabled(node, value):
+    """Set the disable knob of *node* to *value* if the node has one.
+
+    :param node: Nuke node.
+
+    :param value: Boolean value indicating whether the node is disabled.
+
+    """
+    knob = node.knob("disable")
+    if knob is not None:
+        knob.setValue(value)
@@ -0,0 +1,168 @@
+# :coding: utf-8
+
+import cProfile
+import collections
+import json
+import os
+import pstats
+import tempfile
+import time
+import timeit
+
+import nuke
+
+
+class Capture(object):
+    """Profile ticks of a game until the capture is stopped.
+
+    Stopping the capture writes the statistics in a ``.pstats`` file, the
+    call stacks in the collapsed format used to generate flame graphs and a
+    JSON file recording the number of nodes in the script and the settings
+    of the game.
+
+    """
+
+    def __init__(self, game, directory=None):
+        """Initialize the capture.
+
+        :param game: Instance of :class:`arcade_nuke.base.BaseGame`.
+
+        :param directory: Path to the directory where files are written.
+            Default is None, which uses the temporary directory.
+
+        """
+        self._game = game
+        self._directory = directory or tempfile.gettempdir()
+
+        self._profiler = None
+        self._start = None
+        self._metadata = None
+
+    def active(self):
+        """Indicate whether ticks are being profiled."""
+        return self._profiler is not None
+
+    def start(self):
+        """Start profiling ticks of the game."""
+        if self._profiler is not None:
+            return
+
+        # Record the script before profiling so that it is not included.
+        self._metadata = {
+            "nuke_version": nuke.NUKE_VERSION_STRING,
+            "script_nodes": len(nuke.allNodes()),
+            "settings": self._game.settings(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+
+        self._profiler = cProfile.Profile()
+        self._game.profile(self._profiler)
+        self._start = timeit.default_timer()
+
+    def stop(self):
+        """Stop profiling ticks of the game and write the files.
+
+        :return: Mapping with the paths to the "pstats", "collapsed" and
+            "metadata" files written, or None if the capture was not
+            started.
+
+        """
+        if self._profiler is None:
+            return
+
+        self._game.profile(None)
+        profiler, self._profiler = self._profiler, None
+
+        metadata = dict(
+            self._metadata, duration=timeit.default_timer() - self._start
+        )
+
+        root = os.path.join(
+            self._directory, "arcade_nuke_{}_{}".format(
+                metadata["settings"]["game"],
+                time.strftime("%Y%m%d_%H%M%S")
+            )
+        )
+
+        paths = {
+            "pstats": root + ".pstats",
+            "collapsed": root + ".collapsed.txt",
+            "metadata": root + ".json",
+        }
+
+        profiler.dump_stats(paths["pstats"])
+        stats = pstats.Stats(paths["pstats"])
+
+        with open(paths["collapsed"], "w") as stream:
+            for stack, value in sorted(collapse(stats).items()):
+                stream.write("{} {}\n".format(stack, value))
+
+        with open(paths["metadata"], "w") as stream:
+            json.dump(metadata, stream, indent=4, sort_keys=True)
+
+        return paths
+
+
+def collapse(stats, maximum_depth=64):
+    """Return call stacks of *stats* in the collapsed format.
+
+    Profiles only record the time spent by each function and by each pair
+    of caller and callee, so the time of a function within a stack is
+    estimated from the share of its caller time spent in this stack.
+    Recursive calls are not followed.
+
+    :param stats: Instance of :class:`pstats.Stats`.
+
+    :param maximum_depth: Maximum number of functions within a stack.
+        Default is 64.
+
+    :return: Mapping of stacks, with function names separated by
+        semicolons, with the time spent in the last function in
+        microseconds.
+
+    """
+    callees = collections.defaultdict(dict)
+
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller, values in callers.items():
+            callees[caller][function] = values
+
+    result = collections.Counter()
+
+    def _walk(function, stack, total):
+        """Attribute *total* time of *function* to *stack* and callees."""
+        cumulative = stats.stats[function][3]
+        share = total / cumulative if cumulative else 0.0
+        children = 0.0
+
+        if len(stack) < maximum_depth:
+            for callee, values in callees[function].items():
+                name = _label(callee)
+                if name in stack:
+                    continue
+
+                duration = values[3] * share
+                children += duration
+                _walk(callee, stack + (name,), duration)
+
+        value = int(round((total - children) * 1e6))
+        if value > 0:
+            result[";".join(stack)] += value
+
+    for function, values in stats.stats.items():
+        if len(values[4]) == 0:
+            _walk(function, (_label(function),), values[3])
+
+    return dict(result)
+
+
+def _label(function):
+    """Return label of *function* within a collapsed stack."""
+    path, line, name = function
+
+    if path == "~":
+        label = name
+    else:
+        label = "{} ({}:{})".format(name, os.path.basename(path), line)
+
+    return label.replace(";", ",")
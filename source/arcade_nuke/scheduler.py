@@ -0,0 +1,282 @@
+# :coding: utf-8
+
+import logging
+import timeit
+
+from PySide2 import QtCore
+
+#: Logger recording errors raised by consumers of the scheduler.
+_logger = logging.getLogger(__name__)
+
+
+class TickScheduler(object):
+    """Drive several consumers from a single timer.
+
+    Games and UI elements create :class:`ScheduledTimer` instances instead of
+    Qt timers. On each tick of the scheduler, all timers which are due are
+    triggered one after the other, from the highest priority to the lowest
+    and in order of creation for equal priorities, and the time spent by
+    each of them is recorded.
+
+    """
+
+    def __init__(self):
+        """Initialize the scheduler."""
+        self._timers = []
+
+        # The timer is triggered at the shortest interval of active timers.
+        self._timer = QtCore.QTimer()
+        self._timer.timeout.connect(self._process)
+        self._interval = None
+
+    def create_timer(self, name, priority=0):
+        """Return new timer driven by the scheduler.
+
+        :param name: Name of the consumer in statistics.
+
+        :param priority: Timers with a higher priority are triggered first
+            on each tick. Default is 0.
+
+        :return: Instance of :class:`ScheduledTimer`.
+
+        """
+        timer = ScheduledTimer(self, name, priority)
+        self._timers.append(timer)
+
+        # Sorting is stable, which preserves the order of creation.
+        self._timers.sort(key=lambda _timer: -_timer.priority)
+        return timer
+
+    @property
+    def timers(self):
+        """Return timers in the order they are triggered."""
+        return list(self._timers)
+
+    @property
+    def interval(self):
+        """Return current interval of the scheduler in milliseconds."""
+        return self._interval
+
+    def statistics(self):
+        """Return time spent by each timer.
+
+        :return: List of tuples containing the name of the timer and a
+            mapping with the number of calls, the total, mean and maximum
+            durations in seconds.
+
+        """
+        return [(timer.name, timer.statistics()) for timer in self._timers]
+
+    def reset_statistics(self):
+        """Reset time spent by each timer."""
+        for timer in self._timers:
+            timer.reset_statistics()
+
+    def release(self):
+        """Stop all timers and release the scheduler timer."""
+        for timer in self.timers:
+            timer.deleteLater()
+
+        self._timer.stop()
+        self._timer.timeout.disconnect(self._process)
+        self._timer.deleteLater()
+
+    def _remove(self, timer):
+        """Stop driving *timer*."""
+        if timer in self._timers:
+            self._timers.remove(timer)
+
+        self._update()
+
+    def _update(self):
+        """Adjust the scheduler timer to the active timers."""
+        intervals = [
+            timer.interval() for timer in self._timers if timer.isActive()
+        ]
+
+        if len(intervals) == 0:
+            self._timer.stop()
+            self._interval = None
+            return
+
+        interval = min(intervals)
+
+        if interval != self._interval:
+            self._timer.setInterval(interval)
+            self._timer.start()
+            self._interval = interval
+
+    def _process(self):
+        """Trigger all timers which are due in a deterministic order.
+
+        Errors raised by the callbacks of a timer are logged.
+
+        """
+        now = timeit.default_timer()
+
+        # Tolerate timers being due slightly after the scheduler tick.
+        tolerance = (self._interval or 0) / 2000.0
+
+        for timer in self.timers:
+            if timer.isActive() and timer.due - tolerance <= now:
+                # An error raised by one consumer must not prevent the
+                # following ones from being triggered.
+                try:
+                    timer.trigger(now)
+                except Exception:
+                    _logger.exception(
+                        "Timer '{}' raised an error.".format(timer.name)
+                    )
+
+
+class ScheduledTimer(object):
+    """Timer driven by :class:`TickScheduler`.
+
+    The timer exposes the same interface as the Qt timers used by the games
+    and the dialog.
+
+    """
+
+    def __init__(self, scheduler, name, priority):
+        """Initialize the timer.
+
+        :param scheduler: Instance of :class:`TickScheduler`.
+
+        :param name: Name of the consumer in statistics.
+
+        :param priority: Priority of the timer within the scheduler.
+
+        """
+        self._scheduler = scheduler
+        self._name = name
+        self._priority = priority
+
+        self._interval = 0
+        self._active = False
+        self._due = None
+
+        self.timeout = Callbacks()
+        self.reset_statistics()
+
+    @property
+    def name(self):
+        """Return name of the timer."""
+        return self._name
+
+    @property
+    def priority(self):
+        """Return priority of the timer."""
+        return self._priority
+
+    @property
+    def due(self):
+        """Return time when the timer will be triggered next."""
+        return self._due
+
+    def interval(self):
+        """Return interval of the timer in milliseconds."""
+        return self._interval
+
+    def setInterval(self, interval):
+        """Set interval of the timer in milliseconds."""
+        self._interval = interval
+
+        if self._active:
+            self._due = timeit.default_timer() + interval / 1000.0
+
+        self._scheduler._update()
+
+    def isActive(self):
+        """Indicate whether the timer is started."""
+        return self._active
+
+    def start(self):
+        """Start the timer."""
+        self._active = True
+        self._due = timeit.default_timer() + self._interval / 1000.0
+        self._scheduler._update()
+
+    def stop(self):
+        """Stop the timer."""
+        self._active = False
+        self._scheduler._update()
+
+    def deleteLater(self):
+        """Stop the timer and remove it from the scheduler."""
+        self._active = False
+        self._scheduler._remove(self)
+
+    def statistics(self):
+        """Return number of calls and durations of the timer in seconds."""
+        return {
+            "calls": self._calls,
+            "total": self._total,
+            "mean": self._total / self._calls if self._calls else 0.0,
+            "maximum": self._maximum,
+        }
+
+    def reset_statistics(self):
+        """Reset number of calls and durations of the timer."""
+        self._calls = 0
+        self._total = 0.0
+        self._maximum = 0.0
+
+    def trigger(self, now):
+        """Call all callbacks connected to the timer.
+
+        :param now: Time of the scheduler tick in seconds.
+
+        """
+        # Missed intervals are dropped instead of triggered in a burst.
+        self._due += self._interval / 1000.0
+        if self._due <= now:
+            self._due = now + self._interval / 1000.0
+
+        start = timeit.default_timer()
+
+        try:
+            self.timeout.emit()
+
+        finally:
+            duration = timeit.default_timer() - start
+            self._calls += 1
+            self._total += duration
+            self._maximum = max(self._maximum, duration)
+
+
+class Callbacks(object):
+    """List of callbacks with the interface of a Qt signal."""
+
+    def __init__(self):
+        """Initialize the list."""
+        self._callbacks = []
+
+    def connect(self, callback):
+        """Call *callback* when the signal is emitted."""
+        self._callbacks.append(callback)
+
+    def disconnect(self, callback):
+        """Stop calling *callback* when the signal is emitted."""
+        self._callbacks.remove(callback)
+
+    def emit(self, *args):
+        """Call all callbacks with *args*."""
+        for callback in list(self._callbacks):
+            callback(*args)
+
+
+def format_statistics(statistics):
+    """Return *statistics* of :meth:`TickScheduler.statistics` as text."""
+    total = sum(values["total"] for _, values in statistics) or 1.0
+
+    lines = ["{:<24}{:>8}{:>12}{:>12}{:>8}".format(
+        "consumer", "calls", "mean", "maximum", "share"
+    )]
+
+    for name, values in statistics:
+        lines.append("{:<24}{:>8}{:>10.2f}ms{:>10.2f}ms{:>7.0f}%".format(
+            name, values["calls"], values["mean"] * 1000,
+            values["maximum"] * 1000, 100 * values["total"] / total
+        ))
+
+    return "\n".join(lines)
@@ -0,0 +1,254 @@
+# :coding: utf-8
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+#: Logger recording records which could not be inserted.
+_logger = logging.getLogger(__name__)
+
+#: Schema of the database, with indices matching the queries of the store.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS session (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    machine TEXT,
+    nuke_version TEXT,
+    game TEXT,
+    level TEXT NOT NULL,
+    won INTEGER,
+    duration REAL,
+    destroyed INTEGER,
+    ticks INTEGER,
+    tick_mean REAL,
+    tick_max REAL
+);
+CREATE INDEX IF NOT EXISTS session_leaderboard
+    ON session (level, won DESC, destroyed DESC, duration);
+CREATE INDEX IF NOT EXISTS session_trend
+    ON session (machine, level, time);
+"""
+
+_INSERT = (
+    "INSERT INTO session (time, machine, nuke_version, game, level, won, "
+    "duration, destroyed, ticks, tick_mean, tick_max) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class ScoreStore(object):
+    """Record results and performance of each session in a SQLite file.
+
+    Records are queued and inserted by a background thread in batched
+    transactions, so that recording never blocks the game on disk access.
+
+    """
+
+    def __init__(self, path=None, context=None, batch_interval=1.0):
+        """Initialize the store and start the writer thread.
+
+        :param path: Path to the SQLite file. Default is None, which uses
+            the path returned by :func:`default_path`.
+
+        :param context: Mapping added to each record, such as the Nuke
+            version or the name of the machine. Default is None.
+
+        :param batch_interval: Number of seconds between each batch of
+            inserts. Default is 1.0.
+
+        """
+        self._path = path or default_path()
+        self._context = context or {}
+        self._batch_interval = batch_interval
+
+        directory = os.path.dirname(self._path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        connection = self._connect()
+        try:
+            connection.executescript(_SCHEMA)
+        finally:
+            connection.close()
+
+        self._queue = queue.Queue()
+        self._closed = threading.Event()
+
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def path(self):
+        """Return path to the SQLite file."""
+        return self._path
+
+    def record(self, record):
+        """Queue session summary *record* to be inserted.
+
+        :param record: Mapping with the "level" or "game", the "outcome" of
+            the session, its "duration", the number of "ticks", the
+            "tick_mean" and "tick_max" durations and the number of elements
+            destroyed under keys ending with "_destroyed".
+
+        """
+        summary = dict(self._context)
+        summary.update(record)
+        summary.setdefault("time", time.time())
+        self._queue.put(summary)
+
+    def flush(self):
+        """Wait until all queued records are inserted."""
+        self._queue.join()
+
+    def close(self):
+        """Stop the writer thread once queued records are inserted."""
+        if self._closed.is_set():
+            return
+
+        self._closed.set()
+        self._thread.join()
+
+    def leaderboard(self, level, limit=10):
+        """Return best finished sessions of *level*.
+
+        Sessions won come first, then sessions which destroyed the most
+        elements, then the shortest ones.
+
+        :param level: Name of the level.
+
+        :param limit: Maximum number of sessions returned. Default is 10.
+
+        :return: List of mappings.
+
+        """
+        return self._query(
+            "SELECT time, machine, won, duration, destroyed FROM session "
+            "WHERE level = ? AND won IS NOT NULL "
+            "ORDER BY won DESC, destroyed DESC, duration LIMIT ?",
+            (level, limit)
+        )
+
+    def performance_trend(self, machine, level):
+        """Return tick durations of *level* on *machine* for each day.
+
+        :param machine: Name of the machine.
+
+        :param level: Name of the level.
+
+        :return: List of mappings with the "day", the number of "sessions",
+            the mean duration of ticks as "tick_mean" and the longest one as
+            "tick_max", in seconds.
+
+        """
+        return self._query(
+            "SELECT date(time, 'unixepoch') AS day, "
+            "COUNT(*) AS sessions, "
+            "SUM(tick_mean * ticks) / SUM(ticks) AS tick_mean, "
+            "MAX(tick_max) AS tick_max "
+            "FROM session WHERE machine = ? AND level = ? "
+            "GROUP BY day ORDER BY day",
+            (machine, level)
+        )
+
+    def _connect(self):
+        """Return new connection to the SQLite file."""
+        return sqlite3.connect(self._path, timeout=10.0)
+
+    def _query(self, statement, parameters):
+        """Return rows of *statement* as mappings."""
+        connection = self._connect()
+        connection.row_factory = sqlite3.Row
+
+        try:
+            return [
+                dict(zip(row.keys(), row))
+                for row in connection.execute(statement, parameters)
+            ]
+        finally:
+            connection.close()
+
+    def _run(self):
+        """Insert queued records in batches until the store is closed."""
+        connection = self._connect()
+
+        try:
+            while True:
+                closed = self._closed.wait(self._batch_interval)
+
+                records = []
+                while True:
+                    try:
+                        records.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                if len(records) > 0:
+                    self._write(connection, records)
+
+                if closed:
+                    break
+
+        finally:
+            connection.close()
+
+    def _write(self, connection, records):
+        """Insert *records* in a single transaction.
+
+        Errors are logged, so that the writer thread keeps inserting the
+        following records.
+
+        """
+        try:
+            with connection:
+                connection.executemany(
+                    _INSERT, [_row(record) for record in records]
+                )
+
+        # Results are not worth interrupting the game for.
+        except Exception:
+            _logger.exception(
+                "Failed to insert {} session records in '{}'.".format(
+                    len(records), self._path
+                )
+            )
+
+        finally:
+            for _ in records:
+                self._queue.task_done()
+
+
+def default_path():
+    """Return path to the SQLite file in the Nuke directory of the user."""
+    return os.path.join(
+        os.path.expanduser("~"), ".nuke", "arcade_nuke", "scores.sqlite"
+    )
+
+
+def _row(record):
+    """Return values of *record* in the order of the session columns."""
+    outcome = record.get("outcome")
+
+    return (
+        record["time"],
+        record.get("machine"),
+        record.get("nuke_version"),
+        record.get("game"),
+        record.get("level", record.get("game")),
+        {"won": 1, "lost": 0}.get(outcome),
+        record.get("duration"),
+        sum(
+            value for key, value in record.items()
+            if key.endswith("_destroyed")
+        ),
+        record.get("ticks"),
+        record.get("tick_mean"),
+        record.get("tick_max"),
+    )
@@ -0,0 +1,99 @@
+# :coding: utf-8
+
+
+class GameSession(object):
+    """Object owning all resources acquired while playing a game.
+
+    The session records signal connections made on behalf of the game so
+    that closing it disconnects them, stops the game timer and deletes all
+    nodes created by the game, including the game over drawing.
+
+    """
+
+    #: Number of sessions created and not yet closed.
+    _open_count = 0
+
+    def __init__(self, name, game):
+        """Initialize the session.
+
+        :param name: Name of the game.
+
+        :param game: Instance of :class:`arcade_nuke.base.BaseGame`.
+
+        """
+        self._name = name
+        self._game = game
+        self._connections = []
+        self._closed = False
+
+        GameSession._open_count += 1
+
+    @classmethod
+    def open_count(cls):
+        """Return number of sessions not yet closed."""
+        return cls._open_count
+
+    @property
+    def name(self):
+        """Return name of the game."""
+        return self._name
+
+    @property
+    def game(self):
+        """Return game owned by the session."""
+        return self._game
+
+    def closed(self):
+        """Indicate whether the session is closed."""
+        return self._closed
+
+    def connect(self, signal, slot):
+        """Connect *signal* to *slot* for the lifetime of the session.
+
+        :param signal: Qt signal to connect.
+
+        :param slot: Callable to connect to the signal.
+
+        """
+        signal.connect(slot)
+        self._connections.append((signal, slot))
+
+    def connection_count(self):
+        """Return number of signal connections owned by the session."""
+        return len(self._connections)
+
+    def node_count(self):
+        """Return number of nodes of the game existing in Nuke."""
+        return sum(1 for node in self._game.nodes() if node.exists())
+
+    def leaks(self):
+        """Return resources still held by the session.
+
+        :return: Dictionary with number of open sessions, signal
+            connections and nodes existing in Nuke.
+
+        """
+        return {
+            "sessions": GameSession.open_count(),
+            "connections": self.connection_count(),
+            "nodes": self.node_count(),
+        }
+
+    def close(self):
+        """Release all resources owned by the session."""
+        if self._closed:
+            return
+
+        # The session is closed even if releasing a resource failed, so
+        # that it is neither counted as open nor released twice.
+        try:
+            for signal, slot in self._connections:
+                signal.disconnect(slot)
+
+            del self._connections[:]
+
+            self._game.release()
+
+        finally:
+            self._closed = True
+            GameSession._open_count -= 1
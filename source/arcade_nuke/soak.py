@@ -0,0 +1,207 @@
+# :coding: utf-8
+
+import collections
+import gc
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+import nuke
+
+import arcade_nuke.benchmark
+import arcade_nuke.utility
+
+
+#: Resources measured after some rounds of a soak run.
+Sample = collections.namedtuple(
+    "Sample", ["round", "nuke_nodes", "game_nodes", "memory", "objects"]
+)
+
+
+def run(game, rounds=100, steps=1200, interval=10, frames=5, limit=10):
+    """Play *game* repeatedly and report resources which keep growing.
+
+    Each round initializes the game and plays it for a number of simulation
+    steps. Resources are sampled when the first round is initialized, then
+    every *interval* rounds and for the last round. Enable the autopilot of
+    the game to play beyond the first miss.
+
+    This function must be run within Nuke.
+
+    :param game: Instance of :class:`arcade_nuke.breakout.BreakoutGame`.
+
+    :param rounds: Number of rounds to play. Default is 100.
+
+    :param steps: Number of simulation steps played for each round. Default
+        is 1200.
+
+    :param interval: Number of rounds between each sample. Default is 10.
+
+    :param frames: Number of frames recorded for each allocation traced
+        with :mod:`tracemalloc`. Default is 5.
+
+    :param limit: Maximum number of allocation sites reported. Default is
+        10.
+
+    :return: Mapping with the list of :class:`Sample` instances, the growth
+        of each resource as returned by :func:`growth` and the allocation
+        sites which grew the most between the first and the last samples.
+
+    """
+    tracing = tracemalloc is not None and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start(frames)
+
+    samples = []
+    snapshots = []
+
+    try:
+        for index in range(1, rounds + 1):
+            # Nodes are updated without undo history, as in the game loop,
+            # so that the run does not measure the growth of the history.
+            with arcade_nuke.utility.undo_suppressor:
+                game.initialize()
+
+                # Sample once the game is initialized, so that nodes
+                # destroyed during the round do not hide the growth.
+                if index == 1 or index % interval == 0 or index == rounds:
+                    gc.collect()
+                    samples.append(_sample(index, game))
+
+                    if tracemalloc is not None and tracemalloc.is_tracing():
+                        snapshots.append(_snapshot())
+
+                arcade_nuke.benchmark.play(game, steps)
+
+    finally:
+        if tracing:
+            tracemalloc.stop()
+
+    allocations = []
+
+    if len(snapshots) > 1:
+        statistics = snapshots[-1].compare_to(snapshots[0], "traceback")
+        allocations = [
+            (statistic.traceback.format(), statistic.size_diff,
+             statistic.count_diff)
+            for statistic in statistics if statistic.size_diff > 0
+        ][:limit]
+
+    return {
+        "samples": samples,
+        "growth": growth(samples),
+        "allocations": allocations,
+    }
+
+
+def growth(samples):
+    """Return resources which grew between the first and the last samples.
+
+    :param samples: List of :class:`Sample` instances.
+
+    :return: Mapping of resource names with tuples containing the first and
+        the last values and whether the value never decreased between
+        samples, sorted by decreasing growth.
+
+    """
+    series = collections.OrderedDict()
+
+    for sample in samples:
+        values = [
+            ("nuke nodes", sample.nuke_nodes),
+            ("game nodes", sample.game_nodes),
+            ("traced memory", sample.memory),
+        ]
+        values.extend(sorted(sample.objects.items()))
+
+        for name, value in values:
+            if value is not None:
+                series.setdefault(name, []).append(value)
+
+    result = []
+
+    for name, values in series.items():
+        # Objects created after the first sample started from zero.
+        values = [0] * (len(samples) - len(values)) + values
+
+        if values[-1] <= values[0]:
+            continue
+
+        steady = all(
+            _value >= value for value, _value in zip(values, values[1:])
+        )
+        result.append((name, (values[0], values[-1], steady)))
+
+    result.sort(key=lambda item: item[1][0] - item[1][1])
+    return collections.OrderedDict(result)
+
+
+def format_report(report):
+    """Return *report* of :func:`run` formatted as text."""
+    samples = report["samples"]
+
+    lines = ["{:<8}{:>12}{:>12}{:>16}".format(
+        "round", "nuke nodes", "game nodes", "traced memory"
+    )]
+
+    for sample in samples:
+        lines.append("{:<8}{:>12}{:>12}{:>16}".format(
+            sample.round, sample.nuke_nodes, sample.game_nodes,
+            sample.memory if sample.memory is not None else "-"
+        ))
+
+    lines.append("")
+
+    if len(report["growth"]) == 0:
+        lines.append("No growth detected.")
+
+    else:
+        lines.append("{:<40}{:>12}{:>12}  {}".format(
+            "resource", "first", "last", "steady"
+        ))
+
+        for name, (first, last, steady) in report["growth"].items():
+            lines.append("{:<40}{:>12}{:>12}  {}".format(
+                name, first, last, "yes" if steady else "no"
+            ))
+
+    for trace, size, count in report["allocations"]:
+        lines.append("")
+        lines.append("+{} B in {} blocks".format(size, count))
+        lines.extend(trace)
+
+    return "\n".join(lines)
+
+
+def _sample(index, game):
+    """Return resources measured for round *index* of *game*."""
+    objects = collections.Counter()
+
+    for _object in gc.get_objects():
+        _type = type(_object)
+        if _type.__module__.startswith("arcade_nuke"):
+            objects["{}.{}".format(_type.__module__, _type.__name__)] += 1
+
+    memory = None
+    if tracemalloc is not None and tracemalloc.is_tracing():
+        memory = tracemalloc.get_traced_memory()[0]
+
+    return Sample(
+        round=index,
+        nuke_nodes=len(nuke.allNodes()),
+        game_nodes=sum(1 for node in game.nodes() if node.exists()),
+        memory=memory,
+        objects=dict(objects)
+    )
+
+
+def _snapshot():
+    """Return snapshot of memory blocks allocated outside of this module."""
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ])
@@ -0,0 +1,253 @@
+# :coding: utf-8
+
+import glob
+import json
+import os
+import threading
+
+
+class TelemetrySink(object):
+    """Record game telemetry to a rotating JSON Lines file.
+
+    Records are buffered in memory and written by a background thread in
+    large sequential writes, so that recording never blocks the game on
+    disk access.
+
+    """
+
+    def __init__(
+        self, path, context=None, flush_interval=2.0, max_bytes=10485760,
+        backup_count=5
+    ):
+        """Initialize the sink and start the flush thread.
+
+        :param path: Path to the JSON Lines file to write.
+
+        :param context: Mapping added to each record when it is written,
+            such as the Nuke version or the name of the machine, so that
+            records can be grouped by these values. Default is None.
+
+        :param flush_interval: Number of seconds between each flush. Default
+            is 2.0.
+
+        :param max_bytes: Maximum size of the file in bytes before it is
+            rotated. Default is 10 MB.
+
+        :param backup_count: Number of rotated files to keep. Default is 5.
+
+        """
+        self._path = path
+        self._context = context or {}
+        self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def path(self):
+        """Return path to the JSON Lines file."""
+        return self._path
+
+    def record(self, record):
+        """Buffer *record* to be written by the flush thread.
+
+        The context of the sink is added to the record when it is written,
+        so that recording costs no copy on the game loop.
+
+        :param record: Mapping which can be serialized to JSON.
+
+        """
+        with self._lock:
+            self._buffer.append(record)
+
+    def record_summary(self, record):
+        """Buffer session summary *record* to be written by the flush thread.
+
+        :param record: Mapping which can be serialized to JSON.
+
+        """
+        self.record(record)
+
+    def flush(self):
+        """Write all buffered records to the file."""
+        with self._lock:
+            records, self._buffer = self._buffer, []
+
+        if len(records) == 0:
+            return
+
+        lines = []
+
+        for record in records:
+            _record = dict(self._context)
+            _record.update(record)
+            lines.append(json.dumps(_record, sort_keys=True) + "\n")
+
+        data = "".join(lines)
+
+        if (
+            os.path.exists(self._path) and
+            os.path.getsize(self._path) + len(data) > self._max_bytes
+        ):
+            self._rotate()
+
+        with open(self._path, "a") as stream:
+            stream.write(data)
+
+    def close(self):
+        """Stop the flush thread and write remaining records."""
+        if self._closed.is_set():
+            return
+
+        self._closed.set()
+        self._thread.join()
+        self.flush()
+
+    def _run(self):
+        """Flush records periodically until the sink is closed."""
+        while not self._closed.wait(self._flush_interval):
+            self.flush()
+
+    def _rotate(self):
+        """Shift rotated files and move current file to the first backup."""
+        for index in range(self._backup_count - 1, 0, -1):
+            source = "{}.{}".format(self._path, index)
+            if os.path.exists(source):
+                os.rename(source, "{}.{}".format(self._path, index + 1))
+
+        if self._backup_count > 0:
+            os.rename(self._path, "{}.1".format(self._path))
+        else:
+            os.remove(self._path)
+
+
+def read_records(path):
+    """Yield records from JSON Lines file and its rotated backups.
+
+    :param path: Path to the JSON Lines file as given to
+        :class:`TelemetrySink`.
+
+    """
+    paths = sorted(
+        glob.glob("{}.*".format(path)), reverse=True,
+        key=lambda _path: _path.rsplit(".", 1)[-1].zfill(6)
+    )
+    if os.path.exists(path):
+        paths.append(path)
+
+    for _path in paths:
+        with open(_path, "r") as stream:
+            for line in stream:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def percentile(values, percent):
+    """Return percentile of *values* using the nearest-rank method.
+
+    :param values: Sorted list of numerical values.
+
+    :param percent: Percentile to compute, between 0 and 100.
+
+    :return: Numerical value or None if *values* is empty.
+
+    """
+    if len(values) == 0:
+        return None
+
+    rank = int(round(percent / 100.0 * (len(values) - 1)))
+    return values[rank]
+
+
+def aggregate(
+    path, record_type="frame", group_by=None, fields=None,
+    percents=(50, 90, 99)
+):
+    """Aggregate records into percentile tables.
+
+    :param path: Path to the JSON Lines file as given to
+        :class:`TelemetrySink`.
+
+    :param record_type: Type of records to aggregate. Default is "frame".
+
+    :param group_by: Name of field used to group records, such as
+        "nuke_version". Default is None, which aggregates all records
+        together.
+
+    :param fields: Names of numerical fields to aggregate. Default is None,
+        which aggregates all numerical fields found.
+
+    :param percents: Percentiles to compute. Default is (50, 90, 99).
+
+    :return: Mapping of group names with mappings of field names with
+        mappings of percentiles and values.
+
+    """
+    values = {}
+
+    for record in read_records(path):
+        if record.get("type") != record_type:
+            continue
+
+        group = values.setdefault(record.get(group_by, "all"), {})
+
+        for key, value in record.items():
+            if fields is not None and key not in fields:
+                continue
+
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+
+            group.setdefault(key, []).append(value)
+
+    table = {}
+
+    for group, mapping in values.items():
+        table[group] = {}
+
+        for key, _values in mapping.items():
+            _values.sort()
+            table[group][key] = dict(
+                (percent, percentile(_values, percent)) for percent in percents
+            )
+
+    return table
+
+
+def format_table(table, percents=(50, 90, 99)):
+    """Return percentile *table* formatted as text.
+
+    :param table: Table as returned by :func:`aggregate`.
+
+    :param percents: Percentiles to display. Default is (50, 90, 99).
+
+    """
+    lines = []
+
+    header = "{:<20}".format("field") + "".join(
+        "{:>14}".format("p{}".format(percent)) for percent in percents
+    )
+
+    for group in sorted(table.keys(), key=str):
+        lines.append("[{}]".format(group))
+        lines.append(header)
+
+        for key in sorted(table[group].keys()):
+            lines.append(
+                "{:<20}".format(key) + "".join(
+                    "{:>14.6g}".format(table[group][key][percent])
+                    for percent in percents
+                )
+            )
+
+        lines.append("")
+
+    return "\n".join(lines)
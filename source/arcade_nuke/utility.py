@@ -1,11 +1,446 @@
 # :coding: utf-8
 
+import os
+import re
+import tempfile
+import timeit
+
+import nuke
+from PySide2 import QtCore, QtWidgets
+
 import arcade_nuke.node
 
 
+class UndoSuppressor(object):
+    """Disable undo for all node operations driven by the games.
+
+    The suppressor can be acquired several times, for instance by a running
+    game session and a drawing job. The user undo state is only restored
+    when the last acquisition is released.
+
+    It can also be used as a context manager, which ensures that the undo
+    state is restored even if an error is raised.
+
+    """
+
+    def __init__(self):
+        """Initialize the suppressor."""
+        self._count = 0
+        self._was_disabled = False
+
+    def __enter__(self):
+        """Acquire the suppressor when entering the context."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        """Release the suppressor when exiting the context."""
+        self.release()
+
+    def active(self):
+        """Indicate whether undo is currently suppressed."""
+        return self._count > 0
+
+    def acquire(self):
+        """Disable undo unless it is already suppressed."""
+        if self._count == 0:
+            self._was_disabled = nuke.Undo.disabled()
+            if not self._was_disabled:
+                nuke.Undo.disable()
+
+        self._count += 1
+
+    def release(self):
+        """Restore user undo state if this is the last acquisition."""
+        if self._count == 0:
+            return
+
+        self._count -= 1
+
+        if self._count == 0 and not self._was_disabled:
+            nuke.Undo.enable()
+
+
+#: Suppressor shared by all games.
+undo_suppressor = UndoSuppressor()
+
+
+class RepaintCoalescer(object):
+    """Hold repaints of the Node Graph during a batch of node operations.
+
+    Each node created, moved or deleted can trigger its own repaint of the
+    Node Graph. While the coalescer is acquired, updates of the Node Graph
+    widgets are disabled, and enabling them again when the last acquisition
+    is released schedules a single repaint.
+
+    It can also be used as a context manager, which ensures that updates are
+    enabled again even if an error is raised.
+
+    """
+
+    def __init__(self):
+        """Initialize the coalescer."""
+        self._count = 0
+
+        # Widgets are only searched when none of them is valid anymore.
+        self._widgets = []
+        self._held = []
+
+    def __enter__(self):
+        """Acquire the coalescer when entering the context."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        """Release the coalescer when exiting the context."""
+        self.release()
+
+    def active(self):
+        """Indicate whether repaints are currently held."""
+        return self._count > 0
+
+    def acquire(self):
+        """Disable updates of the Node Graph unless they are already held."""
+        if self._count == 0:
+            self._held = self._hold(self._widgets)
+
+            if len(self._held) == 0:
+                self._widgets = find_dag_widgets()
+                self._held = self._hold(self._widgets)
+
+        self._count += 1
+
+    def release(self):
+        """Enable updates of the Node Graph on the last release."""
+        if self._count == 0:
+            return
+
+        self._count -= 1
+
+        if self._count == 0:
+            for widget in self._held:
+                try:
+                    widget.setUpdatesEnabled(True)
+                except RuntimeError:
+                    pass
+
+            self._held = []
+
+    @staticmethod
+    def _hold(widgets):
+        """Disable updates of *widgets* and return those which were enabled.
+
+        Widgets deleted by Qt are ignored.
+
+        """
+        held = []
+
+        for widget in widgets:
+            try:
+                if not widget.updatesEnabled():
+                    continue
+
+                widget.setUpdatesEnabled(False)
+
+            except RuntimeError:
+                continue
+
+            held.append(widget)
+
+        return held
+
+
+#: Coalescer shared by all games.
+repaint_coalescer = RepaintCoalescer()
+
+
+def find_dag_widgets():
+    """Return widgets of all Node Graph panels.
+
+    Node Graph panels are named "DAG.1", "DAG.2" and so on in the widget
+    tree of Nuke. Disabling updates of a panel also disables updates of the
+    widget drawing the nodes within it.
+
+    """
+    pattern = re.compile(r"^DAG\.\d+$")
+
+    return [
+        widget for widget in QtWidgets.QApplication.allWidgets()
+        if pattern.match(widget.objectName())
+    ]
+
+
+class NodeSnapshot(object):
+    """Serialized copy of nodes which can be restored in one operation.
+
+    The script fragment is kept in memory. It is only written to a temporary
+    file to be pasted, which leaves the clipboard of the user untouched.
+
+    """
+
+    def __init__(self, script):
+        """Initialize the snapshot.
+
+        :param script: Script fragment describing the nodes.
+
+        """
+        self._script = script
+
+    @classmethod
+    def capture(cls, nodes):
+        """Serialize *nodes* with their position, class and label.
+
+        :param nodes: List of Nuke nodes.
+
+        :return: Instance of :class:`NodeSnapshot`.
+
+        """
+        selection = nuke.selectedNodes()
+        _select(selection, False)
+        _select(nodes, True)
+
+        path = _temporary_path()
+
+        try:
+            nuke.nodeCopy(path)
+
+            with open(path, "r") as stream:
+                script = stream.read()
+
+        finally:
+            os.remove(path)
+            _select(nodes, False)
+            _select(selection, True)
+
+        return cls(script)
+
+    @property
+    def script(self):
+        """Return script fragment describing the nodes."""
+        return self._script
+
+    def restore(self):
+        """Create all nodes from the snapshot.
+
+        Nodes with the same names must have been deleted beforehand.
+
+        """
+        selection = nuke.selectedNodes()
+        _select(selection, False)
+
+        path = _temporary_path()
+
+        try:
+            with open(path, "w") as stream:
+                stream.write(self._script)
+
+            nuke.nodePaste(path)
+
+        finally:
+            os.remove(path)
+
+            # Pasted nodes are selected.
+            _select(nuke.selectedNodes(), False)
+            _select(selection, True)
+
+
+class DrawingJob(object):
+    """Draw nodes incrementally over several timer ticks.
+
+    Each tick creates a bounded number of nodes and stops as soon as the time
+    budget is spent, so that drawing never blocks the UI for long.
+
+    """
+
+    def __init__(self, points, budget=0.016, maximum_nodes=10):
+        """Initialize the job.
+
+        :param points: Iterator of :class:`arcade_nuke.node.BaseNode`
+            instances whose nodes are not yet created.
+
+        :param budget: Maximum duration of each tick in seconds. Default is
+            0.016.
+
+        :param maximum_nodes: Maximum number of nodes to create at each tick.
+            Default is 10.
+
+        """
+        self._points = iter(points)
+        self._budget = budget
+        self._maximum_nodes = maximum_nodes
+
+        # Record nodes created so far.
+        self._created = []
+        self._finished = False
+
+        self._timer = QtCore.QTimer()
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._process)
+
+    @property
+    def points(self):
+        """Return list of points created so far."""
+        return self._created
+
+    def finished(self):
+        """Indicate whether all nodes are created."""
+        return self._finished
+
+    def start(self):
+        """Start drawing."""
+        if not self._finished:
+            self._timer.start()
+
+    def finish(self):
+        """Create all remaining nodes at once."""
+        self._timer.stop()
+
+        with undo_suppressor:
+            for point in self._points:
+                point.create_node()
+                self._created.append(point)
+
+        self._finished = True
+
+    def cancel(self):
+        """Stop drawing and delete all nodes created so far."""
+        self._timer.stop()
+        self._finished = True
+
+        with undo_suppressor:
+            for point in self._created:
+                point.destroy()
+
+        del self._created[:]
+
+    def _process(self):
+        """Create the next slice of nodes."""
+        with undo_suppressor:
+            self._create_slice()
+
+    def _create_slice(self):
+        """Create nodes until the slice is full or the budget is spent."""
+        start = timeit.default_timer()
+
+        for _ in range(self._maximum_nodes):
+            try:
+                point = next(self._points)
+            except StopIteration:
+                self._timer.stop()
+                self._finished = True
+                return
+
+            point.create_node()
+            self._created.append(point)
+
+            if timeit.default_timer() - start >= self._budget:
+                return
+
+
+class PreparationJob(object):
+    """Run steps of a preparation over several idle timer ticks.
+
+    Each tick runs a bounded number of steps and stops as soon as the time
+    budget is spent, so that the preparation never blocks the UI for long.
+
+    """
+
+    def __init__(self, steps, budget=0.004, maximum_steps=10):
+        """Initialize the job.
+
+        :param steps: Iterator running one step of the preparation each time
+            it is advanced, such as :meth:`arcade_nuke.base.BaseGame.prepare`.
+
+        :param budget: Maximum duration of each tick in seconds. Default is
+            0.004.
+
+        :param maximum_steps: Maximum number of steps to run at each tick.
+            Default is 10.
+
+        """
+        self._steps = iter(steps)
+        self._budget = budget
+        self._maximum_steps = maximum_steps
+        self._finished = False
+
+        # A timer without interval is triggered when the event loop is idle.
+        self._timer = QtCore.QTimer()
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._process)
+
+    def finished(self):
+        """Indicate whether all steps were run."""
+        return self._finished
+
+    def start(self):
+        """Start or resume the preparation."""
+        if not self._finished:
+            self._timer.start()
+
+    def stop(self):
+        """Pause the preparation."""
+        self._timer.stop()
+
+    def _process(self):
+        """Run the next slice of steps."""
+        with undo_suppressor:
+            self._run_slice()
+
+    def _run_slice(self):
+        """Run steps until the slice is full or the budget is spent."""
+        start = timeit.default_timer()
+
+        for _ in range(self._maximum_steps):
+            try:
+                next(self._steps)
+            except StopIteration:
+                self._timer.stop()
+                self._finished = True
+                return
+
+            if timeit.default_timer() - start >= self._budget:
+                return
+
+
 def draw_game_over(x, y):
     """Draw 'Game Over.' using dots.
 
+    All nodes are created at once. Use :class:`DrawingJob` with
+    :func:`iter_game_over` to draw over several timer ticks instead.
+
+    :param x: Position of the left corner of the pattern.
+
+    :param y: Position of the top corner of the pattern.
+
+    :return: List of :class:`arcade_nuke.node.DotNode` instances.
+
+    """
+    job = DrawingJob(iter_game_over(x, y))
+    job.finish()
+    return job.points
+
+
+def draw_win(x, y):
+    """Draw 'You win!' using dots.
+
+    All nodes are created at once. Use :class:`DrawingJob` with
+    :func:`iter_win` to draw over several timer ticks instead.
+
+    :param x: Position of the left corner of the pattern.
+
+    :param y: Position of the top corner of the pattern.
+
+    :return: List of :class:`arcade_nuke.node.DotNode` instances.
+
+    """
+    job = DrawingJob(iter_win(x, y))
+    job.finish()
+    return job.points
+
+
+def iter_game_over(x, y):
+    """Yield dots to draw 'Game Over.' without creating their nodes.
+
     :param x: Position of the left corner of the pattern.
 
     :param y: Position of the top corner of the pattern.
@@ -55,26 +490,12 @@ def draw_game_over(x, y):
         ]
     ]
 
-    points = []
+    for point in _iter_words(words, x, y):
+        yield point
 
-    _x = x
-    for word in words:
-        for letter in word:
-            for index_x, index_y in letter:
-                point = arcade_nuke.node.DotNode(
-                    x=_x + arcade_nuke.node.DotNode.width() * index_x,
-                    y=y + arcade_nuke.node.DotNode.height() * index_y,
-                )
-                point.create_node()
-                points.append(point)
-            _x += 11 * 6
-        _x += 11 * 2
-
-    return points
 
-
-def draw_win(x, y):
-    """Draw 'You win!' using dots.
+def iter_win(x, y):
+    """Yield dots to draw 'You win!' without creating their nodes.
 
     :param x: Position of the left corner of the pattern.
 
@@ -116,19 +537,41 @@ def draw_win(x, y):
         ]
     ]
 
-    points = []
+    for point in _iter_words(words, x, y):
+        yield point
+
+
+def _iter_words(words, x, y):
+    """Yield dots to draw *words*.
 
+    :param words: List of words containing letters as lists of dot
+        coordinates.
+
+    :param x: Position of the left corner of the pattern.
+
+    :param y: Position of the top corner of the pattern.
+
+    """
     _x = x
     for word in words:
         for letter in word:
             for index_x, index_y in letter:
-                point = arcade_nuke.node.DotNode(
+                yield arcade_nuke.node.DotNode(
                     x=_x + arcade_nuke.node.DotNode.width() * index_x,
                     y=y + arcade_nuke.node.DotNode.height() * index_y,
                 )
-                point.create_node()
-                points.append(point)
             _x += 11 * 6
         _x += 11 * 2
 
-    return points
+
+def _select(nodes, value):
+    """Set selection state of *nodes* to *value*."""
+    for node in nodes:
+        node.setSelected(value)
+
+
+def _temporary_path():
+    """Return path to a new temporary file for a script fragment."""
+    handle, path = tempfile.mkstemp(suffix=".nk")
+    os.close(handle)
+    return path
@@ -3,11 +3,17 @@
 import os
 import shutil
 import tempfile
+import threading
 import uuid
 
 import pytest
 import mock
 
+import fake_nuke
+
+#: Fake Nuke API shared by all tests.
+NUKE = fake_nuke.FakeNuke()
+
 
 @pytest.fixture()
 def unique_name():
@@ -48,15 +54,69 @@ def temporary_directory(request):
 
 @pytest.fixture(autouse=True, scope="session")
 def nuke_mocker(request):
-    """Mock the nuke library."""
-    m = mock.patch.dict("sys.modules", {"nuke": mock.Mock()})
+    """Replace the nuke library with a fake implementation."""
+    m = mock.patch.dict("sys.modules", {"nuke": NUKE})
     m.start()
     request.addfinalizer(m.stop)
 
 
+@pytest.fixture(autouse=True)
+def fake_nuke_session():
+    """Return fake nuke library without nodes nor calls recorded."""
+    NUKE.reset()
+    return NUKE
+
+
+@pytest.fixture()
+def nuke_budget(fake_nuke_session):
+    """Return context manager asserting a maximum number of Nuke calls.
+
+    Example::
+
+        with nuke_budget(10):
+            game._process()
+
+        with nuke_budget(0, "toNode"):
+            game._render(1.0)
+
+    """
+    return fake_nuke_session.budget
+
+
+class QThread(object):
+    """Stand-in for :class:`QtCore.QThread` running a Python thread."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize thread."""
+        self._thread = None
+
+    def start(self):
+        """Call :meth:`run` in a new thread."""
+        self._thread = threading.Thread(target=self.run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def wait(self, timeout=None):
+        """Wait for the thread to finish."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        return not self.isRunning()
+
+    def isRunning(self):
+        """Indicate whether the thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def run(self):
+        """Method called in the thread."""
+
+
 @pytest.fixture(autouse=True, scope="session")
 def pyside_mocker(request):
     """Mock the PySide2 library."""
-    m = mock.patch.dict("sys.modules", {"PySide2": mock.Mock()})
+    pyside = mock.Mock()
+    pyside.QtCore.QThread = QThread
+
+    m = mock.patch.dict("sys.modules", {"PySide2": pyside})
     m.start()
     request.addfinalizer(m.stop)
@@ -0,0 +1,325 @@
+# :coding: utf-8
+
+import collections
+import contextlib
+import json
+import types
+
+
+class FakeNuke(types.ModuleType):
+    """Minimal in-memory implementation of the Nuke API.
+
+    Nodes are recorded with their class and knob values, and each function
+    or method called is counted, so that tests can assert how many calls a
+    piece of code makes to the Nuke API.
+
+    """
+
+    #: Version string of the fake Nuke API.
+    NUKE_VERSION_STRING = "0.0v0"
+
+    def __init__(self):
+        """Initialize the fake module."""
+        super(FakeNuke, self).__init__("nuke")
+
+        self.calls = collections.Counter()
+        self.nodes = _NodeFactory(self)
+        self.Undo = _Undo(self)
+
+        self._nodes = collections.OrderedDict()
+
+        # Path to the current script or None if not saved.
+        self.script_name = None
+
+    def reset(self):
+        """Delete all nodes and reset call counters."""
+        self._nodes.clear()
+        self.calls.clear()
+        self.Undo.reset()
+        self.script_name = None
+
+    def count(self, *names):
+        """Return number of calls recorded.
+
+        :param names: Names of functions or methods to count, such as
+            "toNode" or "Node.setXpos". Default is all calls.
+
+        """
+        if len(names) == 0:
+            return sum(self.calls.values())
+
+        return sum(self.calls[name] for name in names)
+
+    @contextlib.contextmanager
+    def budget(self, maximum, *names):
+        """Assert that the block makes at most *maximum* calls.
+
+        :param maximum: Maximum number of calls allowed.
+
+        :param names: Names of functions or methods to count. Default is all
+            calls.
+
+        """
+        before = collections.Counter(self.calls)
+        yield
+
+        spent = self.calls - before
+        if len(names) > 0:
+            spent = collections.Counter(
+                dict((name, spent[name]) for name in names if spent[name])
+            )
+
+        total = sum(spent.values())
+        assert total <= maximum, (
+            "{} Nuke calls exceed budget of {}: {}".format(
+                total, maximum, dict(spent)
+            )
+        )
+
+    def toNode(self, name):
+        """Return node named *name* or None."""
+        self.calls["toNode"] += 1
+        return self._nodes.get(name)
+
+    def delete(self, node):
+        """Delete *node*."""
+        self.calls["delete"] += 1
+
+        if self._nodes.get(node.name()) is not node:
+            raise ValueError("A PythonObject is not attached to a node")
+
+        del self._nodes[node.name()]
+
+    def allNodes(self, filter=None):
+        """Return all nodes, optionally only of class *filter*."""
+        self.calls["allNodes"] += 1
+        return [
+            node for node in self._nodes.values()
+            if filter is None or node.Class() == filter
+        ]
+
+    def selectedNodes(self):
+        """Return all selected nodes."""
+        self.calls["selectedNodes"] += 1
+        return [
+            node for node in self._nodes.values()
+            if node["selected"].value()
+        ]
+
+    def scriptName(self):
+        """Return path to the current script."""
+        self.calls["scriptName"] += 1
+
+        if self.script_name is None:
+            raise RuntimeError("No script name")
+
+        return self.script_name
+
+    def zoom(self, *args):
+        """Record zoom of the node graph."""
+        self.calls["zoom"] += 1
+
+    def nodeCopy(self, path):
+        """Serialize selected nodes to *path*."""
+        self.calls["nodeCopy"] += 1
+
+        data = [
+            {"class": node.Class(), "knobs": node.values()}
+            for node in self._nodes.values() if node["selected"].value()
+        ]
+
+        with open(path, "w") as stream:
+            json.dump(data, stream)
+
+    def nodePaste(self, path):
+        """Create nodes serialized in *path* and select them."""
+        self.calls["nodePaste"] += 1
+
+        with open(path, "r") as stream:
+            data = json.load(stream)
+
+        for item in data:
+            knobs = dict(item["knobs"])
+            knobs["selected"] = True
+            self._create(item["class"], knobs)
+
+    def _create(self, node_class, knobs):
+        """Create and record node of *node_class* with *knobs* values."""
+        name = knobs.get("name") or "{}{}".format(
+            node_class, len(self._nodes) + 1
+        )
+
+        if name in self._nodes:
+            raise RuntimeError("Node name '{}' already exists".format(name))
+
+        knobs = dict(knobs, name=name)
+        knobs.setdefault("xpos", 0)
+        knobs.setdefault("ypos", 0)
+        knobs.setdefault("selected", False)
+        knobs.setdefault("disable", False)
+
+        node = Node(self, node_class, knobs)
+        self._nodes[name] = node
+        return node
+
+
+class Node(object):
+    """Node recorded by :class:`FakeNuke`."""
+
+    def __init__(self, module, node_class, knobs):
+        """Initialize node.
+
+        :param module: Instance of :class:`FakeNuke`.
+
+        :param node_class: Class of the node.
+
+        :param knobs: Mapping of knob names with initial values.
+
+        """
+        self._module = module
+        self._class = node_class
+        self._knobs = dict(
+            (name, Knob(module, value)) for name, value in knobs.items()
+        )
+
+    def __getitem__(self, name):
+        """Return knob *name*, created if necessary."""
+        self._module.calls["Node.__getitem__"] += 1
+        return self._knobs.setdefault(name, Knob(self._module))
+
+    def knob(self, name):
+        """Return knob *name* or None if the node has no such knob."""
+        self._module.calls["Node.knob"] += 1
+        return self._knobs.get(name)
+
+    def values(self):
+        """Return mapping of knob names with values without counting."""
+        return dict(
+            (name, knob._value) for name, knob in self._knobs.items()
+        )
+
+    def name(self):
+        """Return name of the node."""
+        self._module.calls["Node.name"] += 1
+        return self._knobs["name"]._value
+
+    def Class(self):
+        """Return class of the node."""
+        self._module.calls["Node.Class"] += 1
+        return self._class
+
+    def xpos(self):
+        """Return position of the node on the X axis."""
+        self._module.calls["Node.xpos"] += 1
+        return self._knobs["xpos"]._value
+
+    def ypos(self):
+        """Return position of the node on the Y axis."""
+        self._module.calls["Node.ypos"] += 1
+        return self._knobs["ypos"]._value
+
+    def setXpos(self, value):
+        """Set position of the node on the X axis."""
+        self._module.calls["Node.setXpos"] += 1
+        self._knobs["xpos"]._value = int(value)
+
+    def setYpos(self, value):
+        """Set position of the node on the Y axis."""
+        self._module.calls["Node.setYpos"] += 1
+        self._knobs["ypos"]._value = int(value)
+
+    def setXYpos(self, x, y):
+        """Set position of the node on both axes."""
+        self._module.calls["Node.setXYpos"] += 1
+        self._knobs["xpos"]._value = int(x)
+        self._knobs["ypos"]._value = int(y)
+
+    def setSelected(self, value):
+        """Set selection state of the node."""
+        self._module.calls["Node.setSelected"] += 1
+        self._knobs["selected"]._value = bool(value)
+
+
+class Knob(object):
+    """Knob of a :class:`Node`."""
+
+    def __init__(self, module, value=None):
+        """Initialize knob.
+
+        :param module: Instance of :class:`FakeNuke`.
+
+        :param value: Initial value of the knob. Default is None.
+
+        """
+        self._module = module
+        self._value = value
+
+    def value(self):
+        """Return value of the knob."""
+        self._module.calls["Knob.value"] += 1
+        return self._value
+
+    def getValue(self):
+        """Return value of the knob."""
+        self._module.calls["Knob.getValue"] += 1
+        return self._value
+
+    def setValue(self, value):
+        """Set value of the knob."""
+        self._module.calls["Knob.setValue"] += 1
+        self._value = value
+
+
+class _NodeFactory(object):
+    """Create nodes from attributes named after node classes."""
+
+    def __init__(self, module):
+        """Initialize factory.
+
+        :param module: Instance of :class:`FakeNuke`.
+
+        """
+        self._module = module
+
+    def __getattr__(self, node_class):
+        """Return callable creating node of *node_class*."""
+        if node_class.startswith("_"):
+            raise AttributeError(node_class)
+
+        def _create(**knobs):
+            self._module.calls["nodes.{}".format(node_class)] += 1
+            return self._module._create(node_class, knobs)
+
+        return _create
+
+
+class _Undo(object):
+    """Record state of the undo history."""
+
+    def __init__(self, module):
+        """Initialize undo state.
+
+        :param module: Instance of :class:`FakeNuke`.
+
+        """
+        self._module = module
+        self._disabled = False
+
+    def reset(self):
+        """Enable undo history."""
+        self._disabled = False
+
+    def disabled(self):
+        """Indicate whether undo history is disabled."""
+        self._module.calls["Undo.disabled"] += 1
+        return self._disabled
+
+    def disable(self):
+        """Disable undo history."""
+        self._module.calls["Undo.disable"] += 1
+        self._disabled = True
+
+    def enable(self):
+        """Enable undo history."""
+        self._module.calls["Undo.enable"] += 1
+        self._disabled = False
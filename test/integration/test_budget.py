@@ -0,0 +1,77 @@
+# :coding: utf-8
+
+import pytest
+
+
+@pytest.fixture()
+def timer(mocker):
+    """Mock the timer used by the game loop."""
+    import arcade_nuke.base
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    timer = mocker.patch.object(arcade_nuke.base.timeit, "default_timer")
+    timer.return_value = 0.0
+    return timer
+
+
+def _start(game, timer, x):
+    """Initialize and start *game* with the cursor at position *x*."""
+    game._capture_input = lambda: x
+    game.initialize()
+    game.start()
+
+
+def test_breakout_initialize_budget(timer, nuke_budget):
+    """Initializing an unchanged level does not look up any node."""
+    import arcade_nuke.breakout
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1
+    )
+
+    # Each node is looked up once before being created.
+    with nuke_budget(152 + 2 + 70 + 1, "toNode", "zoom"):
+        game.initialize()
+
+    # Undo history is suppressed and the view is zoomed on the field.
+    with nuke_budget(4):
+        assert game.initialize() == 0
+
+
+def test_breakout_tick_budget(timer, nuke_budget):
+    """One tick of the game only moves the paddle and the ball."""
+    import arcade_nuke.breakout
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        simulation_rate=120, render_rate=60
+    )
+    _start(game, timer, x=300)
+
+    for index in range(1, 61):
+        timer.return_value = index / 60.0
+
+        with nuke_budget(6):
+            game._process()
+
+    game.stop()
+
+
+def test_invaders_tick_budget(timer, nuke_budget):
+    """One tick of the game writes the formation without node lookups."""
+    import arcade_nuke.invaders
+
+    game = arcade_nuke.invaders.InvadersGame(
+        seed=0, simulation_rate=120, render_rate=60
+    )
+    _start(game, timer, x=300)
+
+    for index in range(1, 61):
+        timer.return_value = index / 60.0
+
+        # Only the ship and the bullets are looked up by name.
+        with nuke_budget(2 * (55 + 1 + 3) + 4):
+            game._process()
+
+    game.stop()
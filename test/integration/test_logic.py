@@ -1,21 +1,5 @@
 # :coding: utf-8
 
-import pytest
-
-
-@pytest.fixture(autouse=True)
-def setup(mocker):
-    """Mock BaseNode module to only use initial position."""
-    import arcade_nuke.node
-
-    mocker.patch.object(
-        arcade_nuke.node.BaseNode, "node",
-        lambda self: mocker.Mock(
-            xpos=lambda: self._position.x,
-            ypos=lambda: self._position.y,
-        )
-    )
-
 
 def test_collision():
     """Test collision between a Dot and a Viewer nodes at various positions.
@@ -0,0 +1,281 @@
+# :coding: utf-8
+
+import time
+
+import pytest
+
+
+def _create_game(mocker, simulation_rate, render_rate, **kwargs):
+    """Return game recording simulation steps and renders."""
+    import arcade_nuke.base
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    class _Game(arcade_nuke.base.BaseGame):
+        def initialize(self):
+            super(_Game, self).initialize()
+
+        def _simulate(self, delta):
+            self.steps.append(delta)
+
+        def _render(self, alpha):
+            self.renders.append(alpha)
+
+    game = _Game(
+        simulation_rate=simulation_rate, render_rate=render_rate, **kwargs
+    )
+    game.steps = []
+    game.renders = []
+    return game
+
+
+def _wait_for(condition, timeout=5.0):
+    """Wait until *condition* is met."""
+    end = time.time() + timeout
+    while not condition():
+        assert time.time() < end, "Condition not met in time"
+        time.sleep(0.001)
+
+
+def test_process_fixed_steps(mocker):
+    """Simulation runs at fixed steps and renders interpolated state."""
+    import arcade_nuke.base
+
+    timer = mocker.patch.object(arcade_nuke.base.timeit, "default_timer")
+
+    game = _create_game(mocker, simulation_rate=100, render_rate=25)
+    game.initialize()
+
+    timer.return_value = 10.0
+    game.start()
+
+    timer.return_value = 10.045
+    game._process()
+
+    assert len(game.steps) == 4
+    assert game.steps[0] == 0.01
+    assert len(game.renders) == 1
+    assert abs(game.renders[0] - 0.5) < 1e-6
+
+
+def test_process_maximum_steps(mocker):
+    """Simulation drops accumulated time when a tick is too long."""
+    import arcade_nuke.base
+
+    timer = mocker.patch.object(arcade_nuke.base.timeit, "default_timer")
+
+    game = _create_game(mocker, simulation_rate=100, render_rate=25)
+    game.initialize()
+
+    timer.return_value = 10.0
+    game.start()
+
+    timer.return_value = 20.0
+    game._process()
+
+    assert len(game.steps) == 16
+    assert game.renders == [0.0]
+
+
+def test_process_frames(mocker):
+    """Frames posted by the worker are applied until the game is over."""
+    import pytest
+    import arcade_nuke.base
+
+    game = _create_game(mocker, simulation_rate=100, render_rate=25)
+    game._apply_frames = mocker.Mock()
+
+    game._frames.put(("frame1", None))
+    game._frames.put(("frame2", arcade_nuke.base.GameOver(success=True)))
+    game._frames.put(("frame3", None))
+
+    with pytest.raises(arcade_nuke.base.GameOver):
+        game._process_frames()
+
+    game._apply_frames.assert_called_once_with(["frame1", "frame2"])
+    assert game._frames.qsize() == 1
+
+
+def test_worker_frames_ahead(mocker):
+    """Worker waits for the main thread to apply its frames."""
+    import arcade_nuke.base
+
+    game = _create_game(
+        mocker, simulation_rate=1000, render_rate=25, threaded=True,
+        frames_ahead=2
+    )
+    game._capture_frame = lambda: len(game.steps)
+    game._apply_frames = mocker.Mock()
+    game.initialize()
+    game.start()
+
+    worker = game._worker
+    assert isinstance(worker, arcade_nuke.base.SimulationWorker)
+
+    # Third step is simulated then held until a slot is released.
+    _wait_for(lambda: len(game.steps) == 3)
+    time.sleep(0.05)
+    assert len(game.steps) == 3
+    assert game._frames.qsize() == 2
+
+    game._process_frames()
+    game._apply_frames.assert_called_once_with([1, 2])
+
+    _wait_for(lambda: len(game.steps) == 5)
+    time.sleep(0.05)
+    assert len(game.steps) == 5
+    assert game._frames.qsize() == 2
+
+    game.stop()
+    assert not worker.isRunning()
+    assert game._worker is None
+
+    # Frames posted before the worker stopped are applied.
+    frames = [
+        frame for (frames,), _ in game._apply_frames.call_args_list
+        for frame in frames
+    ]
+    assert frames == list(range(1, len(game.steps) + 1))
+
+
+def test_worker_error(mocker):
+    """Error raised in the worker is raised again in the main thread."""
+    import pytest
+
+    game = _create_game(
+        mocker, simulation_rate=1000, render_rate=25, threaded=True
+    )
+
+    def _simulate(delta):
+        game.steps.append(delta)
+        if len(game.steps) == 3:
+            raise ValueError("Simulation failed")
+
+    game._simulate = _simulate
+    game._apply_frames = mocker.Mock()
+    game.initialize()
+    game.start()
+
+    worker = game._worker
+    worker.wait(5)
+    assert not worker.isRunning()
+
+    with pytest.raises(ValueError):
+        game._process()
+
+    assert len(game._apply_frames.call_args[0][0]) == 3
+    assert not game.running()
+    assert game._worker is None
+
+
+def test_step(mocker):
+    """Steps run one simulation step and render it outside of the timer."""
+    import arcade_nuke.base
+
+    game = _create_game(mocker, simulation_rate=100, render_rate=25)
+    game.initialize()
+
+    game.step(42)
+    game.step(43, render=False)
+    assert game.steps == [0.01, 0.01]
+    assert game.renders == [1.0]
+    assert game._input == 43
+
+    # The last step is rendered before the game is over.
+    mocker.patch.object(
+        game, "_simulate", side_effect=arcade_nuke.base.GameOver()
+    )
+
+    with pytest.raises(arcade_nuke.base.GameOver):
+        game.step(44)
+
+    assert game.renders == [1.0, 1.0]
+
+
+def test_tick_controller():
+    """Scales increase when over budget and game pauses when sustained."""
+    import arcade_nuke.base
+
+    controller = arcade_nuke.base.TickController(
+        budget=0.01, tolerance=1.0, maximum_scale=2, cooldown=2,
+        smoothing=1.0
+    )
+
+    results = [controller.update(0.02, 0.1) for _ in range(4)]
+    assert results == [False] * 4
+    assert controller.render_scale == 2
+    assert controller.step_scale == 2
+
+    # Budget exceeded at maximum scales for more than the tolerance.
+    results = [controller.update(0.02, 0.3) for _ in range(4)]
+    assert results == [False, False, False, True]
+
+    # Scales decrease once ticks are well within the budget.
+    for _ in range(4):
+        assert controller.update(0.001, 0.1) is False
+
+    assert controller.render_scale == 1
+    assert controller.step_scale == 1
+
+
+def test_performance(mocker):
+    """Performance is computed from the latest ticks recorded."""
+    import arcade_nuke.base
+
+    timer = mocker.patch.object(arcade_nuke.base.timeit, "default_timer")
+
+    game = _create_game(mocker, simulation_rate=100, render_rate=25)
+    game._render = lambda alpha: game._counters.update(writes=3)
+    game.initialize()
+
+    timer.return_value = 10.0
+    game.start()
+
+    for index in range(1, 201):
+        timer.return_value = 10.0 + index * 0.04
+        game._process()
+
+    performance = game.performance()
+    assert len(performance["durations"]) == 120
+    assert abs(performance["ticks_per_second"] - 25) < 1e-6
+    assert performance["writes"] == 3
+    assert performance["budget"] == 0.04
+    assert performance["game"] == {}
+
+    # Ticks of the previous run are discarded when the game restarts.
+    game.stop()
+    game.start()
+    assert game.performance()["durations"] == []
+
+
+def test_services(mocker):
+    """Optional services are shared by games through one object."""
+    import arcade_nuke.base
+
+    coalescer = mocker.MagicMock()
+    telemetry = mocker.Mock()
+    scheduler = mocker.Mock()
+
+    services = arcade_nuke.base.GameServices(
+        telemetry=telemetry, scheduler=scheduler, coalescer=coalescer
+    )
+
+    game = _create_game(
+        mocker, simulation_rate=100, render_rate=25, services=services
+    )
+    assert game.services is services
+    assert services.store is None
+    scheduler.create_timer.assert_called_once_with("_Game", priority=0)
+
+    game.initialize()
+    game.start()
+    game._process()
+
+    coalescer.__enter__.assert_called_once_with()
+    coalescer.__exit__.assert_called_once_with(None, None, None)
+    assert telemetry.record.call_count == 1
+
+    # All services are disabled by default.
+    game = _create_game(mocker, simulation_rate=100, render_rate=25)
+    assert game.services.telemetry is None
+    assert game.services.coalescer is None
@@ -0,0 +1,73 @@
+# :coding: utf-8
+
+
+def test_compare_scaling(mocker):
+    """Costs are measured for each brick count and plotted."""
+    import arcade_nuke.base
+    import arcade_nuke.benchmark
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    results = arcade_nuke.benchmark.compare_scaling(
+        counts=(50, 500), steps=20
+    )
+    assert list(results.keys()) == [50, 500]
+    assert list(results[50].keys()) == ["create", "frame", "reset"]
+    assert all(
+        cost >= 0 for costs in results.values() for cost in costs.values()
+    )
+
+
+def test_format_scaling():
+    """Costs are plotted relative to the largest one."""
+    import collections
+
+    import arcade_nuke.benchmark
+
+    results = collections.OrderedDict([
+        (50, collections.OrderedDict([
+            ("create", 0.01), ("frame", 0.001), ("reset", 0.004)
+        ])),
+        (500, collections.OrderedDict([
+            ("create", 0.1), ("frame", 0.002), ("reset", 0.002)
+        ])),
+    ])
+
+    text = arcade_nuke.benchmark.format_scaling(results, width=10)
+    lines = text.splitlines()
+
+    index = lines.index("frame cost against brick count")
+    assert lines[index + 1:index + 3] == [
+        "            50 |#####",
+        "           500 |##########",
+    ]
+
+    index = lines.index("reset cost against brick count")
+    assert lines[index + 1:index + 3] == [
+        "            50 |##########",
+        "           500 |#####",
+    ]
+
+
+def test_compare_repaints(mocker, fake_nuke_session):
+    """Ticks are measured with and without coalesced repaints."""
+    import arcade_nuke.base
+    import arcade_nuke.benchmark
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+    coalescer = mocker.patch.object(
+        arcade_nuke.benchmark.arcade_nuke.utility, "repaint_coalescer"
+    )
+
+    results = arcade_nuke.benchmark.compare_repaints(
+        script_nodes=(0, 200), frames=10
+    )
+    assert list(results.keys()) == ["0 nodes", "200 nodes"]
+    assert list(results["200 nodes"].keys()) == ["direct", "coalesced"]
+
+    # Coalescer is only used for ticks of the coalesced path.
+    assert coalescer.acquire.call_count == 2 * 10
+    assert coalescer.release.call_count == 2 * 10
+
+    # Extra nodes are deleted once measured.
+    assert fake_nuke_session.allNodes() == []
@@ -0,0 +1,511 @@
+# :coding: utf-8
+
+import pytest
+
+
+def test_brick_field_from_bricks():
+    """Create brick field from list of bricks."""
+    import arcade_nuke.breakout
+
+    bricks = arcade_nuke.breakout.brick_generator1(x=0, y=0)
+    field = arcade_nuke.breakout.BrickField.from_bricks(bricks)
+
+    assert len(field) == len(bricks) == 70
+    assert field.alive_count() == 70
+    assert field.node_class(0) == "Grade"
+    assert field.node_class(69) == "Noise"
+    assert field[12].label == "brick_12"
+    assert field[12].position == bricks[12]._position
+    assert field[12].width() == arcade_nuke.breakout.Brick.width()
+
+
+def test_brick_field_collisions(mocker):
+    """Only close bricks not destroyed collide with node."""
+    import arcade_nuke.breakout
+    import arcade_nuke.node
+
+    field = arcade_nuke.breakout.BrickField()
+    field.add(0, 0, node_class="Grade", label="0")
+    field.add(100, 0, node_class="Grade", label="1")
+    field.add(0, 100, node_class="Roto", label="2")
+
+    ball = mocker.Mock(
+        position=arcade_nuke.node.Vector(40, 10),
+        middle_position=arcade_nuke.node.Vector(46, 16),
+        normals=[],
+        width=lambda: 12,
+        height=lambda: 12,
+        projection=lambda normal: (
+            arcade_nuke.node.Vector(46, 16).dot(normal) - 6,
+            arcade_nuke.node.Vector(46, 16).dot(normal) + 6,
+        )
+    )
+
+    collisions = field.collisions(ball)
+    assert [index for index, _ in collisions] == [0]
+    assert collisions[0][1] == arcade_nuke.node.Vector(0, 1)
+
+    field.destroy(0)
+    assert field.collisions(ball) == []
+    assert field.alive_count() == 2
+    assert field[0].destroyed()
+
+    field.restore(0)
+    assert field.alive_count() == 3
+    assert not field[0].destroyed()
+
+
+def test_brick_field_rows(mocker):
+    """Bricks are selected from their rows and labels are interned."""
+    import arcade_nuke.breakout
+    import arcade_nuke.logic
+    import arcade_nuke.node
+
+    collision = mocker.patch.object(
+        arcade_nuke.logic, "collision",
+        return_value=arcade_nuke.node.Vector(0, 1)
+    )
+
+    field = arcade_nuke.breakout.BrickField()
+    for row in range(10):
+        for column in range(10):
+            field.add(
+                column * 100, row * 50, node_class="Grade", label="brick"
+            )
+
+    # Tall brick added last, starting several rows above the node.
+    field.add(500, 0, node_class="Roto", label="pillar", height=400)
+
+    assert len(field) == 101
+    assert field.label(3) == "brick"
+    assert field.label(100) == "pillar"
+    assert field.node_class(100) == "Roto"
+    assert field._labels == ["brick", "pillar"]
+    assert field._node_classes == ["Grade", "Roto"]
+
+    node = mocker.Mock(
+        position=arcade_nuke.node.Vector(490, 360),
+        width=lambda: 12,
+        height=lambda: 12,
+    )
+
+    assert [index for index, _ in field.collisions(node)] == [75, 100]
+    assert collision.call_count == 2
+
+
+def test_brick_field_reset():
+    """Only destroyed bricks are updated when resetting the field."""
+    import arcade_nuke.breakout
+
+    field = arcade_nuke.breakout.BrickField.from_bricks(
+        arcade_nuke.breakout.brick_generator3(x=0, y=0)
+    )
+
+    assert field.reset() == len(field)
+    assert field.reset() == 0
+
+    field.destroy(3)
+    field.destroy(7)
+    assert field.reset() == 2
+    assert field.alive_count() == len(field)
+
+    assert field.reset(force=True) == len(field)
+
+
+def test_node_reset():
+    """Only nodes moved or destroyed are updated when reset."""
+    import arcade_nuke.breakout
+    from arcade_nuke.logic import Vector
+
+    ball = arcade_nuke.breakout.Ball(x=10, y=20)
+    assert ball.reset() is True
+    assert ball.reset() is False
+
+    ball.move_to(Vector(12, 18))
+    assert ball.reset() is False
+
+    ball.move_to(Vector(12, 18))
+    ball.render()
+    assert ball.dirty()
+    assert ball.reset() is True
+    assert ball.position == Vector(10, 20)
+
+    ball.destroy()
+    assert ball.reset() is True
+
+
+def test_field_walls():
+    """Walls drawn with stretched nodes keep the same edges."""
+    import arcade_nuke.breakout
+
+    field1 = arcade_nuke.breakout.Field(
+        x=0, y=0, width=47, height=30, padding=10
+    )
+    field2 = arcade_nuke.breakout.Field(
+        x=0, y=0, width=47, height=30, padding=10, segments=2
+    )
+
+    assert len(field1.units) == 152
+    assert len(field2.units) == 8
+
+    for attribute in ["left_edge", "right_edge", "top_edge", "bottom_edge"]:
+        assert getattr(field1, attribute) == getattr(field2, attribute)
+
+    # Walls cover the same area as the units.
+    def _bounds(units):
+        return (
+            min(unit.position.x for unit in units),
+            min(unit.position.y for unit in units),
+            max(unit.position.x + unit.width() for unit in units),
+            max(unit.position.y + unit.height() for unit in units),
+        )
+
+    assert _bounds(field1.units) == _bounds(field2.units)
+    assert sum(unit.width() for unit in field2.units[::4]) == 1024
+
+
+def test_autopilot_predict():
+    """Landing position is predicted with reflections on the walls."""
+    import arcade_nuke.breakout
+    from arcade_nuke.logic import Vector
+
+    field = arcade_nuke.breakout.Field(
+        x=0, y=0, width=47, height=30, padding=10
+    )
+    paddle = arcade_nuke.breakout.Paddle(x=400, y=field.bottom_edge - 20)
+    ball = arcade_nuke.breakout.Ball(x=900, y=field.bottom_edge - 140)
+    bricks = arcade_nuke.breakout.BrickField()
+
+    autopilot = arcade_nuke.breakout.Autopilot()
+
+    # Ball reaches the paddle row after 108 pixels on the Y axis, the
+    # right wall is reached after 100 pixels on the X axis.
+    ball.motion_vector = Vector(1, 1)
+    assert autopilot.predict(ball, paddle, field, bricks) == 998
+
+    target = int(round(998 - paddle.width() / 2.0))
+    assert autopilot.target(ball, paddle, field, bricks) == target
+
+    # Prediction is cached until the ball bounces.
+    ball.move_to(ball.position + Vector(10, 10))
+    assert autopilot.target(ball, paddle, field, bricks) == target
+
+    # Bricks in the trajectory reflect the ball.
+    bricks.add(800, field.bottom_edge - 200, node_class="Grade", label="0")
+    ball.motion_vector = Vector(0, -1)
+    ball.move_to(Vector(820, field.bottom_edge - 140))
+
+    target = int(round(826 - paddle.width() / 2.0))
+    assert autopilot.target(ball, paddle, field, bricks) == target
+    assert autopilot.prediction == 826
+
+
+def test_autopilot_wall_bounce():
+    """Prediction is computed again when the ball bounces off a wall."""
+    import arcade_nuke.breakout
+    from arcade_nuke.logic import Vector
+
+    field = arcade_nuke.breakout.Field(
+        x=0, y=0, width=47, height=30, padding=10
+    )
+    paddle = arcade_nuke.breakout.Paddle(x=400, y=field.bottom_edge - 20)
+    ball = arcade_nuke.breakout.Ball(x=500, y=field.bottom_edge - 140)
+    bricks = arcade_nuke.breakout.BrickField()
+
+    autopilot = arcade_nuke.breakout.Autopilot()
+
+    ball.motion_vector = Vector(1, 1)
+    autopilot.target(ball, paddle, field, bricks)
+    prediction = autopilot.prediction
+
+    # Walls reflect the motion vector of the ball in place.
+    ball.motion_vector *= Vector(-1, 1)
+    autopilot.target(ball, paddle, field, bricks)
+    assert autopilot.prediction == autopilot.predict(
+        ball, paddle, field, bricks
+    )
+    assert autopilot.prediction != prediction
+
+
+def test_autopilot_play(mocker):
+    """Autopilot clears a level without a human playing."""
+    import arcade_nuke.base
+    import arcade_nuke.benchmark
+    import arcade_nuke.breakout
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        autopilot=arcade_nuke.breakout.Autopilot(aim=0.3)
+    )
+    game.initialize()
+
+    arcade_nuke.benchmark.play(game, steps=120 * 600)
+    assert game._ball.position.y <= game._field.bottom_edge
+    assert game._bricks.alive_count() == 0
+
+    # Errors added to each prediction make the paddle miss the ball.
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        autopilot=arcade_nuke.breakout.Autopilot(error=500, seed=0)
+    )
+    game.initialize()
+
+    arcade_nuke.benchmark.play(game, steps=120 * 600)
+    assert game._ball.position.y > game._field.bottom_edge
+
+
+def test_procedural_generator():
+    """Random patterns are reproducible and fit in a scaled field."""
+    import arcade_nuke.breakout
+
+    generator = arcade_nuke.breakout.procedural_generator(
+        5000, density=0.5, seed=3
+    )
+    bricks = generator(x=0, y=0)
+
+    assert len(bricks) == 5000
+    assert [brick.position for brick in bricks] == [
+        brick.position for brick in generator(x=0, y=0)
+    ]
+
+    field = arcade_nuke.breakout.Field(
+        x=0, y=0, width=generator.field_size[0],
+        height=generator.field_size[1], padding=10
+    )
+    assert field.right_edge >= max(
+        brick.position.x + brick.width() for brick in bricks
+    )
+    assert field.bottom_edge - 400 >= max(
+        brick.position.y + brick.height() for brick in bricks
+    )
+
+    # Node classes follow the weights given.
+    generator = arcade_nuke.breakout.procedural_generator(
+        200, node_classes={"Grade": 1, "Blur": 0}, seed=3
+    )
+    assert set(brick.node_class for brick in generator(x=0, y=0)) == {
+        "Grade"
+    }
+
+
+def test_procedural_generator_clustering():
+    """Clustered bricks have more neighbours than scattered bricks."""
+    import arcade_nuke.breakout
+
+    def _neighbours(generator):
+        positions = set(
+            (brick.position.x, brick.position.y)
+            for brick in generator(x=0, y=0)
+        )
+        return sum(
+            (x + 89, y) in positions or (x, y + 25) in positions
+            for x, y in positions
+        )
+
+    scattered = arcade_nuke.breakout.procedural_generator(
+        500, density=0.2, clustering=0.0
+    )
+    clustered = arcade_nuke.breakout.procedural_generator(
+        500, density=0.2, clustering=0.9
+    )
+
+    assert _neighbours(clustered) > 2 * _neighbours(scattered)
+
+
+def test_prepare(mocker, fake_nuke_session):
+    """Nodes created ahead of time are revealed on initialization."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    import arcade_nuke.utility
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1
+    )
+
+    job = arcade_nuke.utility.PreparationJob(game.prepare(), maximum_steps=50)
+    job.start()
+
+    while not job.finished():
+        job._process()
+
+    nodes = fake_nuke_session.allNodes()
+    assert len(nodes) == 152 + 2 + 70
+    assert all(node.ypos() >= 20000 for node in nodes)
+    assert all(node["disable"].value() for node in nodes)
+
+    # Nodes are only moved and enabled, none is created.
+    fake_nuke_session.calls.clear()
+    assert game.initialize() == 152 + 2 + 70
+    assert not any(
+        name.startswith("nodes.") for name in fake_nuke_session.calls
+    )
+    assert fake_nuke_session.count("Knob.setValue") == 152 + 2 + 70
+
+    assert all(not node["disable"].value() for node in nodes)
+    assert all(node.ypos() < 20000 for node in nodes)
+    assert all(not node.dirty() for node in game.nodes())
+
+    # Preparation stops once the game is initialized.
+    assert list(game.prepare()) == []
+
+
+def test_field_arena(mocker, fake_nuke_session):
+    """Games sharing an arena only swap bricks, ball and paddle."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    import arcade_nuke.invaders
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    arena = arcade_nuke.breakout.FieldArena()
+
+    game1 = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1, arena=arena
+    )
+    game2 = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator2, arena=arena
+    )
+    game3 = arcade_nuke.invaders.InvadersGame(seed=0, arena=arena)
+    assert game1._field is game2._field is game3._field
+    assert len(arena.fields) == 1
+
+    assert game1.initialize() == 152 + 2 + 70
+    assert len(game1.nodes()) == 2 + 70
+    game1.release()
+
+    # Nodes of the field are kept when the game is released.
+    assert len(fake_nuke_session.allNodes()) == 152
+
+    count = len(game2._bricks)
+    assert game2.initialize() == 2 + count
+    assert len(fake_nuke_session.allNodes()) == 152 + 2 + count
+    game2.release()
+
+    game3.initialize()
+    game3.release()
+
+    arena.release()
+    assert fake_nuke_session.allNodes() == []
+    assert arena.fields == []
+
+    with pytest.raises(ValueError):
+        arcade_nuke.breakout.BreakoutGame(
+            generator=arcade_nuke.breakout.brick_generator1, arena=arena,
+            snapshot=True
+        )
+
+
+def test_snapshot_restore(mocker, fake_nuke_session):
+    """Level is restored from its snapshot only when nodes differ."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    from arcade_nuke.logic import Vector
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1, snapshot=True
+    )
+    assert game.initialize() == 152 + 2 + 70
+
+    positions = dict(
+        (node.name(), (node.xpos(), node.ypos()))
+        for node in fake_nuke_session.allNodes()
+    )
+
+    # Clean level is not touched.
+    fake_nuke_session.calls.clear()
+    assert game.initialize() == 0
+    assert fake_nuke_session.count("delete", "nodePaste", "nodeCopy") == 0
+
+    game._ball.place(game._ball.position + Vector(40, -60))
+    game._ball.render()
+    game._paddle.place(game._paddle.position + Vector(-100, 0))
+    game._paddle.render()
+    game._bricks.destroy(3)
+    game._bricks.delete_node(3)
+
+    assert len(fake_nuke_session.allNodes()) == 152 + 2 + 69
+
+    fake_nuke_session.calls.clear()
+    assert game.initialize() == 152 + 2 + 70
+    assert fake_nuke_session.count("nodePaste") == 1
+    assert fake_nuke_session.count("delete") == 152 + 2 + 69
+    assert fake_nuke_session.count("nodeCopy") == 0
+
+    assert dict(
+        (node.name(), (node.xpos(), node.ypos()))
+        for node in fake_nuke_session.allNodes()
+    ) == positions
+
+    # Simulation state is reset with the nodes.
+    assert not game._ball.dirty()
+    assert not game._paddle.dirty()
+    assert game._bricks.alive_count() == 70
+    assert game._bricks.dirty_count() == 0
+
+    fake_nuke_session.calls.clear()
+    assert game.initialize() == 0
+    assert fake_nuke_session.count("nodePaste") == 0
+
+
+def test_fixed_point_determinism(mocker):
+    """Simulations in fixed point are identical with the same input."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    def _play(inputs):
+        """Return state of the game after each input."""
+        game = arcade_nuke.breakout.BreakoutGame(
+            generator=arcade_nuke.breakout.brick_generator1,
+            fixed_point=True
+        )
+        game.initialize()
+
+        states = []
+
+        for x in inputs:
+            game._input = x
+
+            try:
+                game._simulate(game._simulation_step)
+            except arcade_nuke.base.GameOver:
+                break
+
+            states.append((
+                game._ball._fixed_position, game._ball.motion_vector,
+                game._ball.position, game._paddle.position,
+                game._bricks.bitset(), game.elapsed
+            ))
+
+        game.release()
+        return states
+
+    # Inputs recorded from the autopilot destroy bricks in the first run.
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        fixed_point=True, autopilot=arcade_nuke.breakout.Autopilot(aim=0.3)
+    )
+    game.initialize()
+
+    inputs = []
+
+    for _ in range(120 * 60):
+        game._input = game._capture_input()
+        inputs.append(game._input)
+        game._simulate(game._simulation_step)
+
+    destroyed = len(game._bricks) - game._bricks.alive_count()
+    assert destroyed > 0
+    game.release()
+
+    states = _play(inputs)
+    assert len(states) == len(inputs)
+    assert states == _play(inputs)
+    assert states[-1][4] == game._bricks.bitset()
@@ -0,0 +1,167 @@
+# :coding: utf-8
+
+import os
+
+import pytest
+
+
+@pytest.fixture()
+def game(mocker):
+    """Return initialized game with a few bricks destroyed."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    from arcade_nuke.logic import Vector
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1
+    )
+    game.initialize()
+
+    for index in [0, 9, 42]:
+        game._bricks.destroy(index)
+        game._bricks.delete_node(index)
+
+    game._paddle.place(Vector(420, 600))
+    game._paddle.render()
+    game._ball.place(Vector(300.5, 250.25))
+    game._ball.render()
+    game._ball.motion_vector = Vector(0.6, -0.8)
+    return game
+
+
+def test_checkpoint_round_trip(game):
+    """Checkpoint is serialized in a few dozen bytes."""
+    import arcade_nuke.checkpoint
+
+    checkpoint = game.checkpoint()
+    data = checkpoint.to_bytes()
+    assert len(data) < 80
+
+    _checkpoint = arcade_nuke.checkpoint.Checkpoint.from_bytes(
+        data, checkpoint.level
+    )
+    assert _checkpoint.paddle == checkpoint.paddle
+    assert _checkpoint.ball == checkpoint.ball
+    assert _checkpoint.motion_vector == checkpoint.motion_vector
+    assert _checkpoint.bricks == checkpoint.bricks
+    assert _checkpoint.count == 70
+
+    with pytest.raises(ValueError):
+        arcade_nuke.checkpoint.Checkpoint.from_bytes(data, "other")
+
+    with pytest.raises(ValueError):
+        arcade_nuke.checkpoint.Checkpoint.from_bytes(data[:10], "other")
+
+
+def test_checkpoint_paddle_rounding(game):
+    """Position of the paddle is rounded to whole pixels."""
+    import arcade_nuke.checkpoint
+    from arcade_nuke.logic import Vector
+
+    game._paddle.place(Vector(420.6, 599.5))
+
+    checkpoint = arcade_nuke.checkpoint.Checkpoint.from_bytes(
+        game.checkpoint().to_bytes(), game.level
+    )
+    assert checkpoint.paddle == Vector(421, 600)
+
+
+def test_checkpoint_fixed_point(mocker):
+    """Checkpoint is only restored in the simulation mode it was taken."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    import arcade_nuke.checkpoint
+    import arcade_nuke.logic
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1, fixed_point=True
+    )
+    game.initialize()
+    game._input = 300
+
+    for _ in range(50):
+        game._simulate(game._simulation_step)
+
+    checkpoint = game.checkpoint()
+    assert checkpoint.fixed_point
+
+    data = checkpoint.to_bytes()
+
+    with pytest.raises(ValueError):
+        arcade_nuke.checkpoint.Checkpoint.from_bytes(data, game.level)
+
+    _checkpoint = arcade_nuke.checkpoint.Checkpoint.from_bytes(
+        data, game.level, fixed_point=True
+    )
+    assert _checkpoint.motion_vector == checkpoint.motion_vector
+    assert isinstance(_checkpoint.motion_vector.x, int)
+
+    _game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1
+    )
+
+    with pytest.raises(ValueError):
+        _game.restore_checkpoint(checkpoint)
+
+    game.initialize()
+    game.restore_checkpoint(_checkpoint)
+    assert game._ball.position == checkpoint.ball
+    assert game._ball._fixed_position == (
+        arcade_nuke.logic.to_fixed(checkpoint.ball)
+    )
+
+
+def test_checkpoint_save(game, temporary_directory, fake_nuke_session):
+    """Checkpoint is saved next to the script by default."""
+    import arcade_nuke.checkpoint
+
+    checkpoint = game.checkpoint()
+
+    with pytest.raises(RuntimeError):
+        checkpoint.save()
+
+    fake_nuke_session.script_name = os.path.join(
+        temporary_directory, "script.nk"
+    )
+
+    path = checkpoint.save()
+    assert path == os.path.join(
+        temporary_directory, "script.{}.checkpoint".format(checkpoint.level)
+    )
+
+    _checkpoint = arcade_nuke.checkpoint.Checkpoint.load(checkpoint.level)
+    assert _checkpoint.to_bytes() == checkpoint.to_bytes()
+
+
+def test_restore_checkpoint(game, nuke_budget):
+    """Only nodes which differ from the checkpoint are updated."""
+    checkpoint = game.checkpoint()
+    assert game.initialize() == 3 + 2
+
+    with nuke_budget(3 + 2, "delete", "Node.setXpos", "Node.setXYpos"):
+        assert game.restore_checkpoint(checkpoint) == 3 + 2
+
+    assert [index for index in range(70) if not game._bricks.alive(index)] \
+        == [0, 9, 42]
+    assert game._ball.position == checkpoint.ball
+    assert game._paddle.position == checkpoint.paddle
+    assert game._ball.motion_vector == checkpoint.motion_vector
+
+    assert not game._bricks.exists(0)
+    assert game._bricks.exists(1)
+
+
+def test_restore_checkpoint_error(game):
+    """Checkpoint taken on another level cannot be restored."""
+    import arcade_nuke.breakout
+
+    _game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator2
+    )
+
+    with pytest.raises(ValueError):
+        _game.restore_checkpoint(game.checkpoint())
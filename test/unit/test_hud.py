@@ -0,0 +1,30 @@
+# :coding: utf-8
+
+
+def test_sparkline():
+    """Values are drawn relative to the maximum and clamped."""
+    import arcade_nuke.hud
+
+    line = arcade_nuke.hud.sparkline([0, 0.5, 1, 2, 4], maximum=2, width=4)
+    assert line == u"▂▄██"
+    assert arcade_nuke.hud.sparkline([1, 2], maximum=0) == u"  "
+
+
+def test_format_performance():
+    """Statistics are followed by the sparkline of tick durations."""
+    import arcade_nuke.hud
+
+    text = arcade_nuke.hud.format_performance({
+        "ticks_per_second": 59.6,
+        "median": 0.0012,
+        "maximum": 0.0048,
+        "writes": 6,
+        "budget": 0.016,
+        "durations": [0.002, 0.004, 0.016],
+        "game": {"bricks": 64, "ball_speed": 300.0},
+    })
+
+    assert text == (
+        u"60 tps | median 1.2 ms | worst 4.8 ms | 6.0 writes/tick | "
+        u"ball speed 300.0 | bricks 64\n▁▂█"
+    )
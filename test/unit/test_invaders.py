@@ -0,0 +1,83 @@
+# :coding: utf-8
+
+
+def test_formation_hit():
+    """Points are resolved to invaders alive with the grid arithmetic."""
+    import arcade_nuke.invaders
+    from arcade_nuke.logic import Vector
+
+    formation = arcade_nuke.invaders.Formation(
+        x=100, y=100, rows=5, columns=11
+    )
+    assert formation.alive_count() == 55
+
+    assert formation.hit(Vector(106, 106)) == 0
+    assert formation.hit(Vector(186, 136)) == 13
+    assert formation.hit(Vector(125, 106)) is None
+    assert formation.hit(Vector(125, 106), radius=6) is None
+    assert formation.hit(Vector(114, 106), radius=6) == 0
+    assert formation.hit(Vector(50, 106)) is None
+
+    formation.destroy(13)
+    assert formation.hit(Vector(186, 136)) is None
+    assert formation.shooter(2) == 46
+    assert formation.alive_count() == 54
+
+    # Bounds follow the columns alive.
+    for row in range(5):
+        formation.destroy(row * 11)
+
+    assert formation.alive_columns() == list(range(1, 11))
+
+
+def test_formation_render(fake_nuke_session, nuke_budget):
+    """All invaders alive are moved in one pass when the offset changes."""
+    import arcade_nuke.invaders
+
+    formation = arcade_nuke.invaders.Formation(
+        x=100, y=100, rows=5, columns=11
+    )
+    formation.reset(force=True)
+
+    formation.advance(0.5, left_edge=0, right_edge=1000)
+
+    # Nodes are not looked up again when rendering.
+    with nuke_budget(0, "toNode"):
+        assert formation.render() == 55
+
+    assert fake_nuke_session.count("Node.setXpos") == 55 * 2
+    assert fake_nuke_session.allNodes()[12].xpos() == 155
+
+    # Nodes are not written if the offset is the same.
+    with nuke_budget(0):
+        assert formation.render() == 0
+
+    formation.destroy(3)
+    formation.advance(0.5, left_edge=0, right_edge=1000)
+    assert formation.render() == 54
+    assert formation.delete_destroyed() == 1
+
+    # Formation drops and reverses when reaching a wall.
+    bottom = formation.bottom_edge
+    formation.advance(0.5, left_edge=0, right_edge=520)
+    assert formation.bottom_edge == bottom + 15
+
+
+def test_bullet_pool():
+    """Bullets are recycled instead of creating nodes."""
+    import arcade_nuke.invaders
+    from arcade_nuke.logic import Vector
+
+    pool = arcade_nuke.invaders.BulletPool(size=2, x=0, y=0)
+
+    assert pool.fire(Vector(10, 10), Vector(0, -100)) == 0
+    assert pool.fire(Vector(20, 10), Vector(0, -100)) == 1
+    assert pool.fire(Vector(30, 10), Vector(0, -100)) is None
+
+    pool.move(0.1)
+    assert pool[0].position == Vector(10, 0)
+
+    pool.release(0)
+    assert pool.active() == [1]
+    assert pool[0].position == Vector(0, 0)
+    assert pool.fire(Vector(30, 10), Vector(0, -100)) == 0
@@ -29,3 +29,36 @@ def test_collision_threshold(mocker):
     node1.middle_position = Vector(0, 0)
     node2.middle_position = Vector(5, 0)
     assert arcade_nuke.logic.collision(node1, node2, threshold=4) is None
+
+
+def test_fixed_divide():
+    """Integer division is rounded symmetrically."""
+    import arcade_nuke.logic
+    from arcade_nuke.logic import Vector
+
+    assert arcade_nuke.logic.fixed_divide(Vector(5, -5), 2) == Vector(3, -3)
+    assert arcade_nuke.logic.fixed_divide(Vector(4, -4), 3) == Vector(1, -1)
+    assert arcade_nuke.logic.fixed_divide(Vector(0, 7), 7) == Vector(0, 1)
+
+
+def test_bounce_fixed_point():
+    """Fixed-point reflection only uses integer values."""
+    import arcade_nuke.logic
+    from arcade_nuke.logic import Vector
+
+    motion_vector = arcade_nuke.logic.to_fixed(Vector(1, -3))
+    assert motion_vector == Vector(256, -768)
+
+    result = arcade_nuke.logic.bounce(
+        motion_vector, Vector(0, 1), fixed_point=True
+    )
+    assert result == Vector(256, 768)
+
+    push_vector = arcade_nuke.logic.quantize(Vector(8.5, 20).unit_vector())
+    result = arcade_nuke.logic.bounce(
+        motion_vector, push_vector * -1, fixed_point=True
+    )
+    assert all(isinstance(value, int) for value in result)
+    assert result == arcade_nuke.logic.bounce(
+        motion_vector, push_vector * -1, fixed_point=True
+    )
@@ -0,0 +1,96 @@
+# :coding: utf-8
+
+import json
+import os
+import pstats
+
+
+def test_capture(mocker, temporary_directory):
+    """Ticks are profiled only while the capture is active."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    import arcade_nuke.profiler
+    import arcade_nuke.scheduler
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    scheduler = arcade_nuke.scheduler.TickScheduler()
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        autopilot=arcade_nuke.breakout.Autopilot(),
+        services=arcade_nuke.base.GameServices(scheduler=scheduler)
+    )
+    game.initialize()
+    game.start()
+
+    (timer,) = scheduler.timers
+    assert timer.timeout._callbacks == [game._process]
+
+    capture = arcade_nuke.profiler.Capture(game, temporary_directory)
+    capture.start()
+    assert capture.active()
+
+    for _ in range(10):
+        timer.timeout.emit()
+
+    paths = capture.stop()
+    assert not capture.active()
+    assert capture.stop() is None
+
+    # The original callback is restored once the capture is stopped.
+    assert timer.timeout._callbacks == [game._process]
+
+    stats = pstats.Stats(paths["pstats"])
+    assert any(name == "_process" for _, _, name in stats.stats)
+
+    with open(paths["collapsed"]) as stream:
+        lines = stream.read().splitlines()
+
+    assert len(lines) > 0
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("_process (breakout.py") for line in lines)
+
+    with open(paths["metadata"]) as stream:
+        metadata = json.load(stream)
+
+    assert metadata["script_nodes"] == 152 + 2 + 70
+    assert metadata["settings"]["game"] == "BreakoutGame"
+    assert metadata["settings"]["level"] == "brick_generator1"
+    assert all(os.path.dirname(path) == temporary_directory
+               for path in paths.values())
+
+    game.release()
+    assert scheduler.timers == []
+
+
+def test_collapse():
+    """Time of each function is split between the stacks calling it."""
+    import arcade_nuke.profiler
+
+    root = ("game.py", 1, "tick")
+    render = ("game.py", 10, "render")
+    place = ("node.py", 5, "place")
+
+    stats = mock_stats({
+        root: (1, 1, 0.1, 1.0, {}),
+        render: (2, 2, 0.2, 0.6, {root: (2, 2, 0.2, 0.6)}),
+        place: (
+            4, 4, 0.5, 0.5, {
+                root: (2, 2, 0.25, 0.25), render: (2, 2, 0.25, 0.25),
+            }
+        ),
+    })
+
+    assert arcade_nuke.profiler.collapse(stats) == {
+        "tick (game.py:1)": 150000,
+        "tick (game.py:1);render (game.py:10)": 350000,
+        "tick (game.py:1);place (node.py:5)": 250000,
+        "tick (game.py:1);render (game.py:10);place (node.py:5)": 250000,
+    }
+
+
+def mock_stats(values):
+    """Return object with the *values* of :class:`pstats.Stats`."""
+    stats = type("Stats", (object,), {})()
+    stats.stats = values
+    return stats
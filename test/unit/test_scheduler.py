@@ -0,0 +1,158 @@
+# :coding: utf-8
+
+
+def test_scheduler_order(mocker):
+    """Due timers are triggered by priority and in order of creation."""
+    import arcade_nuke.scheduler
+
+    timer = mocker.patch.object(
+        arcade_nuke.scheduler.timeit, "default_timer"
+    )
+    timer.return_value = 0.0
+
+    scheduler = arcade_nuke.scheduler.TickScheduler()
+    calls = []
+
+    for name, interval, priority in [
+        ("slow", 1000, -1), ("game1", 10, 0), ("game2", 20, 0),
+        ("input", 10, 5)
+    ]:
+        _timer = scheduler.create_timer(name, priority=priority)
+        _timer.setInterval(interval)
+        _timer.timeout.connect(lambda _name=name: calls.append(_name))
+        _timer.start()
+
+    assert [_timer.name for _timer in scheduler.timers] == [
+        "input", "game1", "game2", "slow"
+    ]
+    assert scheduler.interval == 10
+
+    for index in range(1, 5):
+        timer.return_value = index * 0.01
+        scheduler._process()
+
+    assert calls == [
+        "input", "game1",
+        "input", "game1", "game2",
+        "input", "game1",
+        "input", "game1", "game2",
+    ]
+
+    statistics = dict(scheduler.statistics())
+    assert statistics["game1"]["calls"] == 4
+    assert statistics["slow"]["calls"] == 0
+
+    # Scheduler follows the shortest interval of active timers.
+    for _timer in scheduler.timers[:2]:
+        _timer.stop()
+
+    assert scheduler.interval == 20
+
+    for _timer in scheduler.timers:
+        _timer.deleteLater()
+
+    assert scheduler.interval is None
+    assert scheduler.timers == []
+
+
+def test_scheduler_games(mocker):
+    """Several games with field offsets are driven by one scheduler."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    import arcade_nuke.scheduler
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    timer = mocker.patch.object(arcade_nuke.base.timeit, "default_timer")
+    timer.return_value = 0.0
+    mocker.patch.object(
+        arcade_nuke.scheduler.timeit, "default_timer", timer
+    )
+
+    scheduler = arcade_nuke.scheduler.TickScheduler()
+    services = arcade_nuke.base.GameServices(scheduler=scheduler)
+
+    games = [
+        arcade_nuke.breakout.BreakoutGame(
+            generator=arcade_nuke.breakout.brick_generator1,
+            autopilot=arcade_nuke.breakout.Autopilot(),
+            offset=(1100 * index, 0), services=services,
+            name="player{}".format(index + 1)
+        )
+        for index in range(2)
+    ]
+
+    for game in games:
+        game.initialize()
+        game.start()
+
+    assert games[1]._field.left_edge == games[0]._field.left_edge + 1100
+    assert games[1]._bricks[0].position.x == (
+        games[0]._bricks[0].position.x + 1100
+    )
+
+    for index in range(1, 31):
+        timer.return_value = index / 60.0
+        scheduler._process()
+
+    for game in games:
+        assert (
+            game._field.left_edge <= game._paddle.position.x <=
+            game._field.right_edge
+        )
+        assert game._ball.position != game._ball._position
+
+    assert [name for name, _ in scheduler.statistics()] == [
+        "player1", "player2"
+    ]
+    assert all(
+        values["calls"] == 30 for _, values in scheduler.statistics()
+    )
+
+    for game in games:
+        game.release()
+
+    assert scheduler.timers == []
+
+
+def test_scheduler_errors(mocker, caplog):
+    """Error raised by one timer does not prevent the others to trigger."""
+    import arcade_nuke.scheduler
+
+    timer = mocker.patch.object(
+        arcade_nuke.scheduler.timeit, "default_timer"
+    )
+    timer.return_value = 0.0
+
+    scheduler = arcade_nuke.scheduler.TickScheduler()
+    calls = []
+
+    def _raise():
+        calls.append("broken")
+        raise ValueError("Broken consumer")
+
+    for name, callback in [
+        ("first", lambda: calls.append("first")),
+        ("broken", _raise),
+        ("last", lambda: calls.append("last")),
+    ]:
+        _timer = scheduler.create_timer(name)
+        _timer.setInterval(10)
+        _timer.timeout.connect(callback)
+        _timer.start()
+
+    for index in range(1, 3):
+        timer.return_value = index * 0.01
+        scheduler._process()
+
+    assert calls == ["first", "broken", "last"] * 2
+
+    errors = [
+        record for record in caplog.records if record.levelname == "ERROR"
+    ]
+    assert len(errors) == 2
+    assert "'broken'" in errors[0].getMessage()
+    assert errors[0].exc_info[0] is ValueError
+
+    statistics = dict(scheduler.statistics())
+    assert statistics["broken"]["calls"] == 2
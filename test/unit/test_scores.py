@@ -0,0 +1,216 @@
+# :coding: utf-8
+
+import os
+import sqlite3
+
+
+def test_store_leaderboard(temporary_directory):
+    """Finished sessions are ranked by outcome, destruction and duration."""
+    import arcade_nuke.scores
+
+    path = os.path.join(temporary_directory, "nuke", "scores.sqlite")
+
+    store = arcade_nuke.scores.ScoreStore(
+        path, context={"machine": "test"}, batch_interval=0.01
+    )
+
+    for outcome, duration, destroyed in [
+        ("lost", 30.0, 12), ("won", 90.0, 70), (None, 5.0, 2),
+        ("won", 60.0, 70), ("lost", 20.0, 40),
+    ]:
+        store.record({
+            "game": "BreakoutGame", "level": "brick_generator1",
+            "outcome": outcome, "duration": duration,
+            "bricks_destroyed": destroyed, "ticks": 100,
+            "tick_mean": 0.002, "tick_max": 0.01,
+        })
+
+    store.flush()
+
+    leaderboard = store.leaderboard("brick_generator1")
+    assert [
+        (item["won"], item["destroyed"], item["duration"])
+        for item in leaderboard
+    ] == [(1, 70, 60.0), (1, 70, 90.0), (0, 40, 20.0), (0, 12, 30.0)]
+    assert all(item["machine"] == "test" for item in leaderboard)
+
+    assert store.leaderboard("brick_generator2") == []
+
+    store.close()
+
+    # Queries are resolved from the indices.
+    connection = sqlite3.connect(path)
+    plan = " ".join(
+        str(row[-1]) for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM session "
+            "WHERE level = ? AND won IS NOT NULL "
+            "ORDER BY won DESC, destroyed DESC, duration LIMIT 10",
+            ("brick_generator1",)
+        )
+    )
+    connection.close()
+
+    assert "session_leaderboard" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_store_performance_trend(temporary_directory):
+    """Tick durations are aggregated for each day."""
+    import arcade_nuke.scores
+
+    path = os.path.join(temporary_directory, "scores.sqlite")
+    store = arcade_nuke.scores.ScoreStore(path, batch_interval=60)
+
+    day = 86400.0
+    for time, machine, ticks, tick_mean, tick_max in [
+        (0.0, "a", 100, 0.002, 0.010),
+        (10.0, "a", 300, 0.004, 0.020),
+        (day, "a", 100, 0.003, 0.005),
+        (day, "b", 100, 0.100, 0.500),
+    ]:
+        store.record({
+            "time": time, "machine": machine, "level": "invaders",
+            "outcome": "lost", "ticks": ticks, "tick_mean": tick_mean,
+            "tick_max": tick_max,
+        })
+
+    # Records queued are inserted when the store is closed.
+    store.close()
+
+    trend = store.performance_trend("a", "invaders")
+    assert [item["day"] for item in trend] == ["1970-01-01", "1970-01-02"]
+    assert [item["sessions"] for item in trend] == [2, 1]
+    assert abs(trend[0]["tick_mean"] - 0.0035) < 1e-9
+    assert trend[0]["tick_max"] == 0.020
+
+
+def test_store_errors(temporary_directory, caplog):
+    """Records which cannot be inserted are logged and skipped."""
+    import arcade_nuke.scores
+
+    path = os.path.join(temporary_directory, "scores.sqlite")
+    store = arcade_nuke.scores.ScoreStore(path, batch_interval=0.01)
+
+    # Values which cannot be stored in the database.
+    store.record({"level": "invaders", "duration": object()})
+    store.flush()
+
+    # Records which are not session summaries.
+    store._queue.put({"level": "invaders"})
+    store.flush()
+
+    store.record({"level": "invaders", "outcome": "won", "duration": 1.0})
+    store.close()
+
+    errors = [
+        record for record in caplog.records if record.levelname == "ERROR"
+    ]
+    assert len(errors) == 2
+    assert path in errors[0].getMessage()
+
+    assert [
+        item["duration"] for item in store.leaderboard("invaders")
+    ] == [1.0]
+
+
+def test_game_records_outcome(mocker):
+    """Result of the session is recorded when the game is over."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    store = mocker.Mock()
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        services=arcade_nuke.base.GameServices(store=store)
+    )
+    game._capture_input = lambda: 300
+    game.initialize()
+    game.start()
+
+    game._tick = mocker.Mock(side_effect=arcade_nuke.base.GameOver())
+    game._process()
+
+    (record,), _ = store.record.call_args
+    assert record["outcome"] == "lost"
+    assert record["level"] == "brick_generator1"
+    assert record["bricks_destroyed"] == 0
+    assert record["ticks"] == 1
+
+
+def test_game_records_session_once(mocker):
+    """Pauses accumulate the session, which is recorded once."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    store = mocker.Mock()
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        services=arcade_nuke.base.GameServices(store=store)
+    )
+    game._capture_input = lambda: 300
+    game.initialize()
+
+    for _ in range(3):
+        game.start()
+        game._process()
+        game._process()
+        game.stop()
+
+    assert store.record.call_count == 0
+
+    game.start()
+    game._tick = mocker.Mock(side_effect=arcade_nuke.base.GameOver())
+    game._process()
+
+    assert store.record.call_count == 1
+    (record,), _ = store.record.call_args
+    assert record["outcome"] == "lost"
+    assert record["ticks"] == 7
+
+    # Nothing is left to record once the game is released.
+    game.release()
+    assert store.record.call_count == 1
+
+
+def test_game_records_interrupted_session(mocker):
+    """Session interrupted before the game is over is recorded once."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    store = mocker.Mock()
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        services=arcade_nuke.base.GameServices(store=store)
+    )
+    game._capture_input = lambda: 300
+    game.initialize()
+
+    game.start()
+    game._process()
+    game.stop()
+
+    # Initializing the game again starts a new session.
+    game.initialize()
+    assert store.record.call_count == 1
+    (record,), _ = store.record.call_args
+    assert record["outcome"] is None
+    assert record["ticks"] == 1
+
+    game.start()
+    game._process()
+    game._process()
+    game.stop()
+
+    game.release()
+    assert store.record.call_count == 2
+    (record,), _ = store.record.call_args
+    assert record["ticks"] == 2
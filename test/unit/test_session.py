@@ -0,0 +1,59 @@
+# :coding: utf-8
+
+
+def test_session_close(mocker):
+    """Closing a session releases the game and all connections."""
+    import arcade_nuke.session
+
+    count = arcade_nuke.session.GameSession.open_count()
+
+    game = mocker.Mock(
+        nodes=lambda: [
+            mocker.Mock(exists=lambda: True),
+            mocker.Mock(exists=lambda: False),
+        ]
+    )
+    signal = mocker.Mock()
+    slot = mocker.Mock()
+
+    session = arcade_nuke.session.GameSession("Breakout 1", game)
+    session.connect(signal, slot)
+
+    assert arcade_nuke.session.GameSession.open_count() == count + 1
+    assert session.leaks() == {
+        "sessions": count + 1, "connections": 1, "nodes": 1
+    }
+
+    session.close()
+    session.close()
+
+    signal.connect.assert_called_once_with(slot)
+    signal.disconnect.assert_called_once_with(slot)
+    game.release.assert_called_once_with()
+
+    assert session.closed()
+    assert session.connection_count() == 0
+    assert arcade_nuke.session.GameSession.open_count() == count
+
+
+def test_session_close_error(mocker):
+    """Session is closed even if the game fails to be released."""
+    import pytest
+    import arcade_nuke.session
+
+    count = arcade_nuke.session.GameSession.open_count()
+
+    game = mocker.Mock()
+    game.release.side_effect = RuntimeError("Timer already deleted")
+
+    session = arcade_nuke.session.GameSession("Breakout 1", game)
+
+    with pytest.raises(RuntimeError):
+        session.close()
+
+    assert session.closed()
+    assert arcade_nuke.session.GameSession.open_count() == count
+
+    session.close()
+    game.release.assert_called_once_with()
+    assert arcade_nuke.session.GameSession.open_count() == count
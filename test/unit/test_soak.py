@@ -0,0 +1,73 @@
+# :coding: utf-8
+
+
+def test_soak_run(mocker):
+    """Resources are sampled every few rounds of the game."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    import arcade_nuke.soak
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        autopilot=arcade_nuke.breakout.Autopilot()
+    )
+
+    report = arcade_nuke.soak.run(game, rounds=5, steps=120, interval=2)
+
+    samples = report["samples"]
+    assert [sample.round for sample in samples] == [1, 2, 4, 5]
+    assert all(sample.nuke_nodes == 152 + 2 + 70 for sample in samples)
+    assert all(sample.game_nodes == 152 + 2 + 70 for sample in samples)
+    assert samples[0].objects["arcade_nuke.breakout.FieldUnit"] >= 152
+
+    assert "nuke nodes" not in report["growth"]
+    assert "arcade_nuke.breakout.FieldUnit" not in report["growth"]
+    assert "round" in arcade_nuke.soak.format_report(report)
+
+
+def test_soak_undo(mocker):
+    """Rounds are played without recording undo history."""
+    import arcade_nuke.base
+    import arcade_nuke.benchmark
+    import arcade_nuke.breakout
+    import arcade_nuke.soak
+    import arcade_nuke.utility
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        autopilot=arcade_nuke.breakout.Autopilot()
+    )
+
+    states = []
+
+    def _play(_game, steps):
+        states.append(arcade_nuke.utility.undo_suppressor.active())
+        return steps
+
+    mocker.patch.object(arcade_nuke.benchmark, "play", side_effect=_play)
+
+    arcade_nuke.soak.run(game, rounds=3, steps=10, interval=2)
+    assert states == [True, True, True]
+
+
+def test_soak_growth():
+    """Resources which grow are reported first."""
+    import arcade_nuke.soak
+
+    samples = [
+        arcade_nuke.soak.Sample(
+            round=index, nuke_nodes=10 + index, game_nodes=10, memory=None,
+            objects={"arcade_nuke.logic.Vector": count}
+        )
+        for index, count in [(1, 100), (2, 150), (3, 120), (4, 500)]
+    ]
+
+    growth = arcade_nuke.soak.growth(samples)
+    assert list(growth.items()) == [
+        ("arcade_nuke.logic.Vector", (100, 500, False)),
+        ("nuke nodes", (11, 14, True)),
+    ]
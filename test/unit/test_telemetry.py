@@ -0,0 +1,127 @@
+# :coding: utf-8
+
+import os
+
+
+def test_sink_rotation(temporary_directory):
+    """Records are flushed to rotated files and read back in order."""
+    import arcade_nuke.telemetry
+
+    path = os.path.join(temporary_directory, "telemetry.jsonl")
+
+    sink = arcade_nuke.telemetry.TelemetrySink(
+        path, context={"machine": "test"}, flush_interval=60,
+        max_bytes=200, backup_count=2
+    )
+
+    for index in range(30):
+        sink.record({"type": "frame", "index": index, "tick": index / 100.0})
+        sink.flush()
+
+    sink.record_summary({"type": "session", "ticks": 30})
+    sink.close()
+
+    assert os.path.exists(path + ".1")
+    assert os.path.exists(path + ".2")
+    assert not os.path.exists(path + ".3")
+
+    records = list(arcade_nuke.telemetry.read_records(path))
+    indices = [record["index"] for record in records if "index" in record]
+    assert indices == sorted(indices)
+    assert indices[-1] == 29
+    assert records[-1] == {"type": "session", "ticks": 30, "machine": "test"}
+
+
+def test_aggregate(temporary_directory):
+    """Records are aggregated into percentile tables."""
+    import arcade_nuke.telemetry
+
+    path = os.path.join(temporary_directory, "telemetry.jsonl")
+
+    sink = arcade_nuke.telemetry.TelemetrySink(path, flush_interval=60)
+    for index in range(101):
+        sink.record({
+            "type": "frame", "tick": float(index), "writes": 4,
+            "machine": "a" if index % 2 else "b"
+        })
+    sink.close()
+
+    table = arcade_nuke.telemetry.aggregate(path)
+    assert table["all"]["tick"] == {50: 50.0, 90: 90.0, 99: 99.0}
+    assert table["all"]["writes"][99] == 4
+
+    table = arcade_nuke.telemetry.aggregate(
+        path, group_by="machine", fields=["tick"]
+    )
+    assert sorted(table.keys()) == ["a", "b"]
+    assert list(table["a"].keys()) == ["tick"]
+
+    assert "p50" in arcade_nuke.telemetry.format_table(table)
+
+
+def test_aggregate_context(temporary_directory):
+    """Tick records are grouped by values of the sink context."""
+    import arcade_nuke.telemetry
+
+    path = os.path.join(temporary_directory, "telemetry.jsonl")
+
+    for version, tick in [("13.0v1", 0.002), ("14.0v2", 0.004)]:
+        sink = arcade_nuke.telemetry.TelemetrySink(
+            path, context={"nuke_version": version}, flush_interval=60
+        )
+        for _ in range(10):
+            sink.record({"type": "frame", "tick": tick})
+        sink.close()
+
+    table = arcade_nuke.telemetry.aggregate(
+        path, group_by="nuke_version", fields=["tick"]
+    )
+    assert sorted(table.keys()) == ["13.0v1", "14.0v2"]
+    assert table["13.0v1"]["tick"][50] == 0.002
+    assert table["14.0v2"]["tick"][99] == 0.004
+
+
+def test_session_summary(mocker, temporary_directory):
+    """One summary is recorded per game, excluding the time paused."""
+    import arcade_nuke.base
+    import arcade_nuke.breakout
+    import arcade_nuke.telemetry
+
+    mocker.patch.object(arcade_nuke.base, "GameSignal")
+    timer = mocker.patch.object(arcade_nuke.base.timeit, "default_timer")
+    timer.return_value = 0.0
+
+    path = os.path.join(temporary_directory, "telemetry.jsonl")
+    sink = arcade_nuke.telemetry.TelemetrySink(path, flush_interval=60)
+
+    game = arcade_nuke.breakout.BreakoutGame(
+        generator=arcade_nuke.breakout.brick_generator1,
+        services=arcade_nuke.base.GameServices(telemetry=sink)
+    )
+    game._capture_input = lambda: 300
+    game.initialize()
+
+    for start in [10.0, 100.0]:
+        timer.return_value = start
+        game.start()
+        game._process()
+
+        timer.return_value = start + 5.0
+        game.stop()
+
+    game.start()
+    game._tick = mocker.Mock(side_effect=arcade_nuke.base.GameOver(True))
+    timer.return_value += 1.0
+    game._process()
+
+    game.release()
+    sink.close()
+
+    summaries = [
+        record for record in arcade_nuke.telemetry.read_records(path)
+        if record["type"] == "session"
+    ]
+    assert len(summaries) == 1
+    assert summaries[0]["outcome"] == "won"
+    assert summaries[0]["ticks"] == 3
+    assert summaries[0]["duration"] == 11.0
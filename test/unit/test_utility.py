@@ -0,0 +1,188 @@
+# :coding: utf-8
+
+import os
+
+import pytest
+
+
+def test_drawing_job(mocker):
+    """Nodes are created in bounded slices until finished or cancelled."""
+    import arcade_nuke.utility
+
+    points = [mocker.Mock() for _ in range(25)]
+
+    timer = mocker.patch.object(arcade_nuke.utility.timeit, "default_timer")
+    timer.return_value = 0.0
+
+    job = arcade_nuke.utility.DrawingJob(points, maximum_nodes=10)
+    job.start()
+
+    job._process()
+    assert len(job.points) == 10
+    assert not job.finished()
+
+    # Time budget is spent after the third node.
+    timer.side_effect = [1.0, 1.0, 1.0, 1.02]
+    job._process()
+    assert len(job.points) == 13
+
+    timer.side_effect = None
+    job._process()
+    job._process()
+    assert len(job.points) == 25
+    assert job.finished()
+
+    job.cancel()
+    assert job.points == []
+    assert all(point.destroy.call_count == 1 for point in points)
+
+
+def test_iter_game_over(mocker):
+    """Dots are yielded without creating nodes."""
+    import arcade_nuke.utility
+
+    create_node = mocker.patch.object(
+        arcade_nuke.utility.arcade_nuke.node.DotNode, "create_node"
+    )
+
+    points = list(arcade_nuke.utility.iter_game_over(x=0, y=0))
+    assert len(points) == 105
+    create_node.assert_not_called()
+
+
+def test_draw_game_over(fake_nuke_session):
+    """All dots are created at once."""
+    import arcade_nuke.utility
+
+    points = arcade_nuke.utility.draw_game_over(x=0, y=0)
+    assert len(points) == 105
+    assert len(fake_nuke_session.allNodes("Dot")) == 105
+
+    points = arcade_nuke.utility.draw_win(x=0, y=200)
+    assert len(fake_nuke_session.allNodes("Dot")) == 105 + len(points)
+
+
+def test_undo_suppressor(mocker):
+    """User undo state is restored when last acquisition is released."""
+    import arcade_nuke.utility
+
+    undo = mocker.patch.object(arcade_nuke.utility.nuke, "Undo")
+    undo.disabled.return_value = False
+
+    suppressor = arcade_nuke.utility.UndoSuppressor()
+    suppressor.acquire()
+    undo.disable.assert_called_once_with()
+
+    with suppressor:
+        assert suppressor.active()
+
+    undo.enable.assert_not_called()
+
+    suppressor.release()
+    undo.enable.assert_called_once_with()
+    assert not suppressor.active()
+
+    # Undo already disabled by the user is left untouched.
+    undo.reset_mock()
+    undo.disabled.return_value = True
+
+    try:
+        with suppressor:
+            raise ValueError()
+    except ValueError:
+        pass
+
+    undo.disable.assert_not_called()
+    undo.enable.assert_not_called()
+    assert not suppressor.active()
+
+
+def test_repaint_coalescer(mocker):
+    """Node Graph updates are held until the last release."""
+    import arcade_nuke.utility
+
+    def _widget(name):
+        widget = mocker.Mock()
+        widget.objectName.return_value = name
+        widget.updatesEnabled.return_value = True
+        return widget
+
+    dag, viewer = _widget("DAG.1"), _widget("Viewer.1")
+
+    all_widgets = mocker.patch.object(
+        arcade_nuke.utility.QtWidgets.QApplication, "allWidgets"
+    )
+    all_widgets.return_value = [viewer, dag]
+
+    coalescer = arcade_nuke.utility.RepaintCoalescer()
+
+    with coalescer:
+        with coalescer:
+            assert coalescer.active()
+
+        dag.setUpdatesEnabled.assert_called_once_with(False)
+
+    assert not coalescer.active()
+    assert dag.setUpdatesEnabled.call_args_list == [
+        mocker.call(False), mocker.call(True)
+    ]
+    viewer.setUpdatesEnabled.assert_not_called()
+
+    # Widgets are only searched again once deleted.
+    with coalescer:
+        pass
+
+    assert all_widgets.call_count == 1
+
+    dag.updatesEnabled.side_effect = RuntimeError()
+    _dag = _widget("DAG.2")
+    all_widgets.return_value = [_dag]
+
+    with coalescer:
+        pass
+
+    assert all_widgets.call_count == 2
+    assert _dag.setUpdatesEnabled.call_args_list == [
+        mocker.call(False), mocker.call(True)
+    ]
+
+
+def test_node_snapshot(mocker, fake_nuke_session, temporary_directory):
+    """Nodes are restored from memory leaving the selection untouched."""
+    import arcade_nuke.utility
+
+    mocker.patch.object(
+        arcade_nuke.utility.tempfile, "tempdir", temporary_directory
+    )
+
+    nodes = [
+        fake_nuke_session.nodes.Dot(name="dot{}".format(index), xpos=index)
+        for index in range(3)
+    ]
+    selected = fake_nuke_session.nodes.Dot(name="selected", selected=True)
+
+    snapshot = arcade_nuke.utility.NodeSnapshot.capture(nodes[:2])
+    assert os.listdir(temporary_directory) == []
+    assert fake_nuke_session.selectedNodes() == [selected]
+
+    for node in nodes[:2]:
+        fake_nuke_session.delete(node)
+
+    snapshot.restore()
+    assert os.listdir(temporary_directory) == []
+    assert fake_nuke_session.selectedNodes() == [selected]
+    assert [
+        (node.name(), node.xpos())
+        for node in fake_nuke_session.allNodes("Dot")
+    ] == [("dot2", 2), ("selected", 0), ("dot0", 0), ("dot1", 1)]
+
+    # Temporary file is removed even if the paste fails.
+    mocker.patch.object(
+        fake_nuke_session, "nodePaste", side_effect=RuntimeError()
+    )
+
+    with pytest.raises(RuntimeError):
+        snapshot.restore()
+
+    assert os.listdir(temporary_directory) == []
+    assert fake_nuke_session.selectedNodes() == [selected]